@@ -0,0 +1,185 @@
+"""base schema
+
+Revision ID: 0000
+Revises:
+Create Date: 2026-10-15 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects.postgresql import UUID
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0000"
+down_revision: Union[str, Sequence[str], None] = None
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Enum types as the original create_all made them: class-based enums are named
+# after the class and labelled with member names; later revisions rename them
+ENUMS = {
+    "usertier": ("FREE", "PRO"),
+    "team_tier": ("free", "pro"),
+    "teammemberrole": ("OWNER", "COACH", "ANALYST", "PLAYER"),
+    "matchsource": ("MANUAL", "MLBB_ACADEMY", "SCRAPED"),
+    "matchtype": ("RANKED", "TOURNAMENT", "SCRIM", "CUSTOM"),
+    "matchresult": ("WIN", "LOSS"),
+    "pickban_source": ("manual", "scraped"),
+    "draftphase": ("FIRST_BAN", "SECOND_BAN", "FIRST_PICK", "SECOND_PICK"),
+    "pickbanaction": ("PICK", "BAN"),
+    "draftside": ("BLUE", "RED"),
+    "plantype": ("DAILY", "WEEKLY"),
+    "plan_generator": ("ai", "manual"),
+    "llm_provider_enum": ("claude", "gemini"),
+}
+
+
+def _enum(name: str) -> sa.Enum:
+    return sa.Enum(*ENUMS[name], name=name)
+
+
+def _id() -> sa.Column:
+    return sa.Column("id", UUID(as_uuid=True), primary_key=True)
+
+
+def _timestamps() -> list:
+    return [
+        sa.Column("created_at", sa.DateTime(), nullable=False),
+        sa.Column("updated_at", sa.DateTime(), nullable=True),
+    ]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Databases built by the app's create_all already have this schema (and
+    # the later revisions); mark them with `alembic stamp head` instead
+    op.create_table(
+        "users",
+        _id(),
+        *_timestamps(),
+        sa.Column("email", sa.String(), nullable=False),
+        sa.Column("username", sa.String(), nullable=False),
+        sa.Column("hashed_password", sa.String(), nullable=False),
+        sa.Column("tier", _enum("usertier"), nullable=False),
+        sa.Column("mlbb_game_id", sa.String(), nullable=True),
+        sa.Column("mlbb_server_id", sa.String(), nullable=True),
+        sa.Column("language", sa.String(), nullable=True),
+    )
+    op.create_index("ix_users_email", "users", ["email"], unique=True)
+    op.create_index("ix_users_username", "users", ["username"], unique=True)
+
+    op.create_table(
+        "teams",
+        _id(),
+        *_timestamps(),
+        sa.Column("name", sa.String(), nullable=False),
+        sa.Column("owner_id", UUID(as_uuid=True), sa.ForeignKey("users.id"), nullable=False),
+        sa.Column("tier", _enum("team_tier"), nullable=True),
+        sa.Column("region", sa.String(), nullable=True),
+    )
+
+    op.create_table(
+        "team_members",
+        sa.Column("team_id", UUID(as_uuid=True), sa.ForeignKey("teams.id"), primary_key=True),
+        sa.Column("user_id", UUID(as_uuid=True), sa.ForeignKey("users.id"), primary_key=True),
+        sa.Column("role", _enum("teammemberrole"), nullable=True),
+        sa.Column("joined_at", sa.DateTime(), nullable=True),
+    )
+
+    op.create_table(
+        "matches",
+        _id(),
+        *_timestamps(),
+        sa.Column("user_id", UUID(as_uuid=True), sa.ForeignKey("users.id"), nullable=False),
+        sa.Column("team_id", UUID(as_uuid=True), sa.ForeignKey("teams.id"), nullable=True),
+        sa.Column("source", _enum("matchsource"), nullable=False),
+        sa.Column("match_type", _enum("matchtype"), nullable=False),
+        sa.Column("result", _enum("matchresult"), nullable=False),
+        sa.Column("duration_seconds", sa.Integer(), nullable=True),
+        sa.Column("hero_played", sa.String(), nullable=False),
+        sa.Column("role_played", sa.String(), nullable=True),
+        sa.Column("kills", sa.Integer(), nullable=True),
+        sa.Column("deaths", sa.Integer(), nullable=True),
+        sa.Column("assists", sa.Integer(), nullable=True),
+        sa.Column("gold_earned", sa.Integer(), nullable=True),
+        sa.Column("damage_dealt", sa.Integer(), nullable=True),
+        sa.Column("match_date", sa.DateTime(), nullable=True),
+        sa.Column("opponent_team_name", sa.String(), nullable=True),
+        sa.Column("notes", sa.Text(), nullable=True),
+        sa.Column("raw_data", sa.JSON(), nullable=True),
+    )
+
+    op.create_table(
+        "pick_ban_records",
+        _id(),
+        *_timestamps(),
+        sa.Column("team_id", UUID(as_uuid=True), sa.ForeignKey("teams.id"), nullable=False),
+        sa.Column("opponent_team_name", sa.String(), nullable=False),
+        sa.Column("tournament_name", sa.String(), nullable=True),
+        sa.Column("match_date", sa.DateTime(), nullable=True),
+        sa.Column("source", _enum("pickban_source"), nullable=True),
+        sa.Column("phase", _enum("draftphase"), nullable=False),
+        sa.Column("hero_name", sa.String(), nullable=False),
+        sa.Column("action", _enum("pickbanaction"), nullable=False),
+        sa.Column("side", _enum("draftside"), nullable=False),
+    )
+
+    op.create_table(
+        "coaching_plans",
+        _id(),
+        *_timestamps(),
+        sa.Column("user_id", UUID(as_uuid=True), sa.ForeignKey("users.id"), nullable=False),
+        sa.Column("plan_type", _enum("plantype"), nullable=False),
+        sa.Column("focus_areas", sa.JSON(), nullable=True),
+        sa.Column("tasks", sa.JSON(), nullable=True),
+        sa.Column("generated_by", _enum("plan_generator"), nullable=True),
+        sa.Column("valid_from", sa.Date(), nullable=False),
+        sa.Column("valid_until", sa.Date(), nullable=False),
+    )
+
+    op.create_table(
+        "player_stats_snapshots",
+        _id(),
+        *_timestamps(),
+        sa.Column("user_id", UUID(as_uuid=True), sa.ForeignKey("users.id"), nullable=False),
+        sa.Column("rank_tier", sa.String(), nullable=True),
+        sa.Column("rank_stars", sa.Integer(), nullable=True),
+        sa.Column("win_rate", sa.Float(), nullable=True),
+        sa.Column("top_heroes", sa.JSON(), nullable=True),
+        sa.Column("weaknesses_detected", sa.JSON(), nullable=True),
+        sa.Column("snapshot_date", sa.Date(), nullable=False),
+    )
+
+    op.create_table(
+        "scouting_reports",
+        _id(),
+        *_timestamps(),
+        sa.Column("team_id", UUID(as_uuid=True), sa.ForeignKey("teams.id"), nullable=False),
+        sa.Column("opponent_team_name", sa.String(), nullable=False),
+        sa.Column("generated_by_llm", _enum("llm_provider_enum"), nullable=False),
+        sa.Column("report_content", sa.Text(), nullable=False),
+        sa.Column("pick_ban_summary", sa.JSON(), nullable=True),
+        sa.Column("key_players", sa.JSON(), nullable=True),
+        sa.Column("recommended_strategy", sa.Text(), nullable=True),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for table in (
+        "scouting_reports",
+        "player_stats_snapshots",
+        "coaching_plans",
+        "pick_ban_records",
+        "matches",
+        "team_members",
+        "teams",
+        "users",
+    ):
+        op.drop_table(table)
+    if op.get_bind().dialect.name == "postgresql":
+        for name in ENUMS:
+            op.execute(f"DROP TYPE IF EXISTS {name}")
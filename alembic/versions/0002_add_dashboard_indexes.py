@@ -0,0 +1,44 @@
+"""add dashboard indexes
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-15 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0002"
+down_revision: Union[str, Sequence[str], None] = "0001"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index("ix_matches_user_date", "matches", ["user_id", sa.text("match_date DESC")])
+    op.create_index("ix_matches_team_date", "matches", ["team_id", "match_date"])
+    op.create_index("ix_pick_bans_team_date", "pick_ban_records", ["team_id", "match_date"])
+    op.create_index(
+        "ix_coaching_plans_user_validity",
+        "coaching_plans",
+        ["user_id", "valid_from", "valid_until"],
+    )
+    op.create_index(
+        "ix_snap_user_date",
+        "player_stats_snapshots",
+        ["user_id", sa.text("snapshot_date DESC")],
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_snap_user_date", table_name="player_stats_snapshots")
+    op.drop_index("ix_coaching_plans_user_validity", table_name="coaching_plans")
+    op.drop_index("ix_pick_bans_team_date", table_name="pick_ban_records")
+    op.drop_index("ix_matches_team_date", table_name="matches")
+    op.drop_index("ix_matches_user_date", table_name="matches")
@@ -0,0 +1,43 @@
+"""json columns to jsonb
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-15 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0003"
+down_revision: Union[str, Sequence[str], None] = "0002"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+JSON_COLUMNS = [
+    ("coaching_plans", "focus_areas"),
+    ("coaching_plans", "tasks"),
+    ("player_stats_snapshots", "top_heroes"),
+    ("player_stats_snapshots", "weaknesses_detected"),
+    ("matches", "raw_data"),
+    ("scouting_reports", "pick_ban_summary"),
+    ("scouting_reports", "key_players"),
+]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    if op.get_bind().dialect.name != "postgresql":
+        return
+    for table, column in JSON_COLUMNS:
+        op.execute(f"ALTER TABLE {table} ALTER COLUMN {column} TYPE JSONB USING {column}::jsonb")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    if op.get_bind().dialect.name != "postgresql":
+        return
+    for table, column in JSON_COLUMNS:
+        op.execute(f"ALTER TABLE {table} ALTER COLUMN {column} TYPE JSON USING {column}::json")
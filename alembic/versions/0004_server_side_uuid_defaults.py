@@ -0,0 +1,43 @@
+"""server side uuid defaults
+
+Revision ID: 0004
+Revises: 0003
+Create Date: 2026-10-15 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0004"
+down_revision: Union[str, Sequence[str], None] = "0003"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+UUID_TABLES = [
+    "users",
+    "teams",
+    "matches",
+    "pick_ban_records",
+    "coaching_plans",
+    "player_stats_snapshots",
+    "scouting_reports",
+]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    if op.get_bind().dialect.name != "postgresql":
+        return
+    for table in UUID_TABLES:
+        op.execute(f"ALTER TABLE {table} ALTER COLUMN id SET DEFAULT gen_random_uuid()")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    if op.get_bind().dialect.name != "postgresql":
+        return
+    for table in UUID_TABLES:
+        op.execute(f"ALTER TABLE {table} ALTER COLUMN id DROP DEFAULT")
@@ -0,0 +1,56 @@
+"""server side timestamps
+
+Revision ID: 0005
+Revises: 0004
+Create Date: 2026-10-15 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0005"
+down_revision: Union[str, Sequence[str], None] = "0004"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+TIMESTAMP_COLUMNS = [
+    (table, column)
+    for table in (
+        "users",
+        "teams",
+        "matches",
+        "pick_ban_records",
+        "coaching_plans",
+        "player_stats_snapshots",
+        "scouting_reports",
+    )
+    for column in ("created_at", "updated_at")
+] + [("team_members", "joined_at")]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    if op.get_bind().dialect.name != "postgresql":
+        return
+    for table, column in TIMESTAMP_COLUMNS:
+        # Existing values were written with datetime.utcnow(), so read them as UTC
+        op.execute(
+            f"ALTER TABLE {table} ALTER COLUMN {column} TYPE TIMESTAMPTZ "
+            f"USING {column} AT TIME ZONE 'UTC'"
+        )
+        op.execute(f"ALTER TABLE {table} ALTER COLUMN {column} SET DEFAULT now()")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    if op.get_bind().dialect.name != "postgresql":
+        return
+    for table, column in TIMESTAMP_COLUMNS:
+        op.execute(f"ALTER TABLE {table} ALTER COLUMN {column} DROP DEFAULT")
+        op.execute(
+            f"ALTER TABLE {table} ALTER COLUMN {column} TYPE TIMESTAMP "
+            f"USING {column} AT TIME ZONE 'UTC'"
+        )
@@ -0,0 +1,69 @@
+"""enum values and type names
+
+Revision ID: 0006
+Revises: 0005
+Create Date: 2026-10-15 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0006"
+down_revision: Union[str, Sequence[str], None] = "0005"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (old type, new type, columns, (old label, new label) pairs): columns now go
+# through pg_enum(), which stores member values in explicitly named types
+ENUM_CHANGES = [
+    ("usertier", "user_tier", [("users", "tier")],
+     [("FREE", "free"), ("PRO", "pro")]),
+    ("teammemberrole", "team_member_role", [("team_members", "role")],
+     [("OWNER", "owner"), ("COACH", "coach"), ("ANALYST", "analyst"), ("PLAYER", "player")]),
+    ("matchsource", "match_source", [("matches", "source")],
+     [("MANUAL", "manual"), ("MLBB_ACADEMY", "mlbb_academy"), ("SCRAPED", "scraped")]),
+    ("matchtype", "match_type", [("matches", "match_type")],
+     [("RANKED", "ranked"), ("TOURNAMENT", "tournament"), ("SCRIM", "scrim"), ("CUSTOM", "custom")]),
+    ("matchresult", "match_result", [("matches", "result")],
+     [("WIN", "win"), ("LOSS", "loss")]),
+    ("draftphase", "draft_phase", [("pick_ban_records", "phase")],
+     [("FIRST_BAN", "first_ban"), ("SECOND_BAN", "second_ban"),
+      ("FIRST_PICK", "first_pick"), ("SECOND_PICK", "second_pick")]),
+    ("pickbanaction", "pickban_action", [("pick_ban_records", "action")],
+     [("PICK", "pick"), ("BAN", "ban")]),
+    ("draftside", "draft_side", [("pick_ban_records", "side")],
+     [("BLUE", "blue"), ("RED", "red")]),
+    ("plantype", "plan_type", [("coaching_plans", "plan_type")],
+     [("DAILY", "daily"), ("WEEKLY", "weekly")]),
+]
+
+
+def _migrate(reverse: bool) -> None:
+    postgres = op.get_bind().dialect.name == "postgresql"
+    for old_type, new_type, columns, labels in ENUM_CHANGES:
+        if reverse:
+            old_type, new_type = new_type, old_type
+            labels = [(new, old) for old, new in labels]
+        if postgres:
+            # Renaming the type and its labels rewrites no rows
+            op.execute(f"ALTER TYPE {old_type} RENAME TO {new_type}")
+            for old, new in labels:
+                op.execute(f"ALTER TYPE {new_type} RENAME VALUE '{old}' TO '{new}'")
+        else:
+            # Non-native enums are plain strings
+            for table, column in columns:
+                for old, new in labels:
+                    op.execute(f"UPDATE {table} SET {column} = '{new}' WHERE {column} = '{old}'")
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    _migrate(reverse=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    _migrate(reverse=True)
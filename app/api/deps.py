@@ -1,16 +1,20 @@
 """Shared API dependencies (auth, DB session)."""
 
 import uuid as uuid_module
+from functools import lru_cache
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import bindparam, select
 from app.core.database import get_db
 from app.core.security import decode_access_token
 from app.models.db.user import User
 
 security = HTTPBearer()
 
+# Built once so every request reuses the same cached compiled statement
+USER_BY_ID = select(User).where(User.id == bindparam("user_id"))
+
 
 async def get_current_user(
     credentials: HTTPAuthorizationCredentials = Depends(security),
@@ -30,9 +34,16 @@ async def get_current_user(
     except (ValueError, AttributeError):
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid token payload")
 
-    result = await db.execute(select(User).where(User.id == user_uuid))
+    result = await db.execute(USER_BY_ID, {"user_id": user_uuid})
     user = result.scalar_one_or_none()
     if user is None:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="User not found")
 
     return user
+
+
+@lru_cache()
+def get_llm_factory():
+    """Import the LLM factory on first use so provider SDKs only load when needed."""
+    from app.services.llm.provider import LLMFactory
+    return LLMFactory
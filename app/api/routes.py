@@ -9,8 +9,8 @@ from app.models.schemas import (
     BuildRequest, BuildRecommendation, HeroQueryRequest, Hero,
     HealthResponse, LLMProvider
 )
-from app.services.langgraph.coaching_graph import MLBBCoachingGraph, _extract_text
-from app.services.rag.retriever import HeroRetriever, BuildRetriever
+from app.services.langgraph.coaching_graph import get_coaching_graph, _extract_text
+from app.services.rag.retriever import get_build_retriever, get_hero_retriever
 from app.services.llm.provider import LLMFactory
 from app.core.config import get_settings
 
@@ -18,10 +18,6 @@ logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
-# In-memory session storage (replace with Redis in production)
-sessions = {}
-
-
 def _check_provider_available(llm_provider: Optional[LLMProvider] = None):
     """Validate that the requested LLM provider is available before processing."""
     available = LLMFactory.list_available_providers()
@@ -77,28 +73,20 @@ async def chat(request: ChatRequest):
     _check_provider_available(request.llm_provider)
 
     try:
-        # Get or create session
+        # A new id lets the client start a thread; this turn itself is not kept
         session_id = request.session_id or str(uuid.uuid4())
 
-        if session_id not in sessions:
-            sessions[session_id] = []
-
-        conversation_history = sessions[session_id]
-
-        # Initialize coaching graph
-        graph = MLBBCoachingGraph(llm_provider=request.llm_provider)
+        # Shared coaching graph for this provider
+        graph = get_coaching_graph(request.llm_provider)
 
         # Process message
-        result = graph.process_message(
+        result = await graph.process_message(
             user_message=request.message,
-            conversation_history=conversation_history,
+            session_id=request.session_id,
             llm_provider=request.llm_provider,
             language=getattr(request, 'language', None),
         )
 
-        # Update session
-        sessions[session_id] = conversation_history
-
         # Generate suggestions based on intent
         suggestions = generate_suggestions(result["intent"])
 
@@ -137,7 +125,7 @@ async def analyze_matchup(request: MatchupRequest):
     _check_provider_available(request.llm_provider)
 
     try:
-        hero_retriever = HeroRetriever(llm_provider=request.llm_provider)
+        hero_retriever = get_hero_retriever(request.llm_provider)
 
         # Retrieve matchup information
         matchup_docs = hero_retriever.retrieve_matchup_info(
@@ -202,7 +190,7 @@ async def recommend_build(request: BuildRequest):
     _check_provider_available(request.llm_provider)
 
     try:
-        build_retriever = BuildRetriever(llm_provider=request.llm_provider)
+        build_retriever = get_build_retriever(request.llm_provider)
 
         # Retrieve build information
         build_docs = build_retriever.retrieve_build_info(
@@ -1,6 +1,6 @@
 from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import bindparam, select
 from app.core.database import get_db
 from app.core.security import get_password_hash, verify_password, create_access_token
 from app.models.db.user import User
@@ -9,16 +9,19 @@ from app.api.deps import get_current_user
 
 router = APIRouter(prefix="/auth", tags=["auth"])
 
+USER_BY_EMAIL = select(User).where(User.email == bindparam("email"))
+USER_BY_USERNAME = select(User).where(User.username == bindparam("username"))
+
 
 @router.post("/register", response_model=TokenResponse, status_code=status.HTTP_201_CREATED)
 async def register(request: RegisterRequest, db: AsyncSession = Depends(get_db)):
     # Check email uniqueness
-    result = await db.execute(select(User).where(User.email == request.email))
+    result = await db.execute(USER_BY_EMAIL, {"email": request.email})
     if result.scalar_one_or_none():
         raise HTTPException(status_code=400, detail="Email already registered")
 
     # Check username uniqueness
-    result = await db.execute(select(User).where(User.username == request.username))
+    result = await db.execute(USER_BY_USERNAME, {"username": request.username})
     if result.scalar_one_or_none():
         raise HTTPException(status_code=400, detail="Username already taken")
 
@@ -38,7 +41,7 @@ async def register(request: RegisterRequest, db: AsyncSession = Depends(get_db))
 
 @router.post("/login", response_model=TokenResponse)
 async def login(request: LoginRequest, db: AsyncSession = Depends(get_db)):
-    result = await db.execute(select(User).where(User.email == request.email))
+    result = await db.execute(USER_BY_EMAIL, {"email": request.email})
     user = result.scalar_one_or_none()
 
     if not user or not verify_password(request.password, user.hashed_password):
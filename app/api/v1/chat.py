@@ -1,23 +1,20 @@
 from fastapi import APIRouter, Depends, HTTPException
+from fastapi.responses import StreamingResponse
 from typing import Optional
 import uuid
 import logging
+import orjson
 
-from app.api.deps import get_current_user
+from app.api.deps import get_current_user, get_llm_factory
 from app.models.db.user import User
 from app.models.schemas.chat import ChatRequest, ChatResponse, LLMProvider
-from app.services.langgraph.coaching_graph import MLBBCoachingGraph, _extract_text
-from app.services.llm.provider import LLMFactory
+from app.utils.streaming import coalesce
 
 logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/chat", tags=["chat"])
 
-# In-memory sessions (migrate to Redis later)
-sessions = {}
-
-
-def _check_provider(llm_provider: Optional[LLMProvider] = None):
-    available = LLMFactory.list_available_providers()
+def _check_provider(llm_factory, llm_provider: Optional[LLMProvider] = None):
+    available = llm_factory.list_available_providers()
     if not available:
         raise HTTPException(status_code=503, detail="No LLM providers configured.")
     if llm_provider and llm_provider not in available:
@@ -31,22 +28,23 @@ def _check_provider(llm_provider: Optional[LLMProvider] = None):
 async def chat(
     request: ChatRequest,
     current_user: User = Depends(get_current_user),
+    llm_factory=Depends(get_llm_factory),
 ):
-    _check_provider(request.llm_provider)
+    _check_provider(llm_factory, request.llm_provider)
 
     try:
+        from app.services.langgraph.coaching_graph import get_coaching_graph
+
+        # A new id lets the client start a thread; this turn itself is not kept
         session_id = request.session_id or str(uuid.uuid4())
-        if session_id not in sessions:
-            sessions[session_id] = []
 
-        graph = MLBBCoachingGraph(llm_provider=request.llm_provider)
-        result = graph.process_message(
+        graph = get_coaching_graph(request.llm_provider)
+        result = await graph.process_message(
             user_message=request.message,
-            conversation_history=sessions[session_id],
+            session_id=request.session_id,
             llm_provider=request.llm_provider,
             language=current_user.language,
         )
-        sessions[session_id] = sessions.get(session_id, [])
 
         return ChatResponse(
             response=result["response"],
@@ -61,6 +59,45 @@ async def chat(
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@router.post("/stream")
+async def chat_stream(
+    request: ChatRequest,
+    current_user: User = Depends(get_current_user),
+    llm_factory=Depends(get_llm_factory),
+):
+    """Stream the coaching response as Server-Sent Events."""
+    _check_provider(llm_factory, request.llm_provider)
+
+    from app.services.langgraph.coaching_graph import get_coaching_graph
+
+    # A new id lets the client start a thread; this turn itself is not kept
+    session_id = request.session_id or str(uuid.uuid4())
+
+    graph = get_coaching_graph(request.llm_provider)
+    tokens = graph.stream_message(
+        user_message=request.message,
+        session_id=request.session_id,
+        llm_provider=request.llm_provider,
+        language=current_user.language,
+    )
+
+    async def events():
+        try:
+            async for text in coalesce(tokens):
+                yield b"data: " + orjson.dumps({"text": text}) + b"\n\n"
+        except Exception as e:
+            logger.error(f"Chat stream error: {e}")
+            yield b"event: error\ndata: " + orjson.dumps({"detail": str(e)}) + b"\n\n"
+            return
+        yield b"event: done\ndata: " + orjson.dumps({"session_id": session_id}) + b"\n\n"
+
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
 def _suggestions(intent: str):
     m = {
         "hero_info": ["What items should I build?", "How do I play this matchup?"],
@@ -1,6 +1,6 @@
 from pydantic_settings import BaseSettings
 from typing import Optional, List
-from functools import lru_cache
+from functools import cached_property, lru_cache
 
 
 class Settings(BaseSettings):
@@ -12,6 +12,7 @@ class Settings(BaseSettings):
     DEBUG: bool = True
     API_HOST: str = "0.0.0.0"
     API_PORT: int = 8000
+    WORKERS: int = 1
 
     # LLM API Keys
     ANTHROPIC_API_KEY: Optional[str] = None
@@ -24,6 +25,15 @@ class Settings(BaseSettings):
     ANTHROPIC_MODEL: str = "claude-3-5-sonnet-20241022"
     GEMINI_MODEL: str = "gemini-1.5-pro"
 
+    # Smaller models for classification and summarization
+    ANTHROPIC_FAST_MODEL: str = "claude-haiku-4-5"
+    GEMINI_FAST_MODEL: str = "gemini-2.5-flash-lite"
+
+    # Explicit Gemini context caches for the coaching system prompt (prompts
+    # must reach Gemini's minimum cacheable size, so off by default)
+    GEMINI_EXPLICIT_CACHE: bool = False
+    GEMINI_CACHE_TTL_SECONDS: int = 3600
+
     # Temperature settings for different use cases
     TEMPERATURE_CHAT: float = 0.7
     TEMPERATURE_ANALYSIS: float = 0.3
@@ -37,15 +47,25 @@ class Settings(BaseSettings):
     # Vector Embedding
     EMBEDDING_MODEL: str = "all-MiniLM-L6-v2"
     EMBEDDING_DIMENSION: int = 384
+    # e.g. "cuda:1" or "cpu"; unset picks CUDA, then MPS, then CPU
+    EMBEDDING_DEVICE: Optional[str] = None
+    EMBEDDING_BATCH_SIZE: int = 64
+    EMBEDDING_CACHE_SIZE: int = 4096
 
     # Redis Configuration
     REDIS_HOST: str = "localhost"
     REDIS_PORT: int = 6379
     REDIS_DB: int = 0
     REDIS_PASSWORD: Optional[str] = None
+    # "memory" (per process) or "redis" (shared by all workers) for GMS responses
+    META_CACHE_BACKEND: str = "memory"
 
     # PostgreSQL Configuration
     DATABASE_URL: Optional[str] = None
+    DB_POOL_SIZE: int = 20
+    DB_MAX_OVERFLOW: int = 10
+    DB_POOL_RECYCLE: int = 1800
+    DB_QUERY_CACHE_SIZE: int = 1200
 
     # Security
     SECRET_KEY: str = "change-this-in-production"
@@ -54,10 +74,14 @@ class Settings(BaseSettings):
     # CORS
     ALLOWED_ORIGINS: str = "http://localhost:3000,http://localhost:8000"
 
-    @property
+    @cached_property
     def allowed_origins_list(self) -> List[str]:
         return [origin.strip() for origin in self.ALLOWED_ORIGINS.split(",")]
 
+    @cached_property
+    def allowed_origins_bytes(self) -> List[bytes]:
+        return [origin.encode("latin-1") for origin in self.allowed_origins_list]
+
     # Moonton GMS API (MLBB Academy data)
     MOONTON_GMS_BASE_URL: str = "https://api.gms.moontontech.com"
 
@@ -67,9 +91,20 @@ class Settings(BaseSettings):
     # RAG Configuration
     RAG_TOP_K: int = 5
     RAG_SCORE_THRESHOLD: float = 0.7
+    # Exact-match cache of vector search results
+    SEARCH_CACHE_TTL_SECONDS: int = 3600
+    SEARCH_CACHE_SIZE: int = 1024
+
+    # Semantic response cache (cosine similarity on normalized query embeddings)
+    SEMANTIC_CACHE_ENABLED: bool = True
+    SEMANTIC_CACHE_THRESHOLD: float = 0.92
+    SEMANTIC_CACHE_SIZE: int = 1000
 
     # Conversation
     MAX_CONVERSATION_HISTORY: int = 10
+    # Graph checkpoints (per-process): threads kept and idle lifetime
+    CHECKPOINT_MAX_THREADS: int = 10000
+    CHECKPOINT_TTL_SECONDS: int = 86400
 
     class Config:
         env_file = ".env"
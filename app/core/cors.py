@@ -0,0 +1,93 @@
+"""Pure-ASGI CORS middleware with a preflight fast path."""
+
+from typing import Iterable, List, Tuple
+
+ALLOWED_METHODS = b"DELETE, GET, HEAD, OPTIONS, PATCH, POST, PUT"
+MAX_AGE = b"600"
+
+
+class FastCORS:
+    """
+    CORS middleware that answers preflight requests before routing.
+
+    Preflight OPTIONS requests from an allowed origin get a 204 with
+    precomputed headers and never reach the router. Other requests from an
+    allowed origin get the allow-origin/credentials headers appended to the
+    response start message.
+    """
+
+    def __init__(self, app, origins: Iterable[bytes]):
+        self.app = app
+        self._origins = frozenset(origins)
+        self._allow_all = b"*" in self._origins
+        self._preflight_headers: List[Tuple[bytes, bytes]] = [
+            (b"access-control-allow-methods", ALLOWED_METHODS),
+            (b"access-control-allow-credentials", b"true"),
+            (b"access-control-max-age", MAX_AGE),
+            (b"vary", b"Origin"),
+        ]
+        self._simple_headers: List[Tuple[bytes, bytes]] = [
+            (b"access-control-allow-credentials", b"true"),
+            (b"vary", b"Origin"),
+        ]
+
+    def _is_allowed(self, origin: bytes) -> bool:
+        return self._allow_all or origin in self._origins
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        origin = None
+        request_method = None
+        request_headers = None
+        for name, value in scope["headers"]:
+            if name == b"origin":
+                origin = value
+            elif name == b"access-control-request-method":
+                request_method = value
+            elif name == b"access-control-request-headers":
+                request_headers = value
+
+        if origin is None:
+            await self.app(scope, receive, send)
+            return
+
+        if scope["method"] == "OPTIONS" and request_method is not None:
+            await self._preflight(origin, request_headers, send)
+            return
+
+        if not self._is_allowed(origin):
+            await self.app(scope, receive, send)
+            return
+
+        extra_headers = [(b"access-control-allow-origin", origin), *self._simple_headers]
+
+        async def send_with_cors(message):
+            if message["type"] == "http.response.start":
+                message["headers"] = [*message.get("headers", []), *extra_headers]
+            await send(message)
+
+        await self.app(scope, receive, send_with_cors)
+
+    async def _preflight(self, origin: bytes, request_headers, send):
+        if not self._is_allowed(origin):
+            body = b"Disallowed CORS origin"
+            await send({
+                "type": "http.response.start",
+                "status": 400,
+                "headers": [
+                    (b"content-type", b"text/plain; charset=utf-8"),
+                    (b"content-length", str(len(body)).encode()),
+                ],
+            })
+            await send({"type": "http.response.body", "body": body})
+            return
+
+        headers = [(b"access-control-allow-origin", origin), *self._preflight_headers]
+        if request_headers:
+            headers.append((b"access-control-allow-headers", request_headers))
+
+        await send({"type": "http.response.start", "status": 204, "headers": headers})
+        await send({"type": "http.response.body", "body": b""})
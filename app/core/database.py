@@ -1,5 +1,7 @@
 """SQLAlchemy engine and session management."""
 
+import asyncio
+from sqlalchemy import text
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession, async_sessionmaker
 from sqlalchemy.orm import DeclarativeBase
 from app.core.config import get_settings
@@ -11,9 +13,21 @@ class Base(DeclarativeBase):
 
 settings = get_settings()
 
+database_url = settings.DATABASE_URL or "sqlite+aiosqlite:///./test.db"
+
+# Pool sizing only applies to server databases; SQLite picks its own pool class
+pool_kwargs = {} if database_url.startswith("sqlite") else {
+    "pool_size": settings.DB_POOL_SIZE,
+    "max_overflow": settings.DB_MAX_OVERFLOW,
+    "pool_pre_ping": True,
+    "pool_recycle": settings.DB_POOL_RECYCLE,
+}
+
 engine = create_async_engine(
-    settings.DATABASE_URL or "sqlite+aiosqlite:///./test.db",
+    database_url,
     echo=settings.DEBUG,
+    query_cache_size=settings.DB_QUERY_CACHE_SIZE,
+    **pool_kwargs,
 )
 
 async_session = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
@@ -25,3 +39,16 @@ async def get_db() -> AsyncSession:
             yield session
         finally:
             await session.close()
+
+
+async def warm_pool():
+    """Open pool_size connections up front so early requests skip the connect handshake."""
+    size = getattr(engine.pool, "size", None)
+    if size is None:
+        return
+
+    async def _warm():
+        async with engine.connect() as conn:
+            await conn.execute(text("SELECT 1"))
+
+    await asyncio.gather(*[_warm() for _ in range(size())])
@@ -0,0 +1,34 @@
+"""Process-wide logging setup."""
+
+import logging.config
+from app.core.config import Settings
+
+
+def configure_logging(settings: Settings):
+    """Configure root logging; noisy third-party loggers are quieter in production."""
+    noisy_level = "WARNING" if settings.ENVIRONMENT == "production" else settings.LOG_LEVEL
+
+    logging.config.dictConfig({
+        "version": 1,
+        "disable_existing_loggers": False,
+        "formatters": {
+            "default": {
+                "format": "%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+                "style": "%",
+            },
+        },
+        "handlers": {
+            "console": {
+                "class": "logging.StreamHandler",
+                "formatter": "default",
+            },
+        },
+        "root": {
+            "level": settings.LOG_LEVEL,
+            "handlers": ["console"],
+        },
+        "loggers": {
+            "uvicorn.access": {"level": noisy_level, "propagate": False, "handlers": ["console"]},
+            "sqlalchemy.engine": {"level": noisy_level, "propagate": False, "handlers": ["console"]},
+        },
+    })
@@ -1,108 +1,158 @@
 from fastapi import FastAPI
-from fastapi.middleware.cors import CORSMiddleware
-from app.core.config import get_settings
+from fastapi.responses import Response
+from app.core.config import Settings, get_settings
+from app.core.cors import FastCORS
+from app.core.logging_config import configure_logging
 from app.api.routes import router
+from app.api.deps import get_llm_factory
 from app.api.v1.auth import router as auth_router
 from app.api.v1.chat import router as chat_router
 from app.api.v1.heroes import router as heroes_router
 from app.api.v1.players import router as players_router
+from contextlib import asynccontextmanager
+from typing import Optional
+import asyncio
 import logging
-
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-)
+import orjson
 
 logger = logging.getLogger(__name__)
 
-# Get settings
-settings = get_settings()
-
-# Create FastAPI app
-app = FastAPI(
-    title=settings.APP_NAME,
-    description="AI-powered coaching system for Mobile Legends Bang Bang",
-    version="1.0.0",
-    debug=settings.DEBUG
-)
-
-# Configure CORS
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=settings.allowed_origins_list,
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
-)
-
-# Include routers
-app.include_router(router, tags=["coaching"])
-app.include_router(auth_router, prefix="/api/v1")
-app.include_router(chat_router, prefix="/api/v1")
-app.include_router(heroes_router, prefix="/api/v1")
-app.include_router(players_router, prefix="/api/v1")
-
-
-@app.on_event("startup")
-async def startup_event():
-    """Run on application startup."""
-    logger.info(f"Starting {settings.APP_NAME}")
-    logger.info(f"Environment: {settings.ENVIRONMENT}")
-    logger.info(f"Debug mode: {settings.DEBUG}")
+# (router, prefix, tags) — registered in order by create_app
+ROUTERS = [
+    (router, "", ["coaching"]),
+    (auth_router, "/api/v1", None),
+    (chat_router, "/api/v1", None),
+    (heroes_router, "/api/v1", None),
+    (players_router, "/api/v1", None),
+]
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Application startup and shutdown."""
+    settings: Settings = app.state.settings
+    configure_logging(settings)
 
     # Create database tables (for SQLite dev; production uses Alembic migrations)
-    from app.core.database import engine, Base
-    from sqlalchemy import text
-    import app.models.db  # noqa: F401 — registers all models with Base
-    async with engine.begin() as conn:
-        await conn.run_sync(Base.metadata.create_all)
-        # Add mlbb_username column if it doesn't exist (migration for existing DBs)
-        try:
-            await conn.execute(text(
-                "ALTER TABLE users ADD COLUMN mlbb_username VARCHAR"
-            ))
-            logger.info("Added mlbb_username column to users table")
-        except Exception:
-            pass  # Column already exists
-    logger.info("Database tables ready")
-
-    # Check LLM providers
-    from app.services.llm.provider import LLMFactory
-    available_providers = LLMFactory.list_available_providers()
-    logger.info(f"Available LLM providers: {[p.value for p in available_providers]}")
-
-    if not available_providers:
-        logger.warning("No LLM providers configured! Please set API keys in .env")
-
-    # Check vector store
-    if not settings.PINECONE_API_KEY:
-        logger.warning("Pinecone API key not configured!")
-
-
-@app.on_event("shutdown")
-async def shutdown_event():
-    """Run on application shutdown."""
+    if settings.ENVIRONMENT != "production":
+        from app.core.database import engine, Base
+        from sqlalchemy import inspect, text
+        import app.models.db  # noqa: F401 — registers all models with Base
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+            # Patch pre-existing dev DBs; production gets this column from Alembic
+            if settings.ENVIRONMENT == "development":
+                columns = await conn.run_sync(
+                    lambda sync_conn: {c["name"] for c in inspect(sync_conn).get_columns("users")}
+                )
+                if "mlbb_username" not in columns:
+                    await conn.execute(text(
+                        "ALTER TABLE users ADD COLUMN mlbb_username VARCHAR"
+                    ))
+
+    from app.core.database import engine, warm_pool
+    _, providers = await asyncio.gather(warm_pool(), _available_provider_names())
+
+    # One record for the whole startup; missing keys are reported by /health
+    startup_info = {
+        "app": settings.APP_NAME,
+        "env": settings.ENVIRONMENT,
+        "debug": settings.DEBUG,
+        "providers": providers,
+        "vector_store": settings.PINECONE_API_KEY is not None,
+    }
+    logger.info("startup %s", startup_info, extra=startup_info)
+
+    from app.services.mlbb_academy.meta_client import get_meta_client
+    get_meta_client().start_warmer()
+
+    yield
+
     logger.info(f"Shutting down {settings.APP_NAME}")
+    from app.services.mlbb_academy.validator import close_validation_client
+    await asyncio.gather(
+        get_meta_client().aclose(), close_validation_client(), engine.dispose()
+    )
+
+
+async def _available_provider_names() -> list:
+    """Names of the configured LLM providers; empty if the check itself fails."""
+    try:
+        return [p.value for p in get_llm_factory().list_available_providers()]
+    except Exception as e:
+        logger.warning(f"LLM provider check failed: {e}")
+        return []
+
+
+# Constant payload, encoded once — "/" doubles as a liveness probe
+ROOT_BODY = orjson.dumps({
+    "message": "Welcome to MLBB AI Coach API",
+    "version": "1.0.0",
+    "docs": "/docs",
+    "health": "/health"
+})
 
 
-@app.get("/")
 async def root():
     """Root endpoint."""
-    return {
-        "message": "Welcome to MLBB AI Coach API",
-        "version": "1.0.0",
-        "docs": "/docs",
-        "health": "/health"
-    }
+    return Response(content=ROOT_BODY, media_type="application/json")
+
+
+def create_app(settings: Optional[Settings] = None) -> FastAPI:
+    """
+    Build the FastAPI application.
+
+    Args:
+        settings: Settings to configure the app with. Defaults to get_settings().
+
+    Returns:
+        Configured FastAPI instance.
+    """
+    settings = settings or get_settings()
+
+    # No schema generation or docs pages in production
+    docs_kwargs = {}
+    if settings.ENVIRONMENT == "production":
+        docs_kwargs = {"openapi_url": None, "docs_url": None, "redoc_url": None}
+
+    app = FastAPI(
+        title=settings.APP_NAME,
+        description="AI-powered coaching system for Mobile Legends Bang Bang",
+        version="1.0.0",
+        debug=settings.DEBUG,
+        lifespan=lifespan,
+        **docs_kwargs,
+    )
+    app.state.settings = settings
+
+    # Configure CORS
+    app.add_middleware(FastCORS, origins=settings.allowed_origins_bytes)
+
+    for r, prefix, tags in ROUTERS:
+        app.include_router(r, prefix=prefix, tags=tags)
+
+    app.add_api_route("/", root, methods=["GET"])
+
+    return app
+
+
+app = create_app()
 
 
 if __name__ == "__main__":
     import uvicorn
 
+    settings = get_settings()
     uvicorn.run(
-        "app.main:app",
+        "app.main:create_app",
+        factory=True,
         host=settings.API_HOST,
         port=settings.API_PORT,
-        reload=settings.DEBUG
+        reload=settings.DEBUG,
+        loop="auto",  # uvloop when installed (not on Windows), else asyncio
+        http="httptools",
+        log_level="info",
+        workers=1 if settings.DEBUG else settings.WORKERS,
+        backlog=4096,
+        timeout_keep_alive=30,
     )
@@ -1,6 +1,6 @@
 from app.models.db.user import User, UserTier
-from app.models.db.team import Team, TeamMember, TeamMemberRole
+from app.models.db.team import Team, TeamMember, TeamMemberRole, TeamTier
 from app.models.db.match import Match, MatchSource, MatchType, MatchResult
-from app.models.db.pick_ban import PickBanRecord, PickBanAction, DraftPhase, DraftSide
-from app.models.db.coaching_plan import CoachingPlan, PlayerStatsSnapshot, PlanType
+from app.models.db.pick_ban import PickBanRecord, PickBanAction, PickBanSource, DraftPhase, DraftSide
+from app.models.db.coaching_plan import CoachingPlan, PlayerStatsSnapshot, PlanType, PlanGenerator
 from app.models.db.scouting_report import ScoutingReport
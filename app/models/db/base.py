@@ -1,14 +1,34 @@
 import uuid
-from datetime import datetime
-from sqlalchemy import Column, DateTime
-from sqlalchemy.dialects.postgresql import UUID
-from app.core.database import Base
+from sqlalchemy import Column, DateTime, Enum as SAEnum, JSON, func, text
+from sqlalchemy.dialects.postgresql import JSONB, UUID
+from app.core.database import Base, engine
+
+# Binary JSONB on Postgres, plain JSON elsewhere (SQLite dev/tests)
+JSONType = JSON().with_variant(JSONB(), "postgresql")
 
 
 class TimestampMixin:
-    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+
+
+# Postgres generates ids itself; SQLite has no UUID function so Python fills them in
+if engine.dialect.name == "postgresql":
+    _id_default = {"server_default": text("gen_random_uuid()")}
+else:
+    _id_default = {"default": uuid.uuid4}
 
 
 class UUIDMixin:
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, **_id_default)
+
+
+def pg_enum(enum_cls, name: str) -> SAEnum:
+    """Enum column type storing member values, native on Postgres, VARCHAR elsewhere."""
+    return SAEnum(
+        enum_cls,
+        name=name,
+        native_enum=True,
+        values_callable=lambda e: [m.value for m in e],
+        validate_strings=False,
+    )
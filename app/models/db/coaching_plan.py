@@ -1,7 +1,7 @@
-from sqlalchemy import Column, String, Float, Integer, ForeignKey, Enum as SAEnum, Date, JSON
+from sqlalchemy import Index, Column, String, Float, Integer, ForeignKey, Date
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
-from app.models.db.base import UUIDMixin, TimestampMixin
+from app.models.db.base import UUIDMixin, TimestampMixin, JSONType, pg_enum
 from app.core.database import Base
 import enum
 
@@ -11,17 +11,26 @@ class PlanType(str, enum.Enum):
     WEEKLY = "weekly"
 
 
+class PlanGenerator(str, enum.Enum):
+    AI = "ai"
+    MANUAL = "manual"
+
+
 class CoachingPlan(Base, UUIDMixin, TimestampMixin):
     __tablename__ = "coaching_plans"
 
     user_id = Column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=False)
-    plan_type = Column(SAEnum(PlanType), nullable=False)
-    focus_areas = Column(JSON, default=list)
-    tasks = Column(JSON, default=list)
-    generated_by = Column(SAEnum("ai", "manual", name="plan_generator"), default="ai")
+    plan_type = Column(pg_enum(PlanType, "plan_type"), nullable=False)
+    focus_areas = Column(JSONType, default=list)
+    tasks = Column(JSONType, default=list)
+    generated_by = Column(pg_enum(PlanGenerator, "plan_generator"), default=PlanGenerator.AI)
     valid_from = Column(Date, nullable=False)
     valid_until = Column(Date, nullable=False)
 
+    __table_args__ = (
+        Index("ix_coaching_plans_user_validity", "user_id", "valid_from", "valid_until"),
+    )
+
     user = relationship("User", back_populates="coaching_plans")
 
 
@@ -32,8 +41,12 @@ class PlayerStatsSnapshot(Base, UUIDMixin, TimestampMixin):
     rank_tier = Column(String, nullable=True)
     rank_stars = Column(Integer, nullable=True)
     win_rate = Column(Float, nullable=True)
-    top_heroes = Column(JSON, default=list)
-    weaknesses_detected = Column(JSON, default=list)
+    top_heroes = Column(JSONType, default=list)
+    weaknesses_detected = Column(JSONType, default=list)
     snapshot_date = Column(Date, nullable=False)
 
+    __table_args__ = (
+        Index("ix_snap_user_date", "user_id", snapshot_date.desc()),
+    )
+
     user = relationship("User", back_populates="stats_snapshots")
@@ -1,7 +1,7 @@
-from sqlalchemy import Column, String, Integer, Float, Text, ForeignKey, Enum as SAEnum, DateTime, JSON
+from sqlalchemy import Index, Column, String, Integer, Float, Text, ForeignKey, DateTime
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
-from app.models.db.base import UUIDMixin, TimestampMixin
+from app.models.db.base import UUIDMixin, TimestampMixin, JSONType, pg_enum
 from app.core.database import Base
 import enum
 
@@ -29,9 +29,9 @@ class Match(Base, UUIDMixin, TimestampMixin):
 
     user_id = Column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=False)
     team_id = Column(UUID(as_uuid=True), ForeignKey("teams.id"), nullable=True)
-    source = Column(SAEnum(MatchSource), nullable=False)
-    match_type = Column(SAEnum(MatchType), nullable=False)
-    result = Column(SAEnum(MatchResult), nullable=False)
+    source = Column(pg_enum(MatchSource, "match_source"), nullable=False)
+    match_type = Column(pg_enum(MatchType, "match_type"), nullable=False)
+    result = Column(pg_enum(MatchResult, "match_result"), nullable=False)
     duration_seconds = Column(Integer, nullable=True)
     hero_played = Column(String, nullable=False)
     role_played = Column(String, nullable=True)
@@ -43,7 +43,12 @@ class Match(Base, UUIDMixin, TimestampMixin):
     match_date = Column(DateTime, nullable=True)
     opponent_team_name = Column(String, nullable=True)
     notes = Column(Text, nullable=True)
-    raw_data = Column(JSON, nullable=True)
+    raw_data = Column(JSONType, nullable=True)
+
+    __table_args__ = (
+        Index("ix_matches_user_date", "user_id", match_date.desc()),
+        Index("ix_matches_team_date", "team_id", "match_date"),
+    )
 
     user = relationship("User", back_populates="matches")
     team = relationship("Team")
@@ -1,7 +1,7 @@
-from sqlalchemy import Column, String, ForeignKey, Enum as SAEnum, DateTime
+from sqlalchemy import Index, Column, String, ForeignKey, DateTime
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
-from app.models.db.base import UUIDMixin, TimestampMixin
+from app.models.db.base import UUIDMixin, TimestampMixin, pg_enum
 from app.core.database import Base
 import enum
 
@@ -23,6 +23,11 @@ class DraftSide(str, enum.Enum):
     RED = "red"
 
 
+class PickBanSource(str, enum.Enum):
+    MANUAL = "manual"
+    SCRAPED = "scraped"
+
+
 class PickBanRecord(Base, UUIDMixin, TimestampMixin):
     __tablename__ = "pick_ban_records"
 
@@ -30,10 +35,14 @@ class PickBanRecord(Base, UUIDMixin, TimestampMixin):
     opponent_team_name = Column(String, nullable=False)
     tournament_name = Column(String, nullable=True)
     match_date = Column(DateTime, nullable=True)
-    source = Column(SAEnum("manual", "scraped", name="pickban_source"), default="manual")
-    phase = Column(SAEnum(DraftPhase), nullable=False)
+    source = Column(pg_enum(PickBanSource, "pickban_source"), default=PickBanSource.MANUAL)
+    phase = Column(pg_enum(DraftPhase, "draft_phase"), nullable=False)
     hero_name = Column(String, nullable=False)
-    action = Column(SAEnum(PickBanAction), nullable=False)
-    side = Column(SAEnum(DraftSide), nullable=False)
+    action = Column(pg_enum(PickBanAction, "pickban_action"), nullable=False)
+    side = Column(pg_enum(DraftSide, "draft_side"), nullable=False)
+
+    __table_args__ = (
+        Index("ix_pick_bans_team_date", "team_id", "match_date"),
+    )
 
     team = relationship("Team", back_populates="pick_bans")
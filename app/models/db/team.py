@@ -1,9 +1,8 @@
-from sqlalchemy import Column, String, ForeignKey, Enum as SAEnum, DateTime
+from sqlalchemy import Column, String, ForeignKey, DateTime, func
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
-from app.models.db.base import UUIDMixin, TimestampMixin
+from app.models.db.base import UUIDMixin, TimestampMixin, pg_enum
 from app.core.database import Base
-from datetime import datetime
 import enum
 
 
@@ -14,12 +13,17 @@ class TeamMemberRole(str, enum.Enum):
     PLAYER = "player"
 
 
+class TeamTier(str, enum.Enum):
+    FREE = "free"
+    PRO = "pro"
+
+
 class Team(Base, UUIDMixin, TimestampMixin):
     __tablename__ = "teams"
 
     name = Column(String, nullable=False)
     owner_id = Column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=False)
-    tier = Column(SAEnum("free", "pro", name="team_tier"), default="free")
+    tier = Column(pg_enum(TeamTier, "team_tier"), default=TeamTier.FREE)
     region = Column(String, default="MM")
 
     owner = relationship("User", foreign_keys=[owner_id])
@@ -33,8 +37,8 @@ class TeamMember(Base):
 
     team_id = Column(UUID(as_uuid=True), ForeignKey("teams.id"), primary_key=True)
     user_id = Column(UUID(as_uuid=True), ForeignKey("users.id"), primary_key=True)
-    role = Column(SAEnum(TeamMemberRole), default=TeamMemberRole.PLAYER)
-    joined_at = Column(DateTime, default=datetime.utcnow)
+    role = Column(pg_enum(TeamMemberRole, "team_member_role"), default=TeamMemberRole.PLAYER)
+    joined_at = Column(DateTime(timezone=True), server_default=func.now())
 
     team = relationship("Team", back_populates="members")
     user = relationship("User", back_populates="teams")
@@ -1,6 +1,6 @@
-from sqlalchemy import Column, String, Enum as SAEnum
+from sqlalchemy import Column, String
 from sqlalchemy.orm import relationship
-from app.models.db.base import UUIDMixin, TimestampMixin
+from app.models.db.base import UUIDMixin, TimestampMixin, pg_enum
 from app.core.database import Base
 import enum
 
@@ -16,7 +16,7 @@ class User(Base, UUIDMixin, TimestampMixin):
     email = Column(String, unique=True, nullable=False, index=True)
     username = Column(String, unique=True, nullable=False, index=True)
     hashed_password = Column(String, nullable=False)
-    tier = Column(SAEnum(UserTier), default=UserTier.FREE, nullable=False)
+    tier = Column(pg_enum(UserTier, "user_tier"), default=UserTier.FREE, nullable=False)
     mlbb_game_id = Column(String, nullable=True)
     mlbb_server_id = Column(String, nullable=True)
     mlbb_username = Column(String, nullable=True)
@@ -1,6 +1,7 @@
 from pydantic import BaseModel, Field
 from typing import Optional
 from uuid import UUID
+from app.models.schemas.base import ResponseModel
 
 
 class RegisterRequest(BaseModel):
@@ -15,12 +16,12 @@ class LoginRequest(BaseModel):
     password: str
 
 
-class TokenResponse(BaseModel):
+class TokenResponse(ResponseModel):
     access_token: str
     token_type: str = "bearer"
 
 
-class UserResponse(BaseModel):
+class UserResponse(ResponseModel):
     id: UUID
     email: str
     username: str
@@ -29,6 +30,3 @@ class UserResponse(BaseModel):
     mlbb_server_id: Optional[str] = None
     mlbb_username: Optional[str] = None
     language: str
-
-    class Config:
-        from_attributes = True
@@ -0,0 +1,6 @@
+from pydantic import BaseModel, ConfigDict
+
+
+class ResponseModel(BaseModel):
+    """Base for API response models: immutable and buildable from ORM objects."""
+    model_config = ConfigDict(extra="ignore", frozen=True, from_attributes=True)
@@ -2,6 +2,7 @@ from pydantic import BaseModel, Field
 from typing import Optional, List, Dict, Any
 from datetime import datetime
 from enum import Enum
+from app.models.schemas.base import ResponseModel
 
 
 class LLMProvider(str, Enum):
@@ -25,7 +26,7 @@ class ChatRequest(BaseModel):
     context: Optional[Dict[str, Any]] = None
 
 
-class ChatResponse(BaseModel):
+class ChatResponse(ResponseModel):
     """Chat response to user."""
     response: str
     session_id: str
@@ -41,7 +42,7 @@ class MatchupRequest(BaseModel):
     llm_provider: Optional[LLMProvider] = None
 
 
-class MatchupAnalysis(BaseModel):
+class MatchupAnalysis(ResponseModel):
     """Matchup analysis response."""
     your_hero: str
     enemy_hero: str
@@ -68,7 +69,7 @@ class HeroQueryRequest(BaseModel):
     lane: Optional[str] = None
 
 
-class HealthResponse(BaseModel):
+class HealthResponse(ResponseModel):
     """Health check response."""
     status: str
     version: str
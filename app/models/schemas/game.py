@@ -1,6 +1,7 @@
 from pydantic import BaseModel
 from typing import Optional, List, Dict, Any
 from enum import Enum
+from app.models.schemas.base import ResponseModel
 
 
 class HeroRole(str, Enum):
@@ -49,7 +50,7 @@ class Item(BaseModel):
     good_for: List[str] = []
 
 
-class BuildRecommendation(BaseModel):
+class BuildRecommendation(ResponseModel):
     """Hero build recommendation."""
     hero_name: str
     role: HeroRole
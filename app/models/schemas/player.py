@@ -1,5 +1,6 @@
 from pydantic import BaseModel, Field
 from typing import Optional, List
+from app.models.schemas.base import ResponseModel
 
 
 class ValidateAccountRequest(BaseModel):
@@ -7,7 +8,7 @@ class ValidateAccountRequest(BaseModel):
     server_id: str = Field(..., description="MLBB Server/Zone ID")
 
 
-class ValidateAccountResponse(BaseModel):
+class ValidateAccountResponse(ResponseModel):
     valid: bool
     game_id: str
     server_id: str
@@ -22,7 +23,7 @@ class ConfirmLinkRequest(BaseModel):
     username: str = Field(..., description="Confirmed in-game username")
 
 
-class PlayerProfile(BaseModel):
+class PlayerProfile(ResponseModel):
     game_id: str
     server_id: str
     username: Optional[str] = None
@@ -32,11 +33,8 @@ class PlayerProfile(BaseModel):
     total_matches: Optional[int] = None
     top_heroes: Optional[List[dict]] = None
 
-    class Config:
-        from_attributes = True
 
-
-class SyncStatusResponse(BaseModel):
+class SyncStatusResponse(ResponseModel):
     status: str  # syncing, completed, failed
     matches_synced: int = 0
     last_sync: Optional[str] = None
@@ -0,0 +1,91 @@
+"""Bounded conversation checkpointer for the coaching graph."""
+
+from collections import OrderedDict
+from threading import Lock
+from typing import Iterable, Optional
+import time
+from langgraph.checkpoint.memory import InMemorySaver
+from app.core.config import get_settings
+
+
+class BoundedMemorySaver(InMemorySaver):
+    """
+    InMemorySaver that forgets idle threads.
+
+    A thread not written to for ttl_seconds is dropped, and once more than
+    max_threads are held the least recently used tenth is dropped in one
+    pass. History lives in this process only, so with several workers a
+    session needs sticky routing to keep its context.
+    """
+
+    def __init__(self, max_threads: int = 10000, ttl_seconds: float = 86400):
+        super().__init__()
+        self.max_threads = max_threads
+        self.ttl_seconds = ttl_seconds
+        self._lock = Lock()
+        # thread_id -> last write (monotonic), least recently used first
+        self._last_used: "OrderedDict[str, float]" = OrderedDict()
+
+    def get_tuple(self, config):
+        thread_id = config["configurable"]["thread_id"]
+        with self._lock:
+            last_used = self._last_used.get(thread_id)
+            if last_used is not None and last_used + self.ttl_seconds <= time.monotonic():
+                self._drop_threads([thread_id])
+        return super().get_tuple(config)
+
+    def put(self, config, checkpoint, metadata, new_versions):
+        self._touch(config["configurable"]["thread_id"])
+        return super().put(config, checkpoint, metadata, new_versions)
+
+    @property
+    def thread_count(self) -> int:
+        """Number of threads currently held (no __len__: langgraph tests the saver's truthiness)."""
+        return len(self._last_used)
+
+    def _touch(self, thread_id: str):
+        now = time.monotonic()
+        with self._lock:
+            self._last_used[thread_id] = now
+            self._last_used.move_to_end(thread_id)
+
+            victims = []
+            overflow = len(self._last_used) - self.max_threads
+            if overflow > 0:
+                overflow += self.max_threads // 10
+            for candidate, last_used in self._last_used.items():
+                if candidate == thread_id:
+                    break
+                if len(victims) < overflow or last_used + self.ttl_seconds <= now:
+                    victims.append(candidate)
+                else:
+                    break
+            if victims:
+                self._drop_threads(victims)
+
+    def _drop_threads(self, thread_ids: Iterable[str]):
+        """Delete threads in one pass over writes and blobs; caller holds the lock."""
+        thread_ids = set(thread_ids)
+        for thread_id in thread_ids:
+            self._last_used.pop(thread_id, None)
+            self.storage.pop(thread_id, None)
+        for key in [k for k in self.writes if k[0] in thread_ids]:
+            del self.writes[key]
+        for key in [k for k in self.blobs if k[0] in thread_ids]:
+            del self.blobs[key]
+
+
+# Global instance
+_checkpointer: Optional[BoundedMemorySaver] = None
+
+
+def get_checkpointer() -> BoundedMemorySaver:
+    """Get the process-wide conversation checkpointer."""
+    global _checkpointer
+    if _checkpointer is None:
+        settings = get_settings()
+        _checkpointer = BoundedMemorySaver(
+            max_threads=settings.CHECKPOINT_MAX_THREADS,
+            ttl_seconds=settings.CHECKPOINT_TTL_SECONDS,
+        )
+    return _checkpointer
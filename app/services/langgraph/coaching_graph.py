@@ -1,37 +1,269 @@
-from typing import TypedDict, Annotated, Sequence, Optional, Literal
+from typing import TypedDict, Annotated, AsyncIterator, Dict, Sequence, Optional, Literal, Tuple
+from langgraph.constants import TAG_NOSTREAM
 from langgraph.graph import StateGraph, END
-from langchain_core.messages import BaseMessage, HumanMessage, AIMessage, SystemMessage
+from langgraph.graph.message import add_messages
+from langchain_core.messages import (
+    BaseMessage, HumanMessage, AIMessage, AIMessageChunk, RemoveMessage, SystemMessage,
+)
 from langchain_core.prompts import ChatPromptTemplate
+from langchain_anthropic import ChatAnthropic
+from collections import Counter
 import asyncio
-import operator
 import logging
-from app.services.llm.provider import LLMFactory
-from app.services.rag.retriever import HeroRetriever, BuildRetriever, StrategyRetriever
-from app.services.mlbb_academy.meta_client import get_meta_client, HERO_NAME_MAP
+import re
+from pydantic import BaseModel, Field
+from app.core.config import get_settings
+from app.services.llm.provider import LLMFactory, GeminiProvider, join_text_parts
+from app.services.langgraph.checkpointer import get_checkpointer
+from app.services.langgraph.semantic_cache import get_semantic_cache
+from app.services.rag.retriever import (
+    get_build_retriever,
+    get_hero_retriever,
+    get_strategy_retriever,
+)
+from app.services.mlbb_academy.meta_client import get_meta_client, find_hero_names
 from app.models.schemas import LLMProvider
 
 logger = logging.getLogger(__name__)
 
 
 def _extract_text(response) -> str:
-    """Safely extract text content from an LLM response."""
+    """Safely extract text content from an LLM response of any provider."""
     content = response.content
     if isinstance(content, list):
-        # Gemini returns content as a list of parts
-        parts = []
-        for part in content:
-            if isinstance(part, str):
-                parts.append(part)
-            elif isinstance(part, dict) and "text" in part:
-                parts.append(part["text"])
-        return " ".join(parts)
+        return join_text_parts(content)
     return str(content)
 
 
+def _log_cache_usage(response):
+    """Log prompt-cache token counts reported by the provider, if any."""
+    usage = getattr(response, "usage_metadata", None) or {}
+    details = usage.get("input_token_details") or {}
+    if details:
+        logger.debug(
+            "Prompt cache usage: read=%s creation=%s",
+            details.get("cache_read"),
+            details.get("cache_creation"),
+        )
+
+
+COACH_GUIDELINES = """Important guidelines:
+- Be concise but thorough
+- Use bullet points for lists
+- Mention specific hero names, items, and game mechanics
+- If context is insufficient, use your general MLBB knowledge
+- For Marksman (MM) role, be especially detailed
+- Always be encouraging and constructive"""
+
+# System prompt per intent
+INTENT_PROMPTS = {
+    "hero_info": """You are an expert MLBB coach specializing in hero knowledge.
+Provide detailed, accurate information about heroes, their abilities, roles, and playstyles.
+Be specific and reference game mechanics when relevant.""",
+
+    "build_recommendation": """You are an expert MLBB coach specializing in item builds.
+Recommend optimal item builds, emblems, and battle spells.
+Explain the reasoning behind each recommendation and when to adapt builds.""",
+
+    "matchup_analysis": """You are an expert MLBB coach specializing in matchup analysis.
+Provide detailed counter strategies, positioning tips, and win conditions.
+Be specific about power spikes, itemization adjustments, and gameplay tactics.""",
+
+    "general_strategy": """You are an expert MLBB coach providing strategic guidance.
+Give actionable advice on gameplay, positioning, objectives, and team coordination.
+Focus on practical tips that players can immediately apply.""",
+
+    "general_chat": """You are a friendly MLBB coach assistant.
+Respond naturally to greetings and general conversation while staying in character."""
+}
+
+# Intent prompt + guidelines, assembled once; this is the cacheable prefix
+INTENT_SYSTEM_PROMPTS = {
+    intent: f"{prompt}\n\n{COACH_GUIDELINES}" for intent, prompt in INTENT_PROMPTS.items()
+}
+
+# Extra instruction per supported response language
+LANGUAGE_INSTRUCTIONS = {
+    "en": "",
+    "my": "IMPORTANT: You MUST respond entirely in Burmese (Myanmar language). Use Burmese script for all text. Hero names, item names, and game terms can remain in English.",
+}
+
+# (intent, language) -> (cacheable system prefix, header for the per-turn
+# context block), assembled once so a turn only appends its context
+PROMPT_TABLE: Dict[Tuple[str, str], Tuple[str, str]] = {
+    (intent, language): (
+        system_prompt,
+        f"{instruction}\n\nUse the following context to inform your response:\n\n".lstrip(),
+    )
+    for intent, system_prompt in INTENT_SYSTEM_PROMPTS.items()
+    for language, instruction in LANGUAGE_INSTRUCTIONS.items()
+}
+
+# Small-talk system prompt per language; no guidelines or context block
+CHAT_SYSTEM_PROMPTS = {
+    language: f"{INTENT_PROMPTS['general_chat']}\n\n{instruction}".rstrip()
+    for language, instruction in LANGUAGE_INSTRUCTIONS.items()
+}
+
+RETRIEVAL_NODES = ["retrieve_hero", "retrieve_build", "retrieve_strategy", "retrieve_meta"]
+
+# Nodes whose model tokens are streamed to the client
+GENERATION_NODES = ("generate_response", "generate_chat_response")
+
+# Once a thread holds more than HISTORY_SUMMARY_THRESHOLD messages, all but
+# the last HISTORY_KEEP_RECENT are folded into a rolling summary
+HISTORY_SUMMARY_THRESHOLD = 20
+HISTORY_KEEP_RECENT = 4
+
+# Earlier messages sent with a small-talk reply
+CHAT_HISTORY_MESSAGES = 4
+
+SUMMARY_PROMPT = """Summarize the following MLBB coaching conversation in at most 200 tokens.
+Keep the heroes, roles, rank, builds and problems the player mentioned, and the advice already given."""
+
+
+# Keyword rules that route most queries without an LLM round-trip
+BUILD_RE = re.compile(r"\b(build|builds|item|items|emblem|emblems|spell|spells|equipment|gear)\b", re.I)
+COUNTER_RE = re.compile(r"\b(counter|counters|vs|versus|against|matchup|beat)\b", re.I)
+GREETING_RE = re.compile(r"^\s*(hi|hello|hey|thanks|thank you|ty|gm|gn)\b", re.I)
+
+# Prefilter outcomes, for tuning the rules above
+INTENT_PREFILTER_STATS: Counter = Counter()
+
+
+def _classify_intent_fast(query: str) -> Optional[str]:
+    """Route a query by keyword rules; None when the LLM should decide."""
+    if BUILD_RE.search(query):
+        return "build_recommendation"
+    if COUNTER_RE.search(query):
+        return "matchup_analysis"
+    if find_hero_names(query):
+        return "hero_info"
+    # Only bare greetings; "hi, how do I rotate?" still needs classifying
+    if GREETING_RE.match(query) and len(query.split()) <= 4:
+        return "general_chat"
+    return None
+
+
+CLASSIFICATION_PROMPT = ChatPromptTemplate.from_messages([
+    ("system", """You are an intent classifier for an MLBB coaching system.
+Classify the user's query into ONE of these categories:
+
+1. hero_info - Questions about specific heroes, their abilities, roles, or general info
+2. build_recommendation - Questions about items, builds, emblems, or equipment
+3. matchup_analysis - Questions about counters, how to play against specific heroes
+4. general_strategy - Questions about gameplay, positioning, team fights, meta, tactics
+5. general_chat - Greetings, thanks, or non-MLBB related queries
+
+Call the classify_intent tool with the category."""),
+    ("user", "{query}")
+])
+
+Intent = Literal[
+    "hero_info", "build_recommendation", "matchup_analysis", "general_strategy", "general_chat"
+]
+
+
+class classify_intent(BaseModel):
+    """Record the category of the user's MLBB coaching query."""
+    intent: Intent = Field(description="The single best-matching category")
+
+
+class BatchingClassifier:
+    """
+    Micro-batches LLM intent classification across concurrent requests.
+
+    Queries arriving within `window` seconds for the same provider are sent
+    together through one `abatch` call (at most `max_batch` per call) and
+    the results are handed back to each waiting caller.
+    """
+
+    def __init__(self, max_batch: int = 16, window: float = 0.02):
+        self.max_batch = max_batch
+        self.window = window
+        self._pending: dict = {}  # provider -> [(query, future)]
+        self._timers: dict = {}  # provider -> TimerHandle
+        # Strong references so running batches are not garbage collected
+        self._tasks: set = set()
+
+    async def classify(self, query: str, provider: Optional[LLMProvider] = None) -> Intent:
+        """
+        Classify a query, sharing the LLM call with concurrent callers.
+
+        Args:
+            query: User query.
+            provider: LLM provider to classify with.
+
+        Returns:
+            One of the Intent labels.
+        """
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        batch = self._pending.setdefault(provider, [])
+        batch.append((query, future))
+
+        if len(batch) >= self.max_batch:
+            self._flush(provider)
+        elif len(batch) == 1:
+            self._timers[provider] = loop.call_later(self.window, self._flush, provider)
+
+        return await future
+
+    def _flush(self, provider: Optional[LLMProvider]):
+        """Send the pending batch for a provider."""
+        timer = self._timers.pop(provider, None)
+        if timer is not None:
+            timer.cancel()
+        batch = self._pending.pop(provider, None)
+        if batch:
+            task = asyncio.create_task(self._run(provider, batch))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _run(self, provider: Optional[LLMProvider], batch: list):
+        try:
+            # The schema is enforced through forced tool calling (Claude) or
+            # function calling (Gemini); a reply without the call parses to None
+            llm = LLMFactory.get_fast_model(provider=provider, temperature=0.1, max_tokens=32)
+            chain = CLASSIFICATION_PROMPT | llm.with_structured_output(classify_intent)
+            responses = await chain.abatch(
+                [{"query": query} for query, _ in batch], return_exceptions=True
+            )
+        except Exception as e:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        for (query, future), response in zip(batch, responses):
+            if future.done():
+                continue
+            if isinstance(response, classify_intent):
+                future.set_result(response.intent)
+            else:
+                # Missing or malformed tool call: fall back rather than fail the turn
+                logger.warning(f"Intent classification gave no label for {query!r}: {response!r}")
+                future.set_result("general_strategy")
+
+
+# Global instance
+_batching_classifier: Optional[BatchingClassifier] = None
+
+
+def get_batching_classifier() -> BatchingClassifier:
+    """Get global batching classifier instance."""
+    global _batching_classifier
+    if _batching_classifier is None:
+        _batching_classifier = BatchingClassifier()
+    return _batching_classifier
+
+
 class CoachingState(TypedDict):
     """State for the coaching conversation graph."""
-    messages: Annotated[Sequence[BaseMessage], operator.add]
+    messages: Annotated[Sequence[BaseMessage], add_messages]
+    summary: Optional[str]  # rolling summary of turns dropped from messages
     user_query: str
+    query_embedding: Optional[list[float]]  # shared by all retrievers this turn
     intent: Optional[str]  # hero_info, build_recommendation, matchup_analysis, general_strategy
     hero_context: Optional[str]
     build_context: Optional[str]
@@ -47,115 +279,124 @@ class MLBBCoachingGraph:
 
     def __init__(self, llm_provider: Optional[LLMProvider] = None):
         self.llm_provider = llm_provider
-        self.hero_retriever = HeroRetriever(llm_provider)
-        self.build_retriever = BuildRetriever(llm_provider)
-        self.strategy_retriever = StrategyRetriever(llm_provider)
-        self.graph = self._build_graph()
-
-    def _classify_intent(self, state: CoachingState) -> CoachingState:
+        self.hero_retriever = get_hero_retriever(llm_provider)
+        self.build_retriever = get_build_retriever(llm_provider)
+        self.strategy_retriever = get_strategy_retriever(llm_provider)
+        workflow = self._build_graph()
+        # Conversation state per session thread; the checkpointer is shared by
+        # every provider's graph so switching provider mid-session keeps history
+        self.graph = workflow.compile(checkpointer=get_checkpointer())
+        # Requests without a session id keep no history at all
+        self.stateless_graph = workflow.compile()
+
+    async def _classify_intent(self, state: CoachingState) -> dict:
         """Classify the user's intent from their query."""
         user_query = state["user_query"]
 
-        # Use LLM to classify intent
-        llm = LLMFactory.get_model(
-            provider=state.get("llm_provider") or self.llm_provider,
-            temperature=0.1
-        )
-
-        classification_prompt = ChatPromptTemplate.from_messages([
-            ("system", """You are an intent classifier for an MLBB coaching system.
-Classify the user's query into ONE of these categories:
-
-1. hero_info - Questions about specific heroes, their abilities, roles, or general info
-2. build_recommendation - Questions about items, builds, emblems, or equipment
-3. matchup_analysis - Questions about counters, how to play against specific heroes
-4. general_strategy - Questions about gameplay, positioning, team fights, meta, tactics
-5. general_chat - Greetings, thanks, or non-MLBB related queries
+        intent = _classify_intent_fast(user_query)
+        if intent is not None:
+            INTENT_PREFILTER_STATS["hit"] += 1
+            return {"intent": intent}
 
-Respond with ONLY the category name, nothing else."""),
-            ("user", "{query}")
-        ])
+        INTENT_PREFILTER_STATS["miss"] += 1
+        logger.debug(
+            f"Intent prefilter miss ({INTENT_PREFILTER_STATS['miss']}/"
+            f"{sum(INTENT_PREFILTER_STATS.values())}): {user_query!r}"
+        )
 
-        chain = classification_prompt | llm
-        intent = _extract_text(chain.invoke({"query": user_query})).strip().lower()
+        # Fall back to the LLM for queries no rule covers
+        intent = await get_batching_classifier().classify(
+            user_query, state.get("llm_provider") or self.llm_provider
+        )
+        return {"intent": intent}
 
-        # Validate intent
-        valid_intents = ["hero_info", "build_recommendation", "matchup_analysis", "general_strategy", "general_chat"]
-        if intent not in valid_intents:
-            intent = "general_strategy"
+    async def _ensure_query_embedding(self, state: CoachingState) -> dict:
+        """Embed the query once for every retriever, unless already embedded."""
+        if state.get("query_embedding") is not None:
+            return {}
+        return {"query_embedding": await self._embed_query(state["user_query"])}
 
-        state["intent"] = intent
-        return state
+    # Retrieval nodes run in parallel after classification. Each one only
+    # returns the key it owns so concurrent updates never collide.
 
-    def _retrieve_hero_context(self, state: CoachingState) -> CoachingState:
+    async def _retrieve_hero_context(self, state: CoachingState) -> dict:
         """Retrieve hero-related context."""
-        if state["intent"] in ["hero_info", "matchup_analysis"]:
-            docs = self.hero_retriever.retrieve_context(state["user_query"], k=3)
-            state["hero_context"] = self.hero_retriever.format_documents(docs)
-        return state
+        if state["intent"] not in ["hero_info", "matchup_analysis"]:
+            return {}
+        docs = await self.hero_retriever.aretrieve_context(
+            state["user_query"], k=3, query_vector=state.get("query_embedding")
+        )
+        return {"hero_context": self.hero_retriever.format_documents(docs)}
 
-    def _retrieve_build_context(self, state: CoachingState) -> CoachingState:
+    async def _retrieve_build_context(self, state: CoachingState) -> dict:
         """Retrieve build-related context."""
-        if state["intent"] == "build_recommendation":
-            docs = self.build_retriever.retrieve_context(state["user_query"], k=3)
-            state["build_context"] = self.build_retriever.format_documents(docs)
-        return state
+        if state["intent"] != "build_recommendation":
+            return {}
+        docs = await self.build_retriever.aretrieve_context(
+            state["user_query"], k=3, query_vector=state.get("query_embedding")
+        )
+        return {"build_context": self.build_retriever.format_documents(docs)}
 
-    def _retrieve_strategy_context(self, state: CoachingState) -> CoachingState:
+    async def _retrieve_strategy_context(self, state: CoachingState) -> dict:
         """Retrieve strategy-related context."""
-        if state["intent"] in ["general_strategy", "matchup_analysis"]:
-            docs = self.strategy_retriever.retrieve_context(state["user_query"], k=5)
-            state["strategy_context"] = self.strategy_retriever.format_documents(docs)
-        return state
+        if state["intent"] not in ["general_strategy", "matchup_analysis"]:
+            return {}
+        docs = await self.strategy_retriever.aretrieve_context(
+            state["user_query"], k=5, query_vector=state.get("query_embedding")
+        )
+        return {"strategy_context": self.strategy_retriever.format_documents(docs)}
 
-    def _retrieve_meta_context(self, state: CoachingState) -> CoachingState:
+    async def _retrieve_meta_context(self, state: CoachingState) -> dict:
         """Fetch real-time hero meta data from Moonton GMS API."""
         if state["intent"] in ["hero_info", "matchup_analysis", "build_recommendation"]:
-            query_lower = state["user_query"].lower()
-            detected_heroes = [
-                name for name in HERO_NAME_MAP if name in query_lower
-            ]
+            detected_heroes = find_hero_names(state["user_query"])
 
             if detected_heroes:
                 meta_client = get_meta_client()
-                meta_parts = []
-
-                try:
-                    loop = asyncio.get_event_loop()
-                except RuntimeError:
-                    loop = asyncio.new_event_loop()
-                    asyncio.set_event_loop(loop)
-
-                for hero_name in detected_heroes[:2]:  # limit to 2 heroes
-                    hero_id = HERO_NAME_MAP[hero_name]
-                    try:
-                        rankings = loop.run_until_complete(
-                            meta_client.get_hero_rankings(rank="all", days=7, limit=131)
-                        )
-                        counters = loop.run_until_complete(
-                            meta_client.get_hero_counters(hero_id, rank="mythic")
-                        )
-                        synergies = loop.run_until_complete(
-                            meta_client.get_hero_synergies(hero_id, rank="mythic")
-                        )
-                        meta_text = meta_client.format_meta_context(
-                            hero_name, rankings, counters, synergies
-                        )
-                        meta_parts.append(meta_text)
-                    except Exception as e:
-                        logger.warning(f"Failed to fetch meta for {hero_name}: {e}")
+                heroes = detected_heroes[:2]  # limit to 2 heroes
+                bundles = await asyncio.gather(
+                    *(meta_client.get_hero_meta_bundle(meta_client.hero_name_to_id(name)) for name in heroes)
+                )
+                meta_parts = [
+                    meta_client.format_meta_context(
+                        hero_name, bundle["rankings"], bundle["counters"], bundle["synergies"]
+                    )
+                    for hero_name, bundle in zip(heroes, bundles)
+                ]
 
                 if meta_parts:
-                    state["meta_context"] = "\n".join(meta_parts)
+                    return {"meta_context": "\n".join(meta_parts)}
+
+        return {}
+
+    async def _generate_chat_response(self, state: CoachingState) -> dict:
+        """Reply to small talk with the fast model and no RAG scaffolding."""
+        provider = state.get("llm_provider") or self.llm_provider
+        language = state.get("language") if state.get("language") in LANGUAGE_INSTRUCTIONS else "en"
+
+        # Only the summary and the last few messages, enough for follow-ups
+        history, summary, history_updates = await self._summarize_if_needed(state, provider)
+        system_prompt = CHAT_SYSTEM_PROMPTS[language]
+        if summary:
+            system_prompt = f"{system_prompt}\n\nPrior conversation summary: {summary}"
+
+        llm = LLMFactory.get_fast_model(provider=provider, temperature=0.7, max_tokens=256)
+        response = await llm.ainvoke([
+            SystemMessage(content=system_prompt),
+            *history[-CHAT_HISTORY_MESSAGES:],
+            HumanMessage(content=state["user_query"]),
+        ])
 
-        return state
+        response_text = LLMFactory.get_provider(provider).extract_text(response)
+        return {
+            **history_updates,
+            "response": response_text,
+            "messages": [*history_updates.get("messages", []), AIMessage(content=response_text)],
+        }
 
-    def _generate_response(self, state: CoachingState) -> CoachingState:
+    async def _generate_rag_response(self, state: CoachingState) -> dict:
         """Generate the coaching response using retrieved context."""
-        llm = LLMFactory.get_model(
-            provider=state.get("llm_provider") or self.llm_provider,
-            temperature=0.7
-        )
+        provider = state.get("llm_provider") or self.llm_provider
 
         # Build context from retrieved information
         context_parts = []
@@ -170,63 +411,103 @@ Respond with ONLY the category name, nothing else."""),
 
         context = "\n\n".join(context_parts) if context_parts else "No specific context available."
 
-        # Create system prompt based on intent
-        intent_prompts = {
-            "hero_info": """You are an expert MLBB coach specializing in hero knowledge.
-Provide detailed, accurate information about heroes, their abilities, roles, and playstyles.
-Be specific and reference game mechanics when relevant.""",
-
-            "build_recommendation": """You are an expert MLBB coach specializing in item builds.
-Recommend optimal item builds, emblems, and battle spells.
-Explain the reasoning behind each recommendation and when to adapt builds.""",
-
-            "matchup_analysis": """You are an expert MLBB coach specializing in matchup analysis.
-Provide detailed counter strategies, positioning tips, and win conditions.
-Be specific about power spikes, itemization adjustments, and gameplay tactics.""",
-
-            "general_strategy": """You are an expert MLBB coach providing strategic guidance.
-Give actionable advice on gameplay, positioning, objectives, and team coordination.
-Focus on practical tips that players can immediately apply.""",
-
-            "general_chat": """You are a friendly MLBB coach assistant.
-Respond naturally to greetings and general conversation while staying in character."""
-        }
-
-        system_prompt = intent_prompts.get(state["intent"], intent_prompts["general_strategy"])
-
-        # Language instruction based on user preference
-        language = state.get("language") or "en"
-        if language == "my":
-            language_instruction = "\n- IMPORTANT: You MUST respond entirely in Burmese (Myanmar language). Use Burmese script for all text. Hero names, item names, and game terms can remain in English."
+        intent = state["intent"] if state["intent"] in INTENT_PROMPTS else "general_strategy"
+        language = state.get("language") if state.get("language") in LANGUAGE_INSTRUCTIONS else "en"
+        system_prompt, context_header = PROMPT_TABLE[(intent, language)]
+
+        # Most stable content first: the intent prompt and guidelines only
+        # vary by intent, so they form a shared prefix that both Claude
+        # (cache_control) and Gemini (implicit/explicit caching) can reuse.
+        # Language and retrieved context follow, then the user query.
+        dynamic_text = context_header + context
+
+        history, summary, history_updates = await self._summarize_if_needed(state, provider)
+        if summary:
+            dynamic_text = f"Prior conversation summary: {summary}\n\n{dynamic_text}"
+
+        cache_name = await self._gemini_cache_name(provider, system_prompt)
+        if cache_name:
+            # The cached content carries the system instruction, so the
+            # request itself must not include one
+            llm = LLMFactory.get_model(
+                provider=provider, temperature=0.7, cached_content=cache_name
+            )
+            messages = [HumanMessage(content=dynamic_text)]
         else:
-            language_instruction = ""
-
-        # Build the prompt
-        prompt = ChatPromptTemplate.from_messages([
-            ("system", f"""{system_prompt}
-
-Use the following context to inform your response:
-
-{context}
+            llm = LLMFactory.get_model(provider=provider, temperature=0.7)
+            stable_block = {"type": "text", "text": system_prompt}
+            if isinstance(llm, ChatAnthropic):
+                stable_block["cache_control"] = {"type": "ephemeral"}
+            messages = [SystemMessage(content=[
+                stable_block, {"type": "text", "text": dynamic_text}
+            ])]
+
+        response = await llm.ainvoke([*messages, *history, HumanMessage(content=state["user_query"])])
+        _log_cache_usage(response)
+
+        response_text = LLMFactory.get_provider(provider).extract_text(response)
+        return {
+            **history_updates,
+            "response": response_text,
+            "messages": [*history_updates.get("messages", []), AIMessage(content=response_text)],
+        }
 
-Important guidelines:
-- Be concise but thorough
-- Use bullet points for lists
-- Mention specific hero names, items, and game mechanics
-- If context is insufficient, use your general MLBB knowledge
-- For Marksman (MM) role, be especially detailed
-- Always be encouraging and constructive{language_instruction}"""),
-            ("user", "{query}")
-        ])
+    async def _summarize_if_needed(
+        self, state: CoachingState, provider: Optional[LLMProvider]
+    ) -> tuple:
+        """
+        Bound the history sent to the generator.
 
-        chain = prompt | llm
-        response = chain.invoke({"query": state["user_query"]})
+        Below the threshold every earlier message is sent verbatim. Above
+        it, older messages are folded into the rolling summary and removed
+        from the thread, so the summary is recomputed only every
+        HISTORY_SUMMARY_THRESHOLD - HISTORY_KEEP_RECENT messages.
 
-        response_text = _extract_text(response)
-        state["response"] = response_text
-        state["messages"].append(AIMessage(content=response_text))
+        Returns:
+            (earlier messages to send, summary or None, state updates)
+        """
+        messages = list(state["messages"])
+        summary = state.get("summary")
+        if len(messages) <= HISTORY_SUMMARY_THRESHOLD:
+            return messages[:-1], summary, {}
+
+        old, recent = messages[:-HISTORY_KEEP_RECENT], messages[-HISTORY_KEEP_RECENT:]
+        transcript = "\n".join(
+            f"{'Player' if isinstance(m, HumanMessage) else 'Coach'}: {_extract_text(m)}"
+            for m in old
+        )
+        if summary:
+            transcript = f"Earlier summary: {summary}\n\n{transcript}"
+
+        try:
+            # Runs inside a generation node: keep its tokens out of stream_message
+            llm = LLMFactory.get_fast_model(provider=provider, temperature=0.3).with_config(
+                tags=[TAG_NOSTREAM]
+            )
+            response = await llm.ainvoke([
+                SystemMessage(content=SUMMARY_PROMPT),
+                HumanMessage(content=transcript),
+            ])
+        except Exception as e:
+            logger.warning(f"History summarization failed: {e}")
+            return recent[:-1], summary, {}
+
+        summary = LLMFactory.get_provider(provider).extract_text(response)
+        return recent[:-1], summary, {
+            "summary": summary,
+            "messages": [RemoveMessage(id=m.id) for m in old],
+        }
 
-        return state
+    async def _gemini_cache_name(
+        self, provider: Optional[LLMProvider], system_instruction: str
+    ) -> Optional[str]:
+        """Explicit Gemini cache for the system instruction, when enabled."""
+        if not get_settings().GEMINI_EXPLICIT_CACHE:
+            return None
+        llm_provider = LLMFactory.get_provider(provider)
+        if not isinstance(llm_provider, GeminiProvider):
+            return None
+        return await llm_provider.create_cached_system_prompt(system_instruction)
 
     def _should_retrieve(self, state: CoachingState) -> Literal["retrieve", "respond"]:
         """Decide whether to retrieve context or respond directly."""
@@ -238,37 +519,51 @@ Important guidelines:
 
         return "retrieve"
 
+    def _route_after_classify(self, state: CoachingState) -> str:
+        """Embed the query for retrieval, or go straight to the chat reply."""
+        if self._should_retrieve(state) == "respond":
+            return "generate_chat_response"
+        return "embed_query"
+
     def _build_graph(self) -> StateGraph:
         """Build the coaching conversation graph."""
         workflow = StateGraph(CoachingState)
 
         # Add nodes
         workflow.add_node("classify_intent", self._classify_intent)
+        workflow.add_node("embed_query", self._ensure_query_embedding)
         workflow.add_node("retrieve_hero", self._retrieve_hero_context)
         workflow.add_node("retrieve_build", self._retrieve_build_context)
         workflow.add_node("retrieve_strategy", self._retrieve_strategy_context)
         workflow.add_node("retrieve_meta", self._retrieve_meta_context)
-        workflow.add_node("generate_response", self._generate_response)
+        workflow.add_node("generate_response", self._generate_rag_response)
+        workflow.add_node("generate_chat_response", self._generate_chat_response)
 
         # Define the flow
         workflow.set_entry_point("classify_intent")
 
-        # After classification, retrieve all relevant contexts sequentially
-        workflow.add_edge("classify_intent", "retrieve_hero")
-        workflow.add_edge("retrieve_hero", "retrieve_build")
-        workflow.add_edge("retrieve_build", "retrieve_strategy")
-        workflow.add_edge("retrieve_strategy", "retrieve_meta")
-        workflow.add_edge("retrieve_meta", "generate_response")
+        # After classification, embed the query once, fan out to all
+        # retrievers concurrently and join on generation once every branch
+        # has finished; small talk skips retrieval entirely
+        workflow.add_conditional_edges(
+            "classify_intent",
+            self._route_after_classify,
+            ["embed_query", "generate_chat_response"],
+        )
+        for node in RETRIEVAL_NODES:
+            workflow.add_edge("embed_query", node)
+        workflow.add_edge(RETRIEVAL_NODES, "generate_response")
 
         # End after generation
         workflow.add_edge("generate_response", END)
+        workflow.add_edge("generate_chat_response", END)
 
-        return workflow.compile()
+        return workflow
 
-    def process_message(
+    async def process_message(
         self,
         user_message: str,
-        conversation_history: Optional[list[BaseMessage]] = None,
+        session_id: Optional[str] = None,
         llm_provider: Optional[LLMProvider] = None,
         language: Optional[str] = None,
     ) -> dict:
@@ -277,16 +572,101 @@ Important guidelines:
 
         Args:
             user_message: The user's message.
-            conversation_history: Previous conversation messages.
+            session_id: Conversation thread; history is loaded from its checkpoint.
+                Without one the turn is answered with no history and nothing is kept.
             llm_provider: Optional LLM provider to use.
             language: User's preferred language code (e.g. "my" for Burmese).
 
         Returns:
             Dictionary with response and metadata.
         """
-        initial_state = {
-            "messages": conversation_history or [],
+        graph, config = self._graph_for(session_id)
+
+        cache_key, embedding, cached = await self._cache_lookup(
+            user_message, llm_provider, language, config
+        )
+        if cached is not None:
+            await self._record_cached(config, user_message, cached)
+            return cached
+
+        initial_state = self._initial_state(user_message, embedding, llm_provider, language)
+
+        # Run the graph
+        result = await graph.ainvoke(initial_state, config=config)
+
+        return self._finish(result, cache_key, embedding)
+
+    async def stream_message(
+        self,
+        user_message: str,
+        session_id: Optional[str] = None,
+        llm_provider: Optional[LLMProvider] = None,
+        language: Optional[str] = None,
+    ) -> AsyncIterator[str]:
+        """
+        Process a user message, yielding the response text as it is generated.
+
+        Classification and retrieval run as in process_message; only tokens
+        from the response generation node are yielded.
+
+        Args:
+            user_message: The user's message.
+            session_id: Conversation thread; history is loaded from its checkpoint.
+                Without one the turn is answered with no history and nothing is kept.
+            llm_provider: Optional LLM provider to use.
+            language: User's preferred language code (e.g. "my" for Burmese).
+
+        Yields:
+            Response text chunks.
+        """
+        graph, config = self._graph_for(session_id)
+
+        cache_key, embedding, cached = await self._cache_lookup(
+            user_message, llm_provider, language, config
+        )
+        if cached is not None:
+            await self._record_cached(config, user_message, cached)
+            yield cached["response"]
+            return
+
+        initial_state = self._initial_state(user_message, embedding, llm_provider, language)
+
+        extract_text = LLMFactory.get_provider(llm_provider or self.llm_provider).extract_text
+        result = None
+        async for mode, payload in graph.astream(
+            initial_state, config=config, stream_mode=["messages", "values"]
+        ):
+            if mode == "values":
+                result = payload
+                continue
+            chunk, metadata = payload
+            if (
+                isinstance(chunk, AIMessageChunk)
+                and metadata.get("langgraph_node") in GENERATION_NODES
+            ):
+                text = extract_text(chunk)
+                if text:
+                    yield text
+
+        self._finish(result, cache_key, embedding)
+
+    def _initial_state(
+        self,
+        user_message: str,
+        embedding: Optional[list[float]],
+        llm_provider: Optional[LLMProvider],
+        language: Optional[str],
+    ) -> dict:
+        """Build the graph input for one turn.
+
+        Only the new user message is sent; earlier messages come from the
+        thread's checkpoint. Every other key is reset so nothing from the
+        previous turn leaks into this one.
+        """
+        return {
+            "messages": [HumanMessage(content=user_message)],
             "user_query": user_message,
+            "query_embedding": embedding,
             "intent": None,
             "hero_context": None,
             "build_context": None,
@@ -297,13 +677,14 @@ Important guidelines:
             "response": None
         }
 
-        # Add user message
-        initial_state["messages"].append(HumanMessage(content=user_message))
-
-        # Run the graph
-        result = self.graph.invoke(initial_state)
-
-        return {
+    def _finish(
+        self,
+        result: dict,
+        cache_key: Optional[tuple],
+        embedding: Optional[list[float]],
+    ) -> dict:
+        """Build the output from the final state and cache it when cacheable."""
+        output = {
             "response": result["response"],
             "intent": result["intent"],
             "sources": {
@@ -313,3 +694,77 @@ Important guidelines:
                 "meta_context": result.get("meta_context"),
             }
         }
+        if cache_key is not None and embedding is not None:
+            get_semantic_cache().store(cache_key, embedding, output)
+
+        return output
+
+    async def _cache_lookup(
+        self,
+        user_message: str,
+        llm_provider: Optional[LLMProvider],
+        language: Optional[str],
+        config: dict,
+    ) -> tuple:
+        """
+        Return (cache key, query embedding, cached output or None).
+
+        The cache is shared by every user, so only opening turns take part:
+        a reply in a thread with history depends on that history, and is
+        neither served from the cache nor stored in it (the key is None).
+        """
+        if not get_settings().SEMANTIC_CACHE_ENABLED or await self._has_history(config):
+            return None, None, None
+        # Near-duplicate queries in the same language/provider skip the graph
+        cache_key = (language or "en", llm_provider or self.llm_provider)
+        embedding = await self._embed_query(user_message)
+        cached = None
+        if embedding is not None:
+            cached = get_semantic_cache().lookup(cache_key, embedding)
+        return cache_key, embedding, cached
+
+    def _graph_for(self, session_id: Optional[str]) -> tuple:
+        """(graph, run config) for a turn: checkpointed per session, else stateless."""
+        if session_id is None:
+            return self.stateless_graph, {}
+        return self.graph, {"configurable": {"thread_id": session_id}}
+
+    async def _has_history(self, config: dict) -> bool:
+        """Whether the thread already holds messages or a summary."""
+        if not config:
+            return False
+        snapshot = await self.graph.aget_state(config)
+        return bool(snapshot.values.get("messages") or snapshot.values.get("summary"))
+
+    async def _record_cached(self, config: dict, user_message: str, cached: dict):
+        """Append a cached exchange to the thread's history, if there is a thread."""
+        if not config:
+            return
+        await self.graph.aupdate_state(
+            config,
+            {"messages": [
+                HumanMessage(content=user_message),
+                AIMessage(content=cached["response"]),
+            ]},
+            as_node="generate_response",
+        )
+
+    async def _embed_query(self, user_message: str) -> Optional[list[float]]:
+        """Embed a query with the retrievers' model; None if embedding fails."""
+        try:
+            return await self.hero_retriever.vector_store_manager.embeddings.aembed_query(user_message)
+        except Exception as e:
+            logger.warning(f"Query embedding failed: {e}")
+            return None
+
+
+# One compiled graph per provider; graphs hold no per-request state
+_GRAPH_CACHE: Dict[Optional[LLMProvider], MLBBCoachingGraph] = {}
+
+
+def get_coaching_graph(llm_provider: Optional[LLMProvider] = None) -> MLBBCoachingGraph:
+    """Get the shared coaching graph for a provider."""
+    graph = _GRAPH_CACHE.get(llm_provider)
+    if graph is None:
+        graph = _GRAPH_CACHE[llm_provider] = MLBBCoachingGraph(llm_provider)
+    return graph
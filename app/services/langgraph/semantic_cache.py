@@ -0,0 +1,103 @@
+"""Semantic response cache for the coaching graph."""
+
+from collections import OrderedDict
+from threading import Lock
+from typing import Any, Dict, Hashable, List, Optional, Tuple
+import numpy as np
+from app.core.config import get_settings
+
+
+class SemanticCache:
+    """
+    LRU cache of coaching responses keyed by query embedding similarity.
+
+    Entries are partitioned by an exact key (e.g. language and provider) and
+    matched by cosine similarity within a partition. Embeddings are expected
+    to be L2-normalized, so similarity is a single matrix-vector product.
+    """
+
+    def __init__(self, threshold: float = 0.92, max_size: int = 1000):
+        self.threshold = threshold
+        self.max_size = max_size
+        self._lock = Lock()
+        # entry id -> (partition key, embedding, cached value), oldest first
+        self._entries: "OrderedDict[int, Tuple[Hashable, np.ndarray, Dict[str, Any]]]" = OrderedDict()
+        # partition key -> (entry ids, stacked embeddings); rebuilt lazily
+        self._matrices: Dict[Hashable, Tuple[List[int], np.ndarray]] = {}
+        self._next_id = 0
+
+    def lookup(self, key: Hashable, embedding: List[float]) -> Optional[Dict[str, Any]]:
+        """
+        Find a cached value for a similar query.
+
+        Args:
+            key: Exact-match partition key.
+            embedding: Normalized query embedding.
+
+        Returns:
+            The cached value, or None if nothing is similar enough.
+        """
+        query = np.asarray(embedding, dtype=np.float32)
+        with self._lock:
+            ids, matrix = self._matrix(key)
+            if not ids:
+                return None
+            scores = matrix @ query
+            best = int(np.argmax(scores))
+            if scores[best] < self.threshold:
+                return None
+            entry_id = ids[best]
+            self._entries.move_to_end(entry_id)
+            return self._entries[entry_id][2]
+
+    def store(self, key: Hashable, embedding: List[float], value: Dict[str, Any]):
+        """
+        Cache a value, evicting the least recently used entry when full.
+
+        Args:
+            key: Exact-match partition key.
+            embedding: Normalized query embedding.
+            value: Value to return for similar queries.
+        """
+        vector = np.asarray(embedding, dtype=np.float32)
+        with self._lock:
+            self._entries[self._next_id] = (key, vector, value)
+            self._next_id += 1
+            self._matrices.pop(key, None)
+            while len(self._entries) > self.max_size:
+                _, (evicted_key, _, _) = self._entries.popitem(last=False)
+                self._matrices.pop(evicted_key, None)
+
+    def clear(self):
+        """Drop all cached entries."""
+        with self._lock:
+            self._entries.clear()
+            self._matrices.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _matrix(self, key: Hashable) -> Tuple[List[int], np.ndarray]:
+        """Stacked embeddings for one partition; caller holds the lock."""
+        if key not in self._matrices:
+            ids = [i for i, (k, _, _) in self._entries.items() if k == key]
+            vectors = [self._entries[i][1] for i in ids]
+            matrix = np.vstack(vectors) if vectors else np.empty((0, 0), dtype=np.float32)
+            self._matrices[key] = (ids, matrix)
+        return self._matrices[key]
+
+
+# Global instance
+_semantic_cache: Optional[SemanticCache] = None
+
+
+def get_semantic_cache() -> SemanticCache:
+    """Get global semantic cache instance."""
+    global _semantic_cache
+    if _semantic_cache is None:
+        settings = get_settings()
+        _semantic_cache = SemanticCache(
+            threshold=settings.SEMANTIC_CACHE_THRESHOLD,
+            max_size=settings.SEMANTIC_CACHE_SIZE,
+        )
+    return _semantic_cache
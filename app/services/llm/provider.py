@@ -1,11 +1,23 @@
 from abc import ABC, abstractmethod
-from typing import Optional, List, Dict, Any
+from functools import lru_cache
+from typing import Optional, List, Dict, Any, Tuple
+import asyncio
+import logging
+import time
 from langchain_core.language_models import BaseChatModel
+from langchain_core.messages import SystemMessage
 from langchain_anthropic import ChatAnthropic
-from langchain_google_genai import ChatGoogleGenerativeAI
+from langchain_google_genai import ChatGoogleGenerativeAI, create_context_cache
 from app.core.config import get_settings
 from app.models.schemas import LLMProvider
 
+logger = logging.getLogger(__name__)
+
+# Gemini context caches are replaced this long before their TTL runs out
+GEMINI_CACHE_RENEW_MARGIN_SECONDS = 60
+# A failed cache creation is retried after this long
+GEMINI_CACHE_RETRY_SECONDS = 300
+
 
 class BaseLLMProvider(ABC):
     """Base class for LLM providers."""
@@ -20,6 +32,26 @@ class BaseLLMProvider(ABC):
         """Check if the provider is properly configured."""
         pass
 
+    @property
+    def fast_model_name(self) -> Optional[str]:
+        """Smaller model for cheap tasks; None means the default model."""
+        return None
+
+    def extract_text(self, response) -> str:
+        """Extract the text content from a model response or chunk."""
+        content = response.content
+        if isinstance(content, list):
+            return join_text_parts(content)
+        return str(content)
+
+
+def join_text_parts(parts: list) -> str:
+    """Concatenate the text of a multi-part message content."""
+    return "".join(
+        part.get("text", "") if isinstance(part, dict) else part
+        for part in parts
+    )
+
 
 def _is_real_key(key: Optional[str]) -> bool:
     """Check if an API key looks like a real key, not a placeholder."""
@@ -63,12 +95,25 @@ class ClaudeProvider(BaseLLMProvider):
         """Check if Anthropic API key is configured with a real key."""
         return _is_real_key(self.settings.ANTHROPIC_API_KEY)
 
+    @property
+    def fast_model_name(self) -> Optional[str]:
+        return self.settings.ANTHROPIC_FAST_MODEL
+
+    def extract_text(self, response) -> str:
+        """Claude text replies are plain strings; only tool/streamed blocks are lists."""
+        content = response.content
+        if type(content) is str:
+            return content
+        return join_text_parts(content)
+
 
 class GeminiProvider(BaseLLMProvider):
     """Google Gemini provider."""
 
     def __init__(self):
         self.settings = get_settings()
+        # system instruction -> (cache name or None after a failure, reuse until; monotonic)
+        self._cached_prompts: Dict[str, Tuple[Optional[str], float]] = {}
 
     def get_model(
         self,
@@ -93,6 +138,57 @@ class GeminiProvider(BaseLLMProvider):
         """Check if Google API key is configured with a real key."""
         return _is_real_key(self.settings.GOOGLE_API_KEY)
 
+    @property
+    def fast_model_name(self) -> Optional[str]:
+        return self.settings.GEMINI_FAST_MODEL
+
+    def extract_text(self, response) -> str:
+        """Gemini returns content as a list of parts."""
+        content = response.content
+        if type(content) is list:
+            return join_text_parts(content)
+        return content
+
+    async def create_cached_system_prompt(self, system_instruction: str) -> Optional[str]:
+        """
+        Get an explicit context cache holding a system instruction.
+
+        The cache is created on first use and its name reused until shortly
+        before GEMINI_CACHE_TTL_SECONDS runs out, then created again. A
+        failure (e.g. the prompt is below Gemini's minimum cacheable size)
+        is retried after GEMINI_CACHE_RETRY_SECONDS rather than per request.
+
+        Args:
+            system_instruction: Static system prompt to cache.
+
+        Returns:
+            Cache name to pass as ``cached_content``, or None if unavailable.
+        """
+        now = time.monotonic()
+        entry = self._cached_prompts.get(system_instruction)
+        if entry is not None and now < entry[1]:
+            return entry[0]
+
+        ttl = self.settings.GEMINI_CACHE_TTL_SECONDS
+        try:
+            # Blocking network call; keep it off the event loop
+            cache_name = await asyncio.to_thread(
+                create_context_cache,
+                self.get_model(),
+                [SystemMessage(content=system_instruction)],
+                ttl=f"{ttl}s",
+            )
+        except Exception as e:
+            logger.warning(f"Gemini context cache creation failed: {e}")
+            self._cached_prompts[system_instruction] = (None, now + GEMINI_CACHE_RETRY_SECONDS)
+            return None
+
+        # Timed from before the request, so the name is dropped before Gemini drops the cache
+        self._cached_prompts[system_instruction] = (
+            cache_name, now + max(ttl - GEMINI_CACHE_RENEW_MARGIN_SECONDS, 0)
+        )
+        return cache_name
+
 
 class LLMFactory:
     """Factory for creating LLM instances."""
@@ -150,16 +246,64 @@ class LLMFactory:
             **kwargs: Additional model parameters.
 
         Returns:
-            BaseChatModel instance ready to use.
+            BaseChatModel instance ready to use. Instances are shared between
+            callers asking for the same provider and parameters.
         """
         llm_provider = cls.get_provider(provider)
-        return llm_provider.get_model(temperature=temperature, **kwargs)
+        try:
+            return _cached_model(llm_provider, temperature, frozenset(kwargs.items()))
+        except TypeError:
+            # Unhashable kwargs (e.g. dict values) can't be a cache key
+            return llm_provider.get_model(temperature=temperature, **kwargs)
+
+    @classmethod
+    def get_fast_model(
+        cls,
+        provider: Optional[LLMProvider] = None,
+        temperature: float = 0.1,
+        **kwargs
+    ) -> BaseChatModel:
+        """
+        Get the provider's smaller, faster model for classification-style tasks.
+
+        Args:
+            provider: Specific provider to use.
+            temperature: Model temperature (0-1).
+            **kwargs: Additional model parameters.
+
+        Returns:
+            BaseChatModel instance ready to use.
+        """
+        model_name = cls.get_provider(provider).fast_model_name
+        if model_name:
+            kwargs["model_name"] = model_name
+        return cls.get_model(provider=provider, temperature=temperature, **kwargs)
 
     @classmethod
     def list_available_providers(cls) -> List[LLMProvider]:
-        """Get list of currently available (configured) providers."""
-        return [
-            provider
-            for provider, instance in cls._providers.items()
-            if instance.is_available()
-        ]
+        """Get list of currently available (configured) providers, refreshed once a minute."""
+        return list(_available_providers(int(time.monotonic() // PROVIDER_CHECK_INTERVAL)))
+
+
+@lru_cache(maxsize=32)
+def _cached_model(
+    llm_provider: BaseLLMProvider,
+    temperature: float,
+    extra_kwargs: frozenset,
+) -> BaseChatModel:
+    """Build a model once per (provider, temperature, kwargs) so its HTTP client is reused."""
+    return llm_provider.get_model(temperature=temperature, **dict(extra_kwargs))
+
+
+# Seconds between provider availability re-checks
+PROVIDER_CHECK_INTERVAL = 60
+
+
+@lru_cache(maxsize=1)
+def _available_providers(bucket: int) -> Tuple[LLMProvider, ...]:
+    """Probe providers once per time bucket; maxsize=1 drops the previous bucket."""
+    return tuple(
+        provider
+        for provider, instance in LLMFactory._providers.items()
+        if instance.is_available()
+    )
@@ -0,0 +1,152 @@
+import logging
+import math
+import time
+from collections import OrderedDict
+from typing import Any, Optional, Protocol, Tuple
+
+import orjson
+import redis.asyncio as aioredis
+
+from app.core.config import get_settings
+
+logger = logging.getLogger(__name__)
+
+# Upper bound on cached GMS responses; least recently used go first
+CACHE_MAX_ENTRIES = 1024
+
+
+class CacheBackend(Protocol):
+    """Storage for GMS responses, keyed by request."""
+
+    async def get(self, key: str) -> Optional[Any]:
+        ...
+
+    async def set(self, key: str, value: Any, ttl_seconds: int):
+        ...
+
+    async def ttl(self, key: str) -> Optional[float]:
+        """Seconds until key expires, or None when it isn't cached."""
+        ...
+
+
+class InMemoryBackend:
+    """Per-process LRU cache with TTL expiry."""
+
+    def __init__(self, max_entries: int = CACHE_MAX_ENTRIES):
+        self.max_entries = max_entries
+        # key -> (data, expires_at), least recently used first
+        self._entries: "OrderedDict[str, Tuple[Any, float]]" = OrderedDict()
+        self._earliest_expiry = math.inf
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get_nowait(self, key: str) -> Optional[Any]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        data, expires_at = entry
+        if expires_at <= time.time():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return data
+
+    def set_nowait(self, key: str, value: Any, ttl_seconds: float):
+        now = time.time()
+        expires_at = now + ttl_seconds
+        self._entries[key] = (value, expires_at)
+        self._entries.move_to_end(key)
+        self._earliest_expiry = min(self._earliest_expiry, expires_at)
+
+        self._sweep_expired(now)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def peek(self, key: str) -> Optional[Any]:
+        """Unexpired cached value, without touching its LRU position."""
+        entry = self._entries.get(key)
+        if entry is None or entry[1] <= time.time():
+            return None
+        return entry[0]
+
+    def expires_at(self, key: str) -> Optional[float]:
+        """Expiry timestamp of a cached key, without touching its LRU position."""
+        entry = self._entries.get(key)
+        return entry[1] if entry is not None else None
+
+    async def get(self, key: str) -> Optional[Any]:
+        return self.get_nowait(key)
+
+    async def set(self, key: str, value: Any, ttl_seconds: int):
+        self.set_nowait(key, value, ttl_seconds)
+
+    async def ttl(self, key: str) -> Optional[float]:
+        expires_at = self.expires_at(key)
+        return expires_at - time.time() if expires_at is not None else None
+
+    def _sweep_expired(self, now: float):
+        """Drop expired entries; a no-op until the earliest expiry has passed."""
+        if now < self._earliest_expiry:
+            return
+        expired = [key for key, (_, expires_at) in self._entries.items() if expires_at <= now]
+        for key in expired:
+            del self._entries[key]
+        self._earliest_expiry = min(
+            (expires_at for _, expires_at in self._entries.values()), default=math.inf
+        )
+
+
+class RedisBackend:
+    """
+    Redis-backed cache shared by every worker process.
+
+    Values are stored as orjson with a server-side TTL. Redis errors are
+    logged and treated as misses so an outage only costs extra GMS calls.
+    """
+
+    def __init__(self, client: "aioredis.Redis", prefix: str = "gms:"):
+        self._redis = client
+        self.prefix = prefix
+
+    async def get(self, key: str) -> Optional[Any]:
+        try:
+            raw = await self._redis.get(self.prefix + key)
+        except Exception as e:
+            logger.warning("Redis cache get failed: %s", e)
+            return None
+        return orjson.loads(raw) if raw is not None else None
+
+    async def set(self, key: str, value: Any, ttl_seconds: int):
+        try:
+            await self._redis.set(self.prefix + key, orjson.dumps(value), ex=ttl_seconds)
+        except Exception as e:
+            logger.warning("Redis cache set failed: %s", e)
+
+    async def ttl(self, key: str) -> Optional[float]:
+        try:
+            millis = await self._redis.pttl(self.prefix + key)
+        except Exception as e:
+            logger.warning("Redis cache ttl failed: %s", e)
+            return None
+        # -2: missing, -1: no expiry (never written that way here)
+        return millis / 1000 if millis >= 0 else None
+
+    async def aclose(self):
+        await self._redis.aclose()
+
+
+def create_shared_backend() -> Optional[RedisBackend]:
+    """Redis backend when META_CACHE_BACKEND is "redis", otherwise None."""
+    settings = get_settings()
+    if settings.META_CACHE_BACKEND != "redis":
+        return None
+    client = aioredis.Redis(
+        host=settings.REDIS_HOST,
+        port=settings.REDIS_PORT,
+        db=settings.REDIS_DB,
+        password=settings.REDIS_PASSWORD,
+        socket_timeout=1.0,
+        socket_connect_timeout=1.0,
+    )
+    return RedisBackend(client)
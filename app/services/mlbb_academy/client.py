@@ -15,3 +15,12 @@ __all__ = [
     "MLBBMetaClient",
     "get_meta_client",
 ]
+
+# Names of the removed stub client, kept so stale imports fail with a pointer
+_REMOVED = {"MLBBAcademyClient", "get_academy_client"}
+
+
+def __getattr__(name):
+    if name in _REMOVED:
+        raise ImportError(f"{name} was removed; moved to mlbb_academy.meta_client")
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,15 +1,30 @@
+import asyncio
 import httpx
 import logging
+import numpy as np
+import orjson
+import random
+import re
+import threading
 import time
-from typing import Optional, Dict, List, Any
-from dataclasses import dataclass, field
+from collections import Counter
+from types import MappingProxyType
+from typing import Optional, Dict, List, Any, Awaitable, Callable, Tuple
+from app.services.mlbb_academy.cache import (
+    CACHE_MAX_ENTRIES,
+    CacheBackend,
+    InMemoryBackend,
+    RedisBackend,
+    create_shared_backend,
+)
 
 logger = logging.getLogger(__name__)
 
 GMS_BASE_URL = "https://api.gms.moontontech.com"
+USER_AGENT = "MLBB-AI-Coach/1.0"
 
 # Source IDs for different Moonton GMS endpoints
-SOURCES = {
+SOURCES = MappingProxyType({
     "hero_rank_1d": "/api/gms/source/2669606/2756567",
     "hero_rank_3d": "/api/gms/source/2669606/2756568",
     "hero_rank_7d": "/api/gms/source/2669606/2756569",
@@ -20,27 +35,27 @@ SOURCES = {
     "hero_rate_7d": "/api/gms/source/2669606/2674709",
     "hero_rate_15d": "/api/gms/source/2669606/2687909",
     "hero_rate_30d": "/api/gms/source/2669606/2690860",
-}
+})
 
-RANK_MAP = {
+RANK_MAP = MappingProxyType({
     "all": "101",
     "epic": "5",
     "legend": "6",
     "mythic": "7",
     "honor": "8",
     "glory": "9",
-}
+})
 
-DAYS_SOURCE_MAP = {
+DAYS_SOURCE_MAP = MappingProxyType({
     1: "hero_rank_1d",
     3: "hero_rank_3d",
     7: "hero_rank_7d",
     15: "hero_rank_15d",
     30: "hero_rank_30d",
-}
+})
 
 # Hero ID → name mapping (127 heroes as of 2026-02)
-HERO_ID_MAP = {
+HERO_ID_MAP = MappingProxyType({
     127: "Lukas", 126: "Suyou", 125: "Zhuxin", 124: "Chip", 123: "Cici",
     122: "Nolan", 121: "Ixia", 120: "Arlott", 119: "Novaria", 118: "Joy",
     117: "Fredrinn", 116: "Julian", 115: "Xavier", 114: "Melissa", 113: "Yin",
@@ -67,62 +82,298 @@ HERO_ID_MAP = {
     15: "Eudora", 14: "Rafaela", 13: "Clint", 12: "Bruno", 11: "Bane",
     10: "Franco", 9: "Akai", 8: "Karina", 7: "Alucard", 6: "Tigreal",
     5: "Nana", 4: "Alice", 3: "Saber", 2: "Balmond", 1: "Miya",
-}
+})
 
 # Reverse map: name (lowercase) → hero_id
-HERO_NAME_MAP = {name.lower(): hid for hid, name in HERO_ID_MAP.items()}
+HERO_NAME_MAP = MappingProxyType({name.lower(): hid for hid, name in HERO_ID_MAP.items()})
+
+_NON_ALNUM_RE = re.compile(r"[^a-z0-9]")
+
+
+def normalize_hero_name(name: str) -> str:
+    """Casefold and drop punctuation/spaces, so "Chang'e" matches "change"."""
+    return _NON_ALNUM_RE.sub("", name.casefold())
+
+
+# Normalized name → hero_id, tolerant of how users punctuate names
+HERO_NORM_MAP = MappingProxyType({
+    normalize_hero_name(name): hid for hid, name in HERO_ID_MAP.items()
+})
+
+# Longest hero name in words ("Popol and Kupa")
+HERO_MAX_WORDS = max(len(name.split()) for name in HERO_ID_MAP.values())
+
+_POSSESSIVE_RE = re.compile(r"['’]s$", re.I)
+
+
+def find_hero_names(text: str) -> List[str]:
+    """
+    Heroes mentioned in free text, in order of first mention.
+
+    Runs of up to HERO_MAX_WORDS words are normalized and looked up in
+    HERO_NORM_MAP, longest first, so "chang'e", "Change" and "x borg" all
+    match while "rolling" doesn't match Ling.
+
+    Args:
+        text: User message.
+
+    Returns:
+        Canonical hero names, without duplicates.
+    """
+    words = [normalize_hero_name(_POSSESSIVE_RE.sub("", word)) for word in text.split()]
+    found: List[str] = []
+    i = 0
+    while i < len(words):
+        for n in range(min(HERO_MAX_WORDS, len(words) - i), 0, -1):
+            hero_id = HERO_NORM_MAP.get("".join(words[i:i + n]))
+            if hero_id is not None:
+                name = HERO_ID_MAP[hero_id]
+                if name not in found:
+                    found.append(name)
+                i += n
+                break
+        else:
+            i += 1
+    return found
 
 
-@dataclass
-class CacheEntry:
-    data: Any
-    expires_at: float
+# GMS field behind each rankings sort option
+SORT_FIELD_MAP = MappingProxyType({
+    "pick_rate": "main_hero_appearance_rate",
+    "ban_rate": "main_hero_ban_rate",
+    "win_rate": "main_hero_win_rate",
+})
+
+
+def _eq_filter(field: str, value: Any) -> dict:
+    return {"field": field, "operator": "eq", "value": value}
+
+
+# Invariant parts of the GMS request bodies, shared (never mutated) across calls
+RANKINGS_FIELDS = (
+    "main_hero",
+    "main_hero_appearance_rate",
+    "main_hero_ban_rate",
+    "main_hero_win_rate",
+    "main_heroid",
+)
+RANKINGS_SORTS = MappingProxyType({
+    sort_by: ({"data": {"field": field, "order": "desc"}, "type": "sequence"},)
+    for sort_by, field in SORT_FIELD_MAP.items()
+})
+
+# match_type 0 = stats against the hero, 1 = stats alongside it
+AGAINST_FILTER = _eq_filter("match_type", "0")
+ALONGSIDE_FILTER = _eq_filter("match_type", "1")
+
+
+def _matchup_payload(match_filter: dict, hero_id: int, rank_value: str) -> dict:
+    """Request body for a hero's counters or synergies (chosen by match_filter)."""
+    return {
+        "pageSize": 20,
+        "filters": (
+            match_filter,
+            _eq_filter("main_heroid", hero_id),
+            _eq_filter("bigrank", rank_value),
+        ),
+        "sorts": (),
+        "pageIndex": 1,
+    }
+
+
+def _percentages(rows: List[dict], fields: Tuple[str, ...]) -> List[List[float]]:
+    """Scale 0-1 rate fields to percentages rounded to 2 places, one row per record."""
+    if not rows:
+        return []
+    rates = np.array([[row.get(field, 0) for field in fields] for row in rows], dtype=float)
+    return np.round(rates * 100, 2).tolist()
+
+
+# GMS role and lane codes used in hero detail records
+ROLE_MAP = MappingProxyType({
+    1: "Tank", 2: "Fighter", 3: "Assassin", 4: "Mage", 5: "Marksman", 6: "Support",
+})
+LANE_MAP = MappingProxyType({
+    1: "EXP Lane", 2: "Mid Lane", 3: "Roam", 4: "Jungle", 5: "Gold Lane",
+})
+
+# Colour markup in skill descriptions, stripped in one pass
+FONT_TAG_RE = re.compile(r"<font[^>]*>|</font>")
+
+# Entries pulled from the shared cache are kept locally this long (seconds)
+LOCAL_TTL_FROM_SHARED = 60
+
+# Failed lookups are remembered for a jittered 30-120s so an outage isn't retried per request
+NEGATIVE_TTL_RANGE = (30, 120)
+_NEGATIVE = object()
+
+# Popular keys about to expire are refetched in the background every pass
+WARM_INTERVAL_SECONDS = 360
+WARM_TOP_K = 20
+
+
+def _mark_retrieved(task: asyncio.Task):
+    """Consume a shared fetch's exception even when every caller has gone away."""
+    if not task.cancelled():
+        task.exception()
 
 
 class MLBBMetaClient:
     """Client for Moonton GMS Academy API — hero meta data."""
 
     def __init__(self):
-        self._cache: Dict[str, CacheEntry] = {}
-
-    def _get_cached(self, key: str) -> Optional[Any]:
-        entry = self._cache.get(key)
-        if entry and entry.expires_at > time.time():
-            return entry.data
-        return None
-
-    def _set_cached(self, key: str, data: Any, ttl_seconds: int):
-        self._cache[key] = CacheEntry(data=data, expires_at=time.time() + ttl_seconds)
+        # L1: this process; L2: optional cache shared across workers
+        self._cache = InMemoryBackend(CACHE_MAX_ENTRIES)
+        self._shared: Optional[CacheBackend] = create_shared_backend()
+        self._client: Optional[httpx.AsyncClient] = None
+        self._inflight: Dict[str, asyncio.Task] = {}
+        # Recent demand per key, and how to refetch it, for the cache warmer
+        self._access_counts: Counter = Counter()
+        self._refreshers: Dict[str, Callable[[], Awaitable[Any]]] = {}
+        self._warmer_task: Optional[asyncio.Task] = None
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        """Shared HTTP/2 client so GMS calls reuse one warm connection pool."""
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(
+                base_url=GMS_BASE_URL,
+                timeout=httpx.Timeout(15.0, connect=5.0),
+                headers={"User-Agent": USER_AGENT, "Content-Type": "application/json"},
+                transport=httpx.AsyncHTTPTransport(
+                    http2=True,
+                    retries=2,
+                    limits=httpx.Limits(
+                        max_connections=100,
+                        max_keepalive_connections=50,
+                        keepalive_expiry=30.0,
+                    ),
+                ),
+            )
+        return self._client
+
+    async def aclose(self):
+        """Close the shared HTTP client and cache connection (application shutdown)."""
+        if self._warmer_task is not None:
+            self._warmer_task.cancel()
+            self._warmer_task = None
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+        if isinstance(self._shared, RedisBackend):
+            await self._shared.aclose()
+
+    async def _get_cached(self, key: str) -> Optional[Any]:
+        data = self._cache.get_nowait(key)
+        if data is None and self._shared is not None:
+            data = await self._shared.get(key)
+            if data is not None:
+                self._cache.set_nowait(key, data, LOCAL_TTL_FROM_SHARED)
+        return data
+
+    async def _set_cached(self, key: str, data: Any, ttl_seconds: int):
+        self._cache.set_nowait(key, data, ttl_seconds)
+        if self._shared is not None:
+            await self._shared.set(key, data, ttl_seconds)
+
+    async def _coalesce(self, cache_key: str, fetch: Callable[[], Awaitable[Any]]) -> Any:
+        """Serve from cache, or share one in-flight fetch among concurrent misses."""
+        self._access_counts[cache_key] += 1
+        self._refreshers[cache_key] = fetch
+
+        cached = await self._get_cached(cache_key)
+        if cached is not None:
+            return None if cached is _NEGATIVE else cached
+
+        task = self._inflight.get(cache_key)
+        if task is None:
+            # A task of its own, so the fetch outlives a cancelled first caller
+            task = asyncio.create_task(self._fetch_shared(cache_key, fetch))
+            task.add_done_callback(_mark_retrieved)
+            self._inflight[cache_key] = task
+        # shield: a cancelled caller must not cancel the shared fetch
+        return await asyncio.shield(task)
+
+    async def _fetch_shared(self, cache_key: str, fetch: Callable[[], Awaitable[Any]]) -> Any:
+        try:
+            result = await fetch()
+            if result is None:
+                # Local only: the sentinel can't be serialized for the shared cache
+                self._cache.set_nowait(
+                    cache_key, _NEGATIVE, random.uniform(*NEGATIVE_TTL_RANGE)
+                )
+            return result
+        finally:
+            self._inflight.pop(cache_key, None)
+
+    def start_warmer(self):
+        """Start refreshing popular entries before they expire (application startup)."""
+        if self._warmer_task is None or self._warmer_task.done():
+            self._warmer_task = asyncio.create_task(self._warmer_loop())
+
+    async def _warmer_loop(self):
+        while True:
+            await asyncio.sleep(WARM_INTERVAL_SECONDS)
+            try:
+                await self._warm_popular()
+            except Exception as e:
+                logger.warning("GMS cache warm-up failed: %s", e)
+
+    async def _warm_popular(self):
+        """Refetch the most requested keys that would expire before the next pass."""
+        now = time.time()
+        deadline = now + WARM_INTERVAL_SECONDS
+        stale = [
+            key
+            for key, _ in self._access_counts.most_common(WARM_TOP_K)
+            if key not in self._inflight
+            # Failed lookups wait out their jittered TTL; refetching them would hit GMS mid-outage
+            and self._cache.peek(key) is not _NEGATIVE
+            and (self._cache.expires_at(key) or 0) < deadline
+        ]
+        if self._shared is not None and stale:
+            # Local copies of shared entries only live LOCAL_TTL_FROM_SHARED, so judge
+            # those by the shared TTL; otherwise every worker refetches every pass
+            shared_ttls = await asyncio.gather(*(self._shared.ttl(key) for key in stale))
+            stale = [
+                key for key, ttl in zip(stale, shared_ttls)
+                if ttl is None or now + ttl < deadline
+            ]
+        # Fetchers store their own results; failures keep the current entry
+        await asyncio.gather(
+            *(self._refreshers[key]() for key in stale), return_exceptions=True
+        )
+
+        # Halve the counts so popularity tracks recent demand
+        for key in list(self._access_counts):
+            self._access_counts[key] //= 2
+            if not self._access_counts[key]:
+                del self._access_counts[key]
+                self._refreshers.pop(key, None)
 
     async def _post(self, source_key: str, payload: dict) -> Optional[dict]:
         path = SOURCES.get(source_key)
         if not path:
-            logger.error(f"Unknown source key: {source_key}")
+            logger.error("Unknown source key: %s", source_key)
             return None
 
-        url = f"{GMS_BASE_URL}{path}"
         try:
-            async with httpx.AsyncClient(timeout=15.0) as client:
-                resp = await client.post(
-                    url,
-                    json=payload,
-                    headers={"Content-Type": "application/json"},
-                )
-                resp.raise_for_status()
-                data = resp.json()
+            resp = await self.client.post(path, content=orjson.dumps(payload))
+            resp.raise_for_status()
+            data = orjson.loads(resp.content)
 
             if data.get("code") != 0:
-                logger.warning(f"GMS API error: {data.get('message')}")
+                logger.warning("GMS API error: %s", data.get("message"))
                 return None
             return data.get("data", {})
 
         except Exception as e:
-            logger.error(f"GMS API call failed ({source_key}): {e}")
+            logger.error("GMS API call failed (%s): %s", source_key, e)
             return None
 
     @staticmethod
     def hero_name_to_id(hero_name: str) -> Optional[int]:
-        return HERO_NAME_MAP.get(hero_name.lower())
+        return HERO_NORM_MAP.get(normalize_hero_name(hero_name))
 
     @staticmethod
     def hero_id_to_name(hero_id: int) -> Optional[str]:
@@ -137,62 +388,45 @@ class MLBBMetaClient:
     ) -> Optional[List[dict]]:
         """Get hero rankings by win/pick/ban rate for a given rank tier."""
         cache_key = f"rankings:{rank}:{days}:{sort_by}:{limit}"
-        cached = self._get_cached(cache_key)
-        if cached is not None:
-            return cached
+        return await self._coalesce(
+            cache_key, lambda: self._fetch_hero_rankings(cache_key, rank, days, sort_by, limit)
+        )
 
-        sort_field_map = {
-            "pick_rate": "main_hero_appearance_rate",
-            "ban_rate": "main_hero_ban_rate",
-            "win_rate": "main_hero_win_rate",
-        }
+    async def _fetch_hero_rankings(
+        self, cache_key: str, rank: str, days: int, sort_by: str, limit: int
+    ) -> Optional[List[dict]]:
         source_key = DAYS_SOURCE_MAP.get(days, "hero_rank_7d")
         rank_value = RANK_MAP.get(rank, "101")
 
         payload = {
             "pageSize": limit,
-            "filters": [
-                {"field": "bigrank", "operator": "eq", "value": rank_value},
-                {"field": "match_type", "operator": "eq", "value": "0"},
-            ],
-            "sorts": [
-                {
-                    "data": {
-                        "field": sort_field_map.get(sort_by, "main_hero_win_rate"),
-                        "order": "desc",
-                    },
-                    "type": "sequence",
-                }
-            ],
+            "filters": (_eq_filter("bigrank", rank_value), AGAINST_FILTER),
+            "sorts": RANKINGS_SORTS.get(sort_by, RANKINGS_SORTS["win_rate"]),
             "pageIndex": 1,
-            "fields": [
-                "main_hero",
-                "main_hero_appearance_rate",
-                "main_hero_ban_rate",
-                "main_hero_win_rate",
-                "main_heroid",
-            ],
+            "fields": RANKINGS_FIELDS,
         }
 
         data = await self._post(source_key, payload)
         if not data:
             return None
 
-        records = data.get("records", [])
+        rows = [rec.get("data", {}) for rec in data.get("records", [])]
+        rates = _percentages(
+            rows, ("main_hero_win_rate", "main_hero_appearance_rate", "main_hero_ban_rate")
+        )
         results = []
-        for rec in records:
-            d = rec.get("data", {})
+        for d, (win_rate, pick_rate, ban_rate) in zip(rows, rates):
             hero_info = d.get("main_hero", {}).get("data", {})
             results.append({
                 "hero_id": d.get("main_heroid"),
                 "name": hero_info.get("name", HERO_ID_MAP.get(d.get("main_heroid"), "Unknown")),
-                "win_rate": round(d.get("main_hero_win_rate", 0) * 100, 2),
-                "pick_rate": round(d.get("main_hero_appearance_rate", 0) * 100, 2),
-                "ban_rate": round(d.get("main_hero_ban_rate", 0) * 100, 2),
+                "win_rate": win_rate,
+                "pick_rate": pick_rate,
+                "ban_rate": ban_rate,
                 "icon": hero_info.get("head"),
             })
 
-        self._set_cached(cache_key, results, ttl_seconds=3600)
+        await self._set_cached(cache_key, results, ttl_seconds=3600)
         return results
 
     async def get_hero_counters(
@@ -200,39 +434,37 @@ class MLBBMetaClient:
     ) -> Optional[List[dict]]:
         """Get heroes that counter the given hero (match_type=0)."""
         cache_key = f"counters:{hero_id}:{rank}"
-        cached = self._get_cached(cache_key)
-        if cached is not None:
-            return cached
+        return await self._coalesce(
+            cache_key, lambda: self._fetch_hero_counters(cache_key, hero_id, rank)
+        )
 
+    async def _fetch_hero_counters(
+        self, cache_key: str, hero_id: int, rank: str
+    ) -> Optional[List[dict]]:
         rank_value = RANK_MAP.get(rank, "7")
-        payload = {
-            "pageSize": 20,
-            "filters": [
-                {"field": "match_type", "operator": "eq", "value": "0"},
-                {"field": "main_heroid", "operator": "eq", "value": hero_id},
-                {"field": "bigrank", "operator": "eq", "value": rank_value},
-            ],
-            "sorts": [],
-            "pageIndex": 1,
-        }
+        payload = _matchup_payload(AGAINST_FILTER, hero_id, rank_value)
 
         data = await self._post("hero_rank_7d", payload)
         if not data:
             return None
 
-        records = data.get("records", [])
-        results = []
-        for rec in records:
-            d = rec.get("data", {})
-            for sub in d.get("sub_hero", []):
-                results.append({
-                    "hero_id": sub.get("heroid"),
-                    "name": HERO_ID_MAP.get(sub.get("heroid"), "Unknown"),
-                    "win_rate_against": round(sub.get("hero_win_rate", 0) * 100, 2),
-                    "increase_win_rate": round(sub.get("increase_win_rate", 0) * 100, 2),
-                })
-
-        self._set_cached(cache_key, results, ttl_seconds=3600)
+        subs = [
+            sub
+            for rec in data.get("records", [])
+            for sub in rec.get("data", {}).get("sub_hero", [])
+        ]
+        rates = _percentages(subs, ("hero_win_rate", "increase_win_rate"))
+        results = [
+            {
+                "hero_id": sub.get("heroid"),
+                "name": HERO_ID_MAP.get(sub.get("heroid"), "Unknown"),
+                "win_rate_against": win_rate,
+                "increase_win_rate": increase,
+            }
+            for sub, (win_rate, increase) in zip(subs, rates)
+        ]
+
+        await self._set_cached(cache_key, results, ttl_seconds=3600)
         return results
 
     async def get_hero_synergies(
@@ -240,56 +472,53 @@ class MLBBMetaClient:
     ) -> Optional[List[dict]]:
         """Get best teammate heroes for the given hero (match_type=1)."""
         cache_key = f"synergies:{hero_id}:{rank}"
-        cached = self._get_cached(cache_key)
-        if cached is not None:
-            return cached
+        return await self._coalesce(
+            cache_key, lambda: self._fetch_hero_synergies(cache_key, hero_id, rank)
+        )
 
+    async def _fetch_hero_synergies(
+        self, cache_key: str, hero_id: int, rank: str
+    ) -> Optional[List[dict]]:
         rank_value = RANK_MAP.get(rank, "7")
-        payload = {
-            "pageSize": 20,
-            "filters": [
-                {"field": "match_type", "operator": "eq", "value": "1"},
-                {"field": "main_heroid", "operator": "eq", "value": hero_id},
-                {"field": "bigrank", "operator": "eq", "value": rank_value},
-            ],
-            "sorts": [],
-            "pageIndex": 1,
-        }
+        payload = _matchup_payload(ALONGSIDE_FILTER, hero_id, rank_value)
 
         data = await self._post("hero_rank_7d", payload)
         if not data:
             return None
 
-        records = data.get("records", [])
-        results = []
-        for rec in records:
-            d = rec.get("data", {})
-            for sub in d.get("sub_hero", []):
-                results.append({
-                    "hero_id": sub.get("heroid"),
-                    "name": HERO_ID_MAP.get(sub.get("heroid"), "Unknown"),
-                    "teammate_win_rate": round(sub.get("hero_win_rate", 0) * 100, 2),
-                    "increase_win_rate": round(sub.get("increase_win_rate", 0) * 100, 2),
-                })
-
-        self._set_cached(cache_key, results, ttl_seconds=3600)
+        subs = [
+            sub
+            for rec in data.get("records", [])
+            for sub in rec.get("data", {}).get("sub_hero", [])
+        ]
+        rates = _percentages(subs, ("hero_win_rate", "increase_win_rate"))
+        results = [
+            {
+                "hero_id": sub.get("heroid"),
+                "name": HERO_ID_MAP.get(sub.get("heroid"), "Unknown"),
+                "teammate_win_rate": win_rate,
+                "increase_win_rate": increase,
+            }
+            for sub, (win_rate, increase) in zip(subs, rates)
+        ]
+
+        await self._set_cached(cache_key, results, ttl_seconds=3600)
         return results
 
     async def get_hero_detail(self, hero_id: int) -> Optional[dict]:
         """Get detailed hero info (skills, stats, role, lane)."""
         cache_key = f"detail:{hero_id}"
-        cached = self._get_cached(cache_key)
-        if cached is not None:
-            return cached
+        return await self._coalesce(
+            cache_key, lambda: self._fetch_hero_detail(cache_key, hero_id)
+        )
 
+    async def _fetch_hero_detail(self, cache_key: str, hero_id: int) -> Optional[dict]:
         payload = {
             "pageSize": 1,
-            "filters": [
-                {"field": "hero_id", "operator": "eq", "value": hero_id},
-            ],
-            "sorts": [],
+            "filters": (_eq_filter("hero_id", hero_id),),
+            "sorts": (),
             "pageIndex": 1,
-            "object": [],
+            "object": (),
         }
 
         data = await self._post("hero_position", payload)
@@ -304,18 +533,15 @@ class MLBBMetaClient:
         hero_data = rec.get("hero", {}) if isinstance(rec.get("hero"), dict) else {}
         inner = hero_data.get("data", {}) if isinstance(hero_data, dict) else {}
 
-        role_map = {1: "Tank", 2: "Fighter", 3: "Assassin", 4: "Mage", 5: "Marksman", 6: "Support"}
-        lane_map = {1: "EXP Lane", 2: "Mid Lane", 3: "Roam", 4: "Jungle", 5: "Gold Lane"}
-
-        roles = [role_map.get(r) for r in inner.get("sortid", []) if role_map.get(r)]
-        lanes = [lane_map.get(l) for l in inner.get("roadsort", []) if lane_map.get(l)]
+        roles = [ROLE_MAP[r] for r in inner.get("sortid", []) if r in ROLE_MAP]
+        lanes = [LANE_MAP[l] for l in inner.get("roadsort", []) if l in LANE_MAP]
 
         skills = []
         for skill_group in inner.get("heroskilllist", []):
             for skill in skill_group.get("skilllist", []):
                 skills.append({
                     "name": skill.get("skillname"),
-                    "description": skill.get("skilldesc", "").replace('<font color="fba51f">', "").replace('<font color="fb1f1f">', "").replace('<font color="a6aafb">', "").replace("</font>", ""),
+                    "description": FONT_TAG_RE.sub("", skill.get("skilldesc", "")),
                     "cooldown": skill.get("skillcd&cost"),
                 })
 
@@ -329,9 +555,47 @@ class MLBBMetaClient:
             "ability_scores": inner.get("abilityshow", []),
         }
 
-        self._set_cached(cache_key, result, ttl_seconds=21600)
+        await self._set_cached(cache_key, result, ttl_seconds=21600)
         return result
 
+    async def get_hero_meta_bundle(
+        self,
+        hero_id: int,
+        rank: str = "mythic",
+        days: int = 7,
+        include_detail: bool = False,
+    ) -> Dict[str, Any]:
+        """
+        Fetch rankings, counters and synergies (and optionally detail) concurrently.
+
+        Each part keeps its own cache entry; a part that fails comes back as None.
+
+        Args:
+            hero_id: GMS hero ID.
+            rank: Rank tier for counters and synergies.
+            days: Window for the all-rank rankings.
+            include_detail: Also fetch skills, roles and lanes.
+
+        Returns:
+            Dict with "rankings", "counters", "synergies" and, if requested, "detail".
+        """
+        parts = {
+            "rankings": self.get_hero_rankings(rank="all", days=days, limit=131),
+            "counters": self.get_hero_counters(hero_id, rank=rank),
+            "synergies": self.get_hero_synergies(hero_id, rank=rank),
+        }
+        if include_detail:
+            parts["detail"] = self.get_hero_detail(hero_id)
+
+        results = await asyncio.gather(*parts.values(), return_exceptions=True)
+        bundle = {}
+        for name, result in zip(parts, results):
+            if isinstance(result, BaseException):
+                logger.warning("GMS %s fetch failed for hero %s: %s", name, hero_id, result)
+                result = None
+            bundle[name] = result
+        return bundle
+
     def format_meta_context(
         self,
         hero_name: str,
@@ -343,8 +607,9 @@ class MLBBMetaClient:
         parts = [f"\n=== LIVE META DATA FOR {hero_name.upper()} ==="]
 
         if rankings:
+            target = normalize_hero_name(hero_name)
             hero_rank = next(
-                (r for r in rankings if r["name"].lower() == hero_name.lower()), None
+                (r for r in rankings if normalize_hero_name(r["name"]) == target), None
             )
             if hero_rank:
                 parts.append(
@@ -376,10 +641,13 @@ class MLBBMetaClient:
 
 # Singleton
 _meta_client: Optional[MLBBMetaClient] = None
+_meta_client_lock = threading.Lock()
 
 
 def get_meta_client() -> MLBBMetaClient:
     global _meta_client
     if _meta_client is None:
-        _meta_client = MLBBMetaClient()
+        with _meta_client_lock:
+            if _meta_client is None:
+                _meta_client = MLBBMetaClient()
     return _meta_client
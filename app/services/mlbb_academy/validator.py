@@ -1,5 +1,7 @@
 import httpx
 import logging
+import orjson
+import re
 from typing import Optional
 from dataclasses import dataclass
 
@@ -25,6 +27,32 @@ MOOGOLD_FIXED_FIELDS = {
 }
 
 
+# Shared client so repeated validations reuse the moogold connection
+_client: Optional[httpx.AsyncClient] = None
+
+
+def _get_client() -> httpx.AsyncClient:
+    global _client
+    if _client is None or _client.is_closed:
+        _client = httpx.AsyncClient(
+            timeout=15.0,
+            headers=MOOGOLD_HEADERS,
+            transport=httpx.AsyncHTTPTransport(
+                http2=True,
+                limits=httpx.Limits(max_connections=20, max_keepalive_connections=10),
+            ),
+        )
+    return _client
+
+
+async def close_validation_client():
+    """Close the shared moogold client (application shutdown)."""
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
+
+
 @dataclass
 class ValidationResult:
     valid: bool
@@ -35,14 +63,13 @@ class ValidationResult:
     error: Optional[str] = None
 
 
+# One "key: value" pair per line of the moogold message
+MESSAGE_LINE_RE = re.compile(r"^[ \t]*([^:\n]*?)[ \t]*:[ \t]*(.*?)\s*$", re.M)
+
+
 def _parse_validation_message(message: str) -> dict:
     """Parse the newline-separated key:value message from moogold."""
-    result = {}
-    for line in message.strip().split("\n"):
-        if ":" in line:
-            key, value = line.split(":", 1)
-            result[key.strip()] = value.strip()
-    return result
+    return dict(MESSAGE_LINE_RE.findall(message))
 
 
 async def validate_mlbb_account(
@@ -60,14 +87,9 @@ async def validate_mlbb_account(
     }
 
     try:
-        async with httpx.AsyncClient(timeout=15.0) as client:
-            resp = await client.post(
-                MOOGOLD_VALIDATION_URL,
-                data=form_data,
-                headers=MOOGOLD_HEADERS,
-            )
-            resp.raise_for_status()
-            data = resp.json()
+        resp = await _get_client().post(MOOGOLD_VALIDATION_URL, data=form_data)
+        resp.raise_for_status()
+        data = orjson.loads(resp.content)
 
         if data.get("status") != "true":
             return ValidationResult(
@@ -98,7 +120,7 @@ async def validate_mlbb_account(
         )
 
     except httpx.HTTPStatusError as e:
-        logger.error(f"Validation HTTP error: {e}")
+        logger.error("Validation HTTP error: %s", e)
         return ValidationResult(
             valid=False,
             game_id=game_id,
@@ -106,7 +128,7 @@ async def validate_mlbb_account(
             error=f"Validation service error: {e.response.status_code}",
         )
     except Exception as e:
-        logger.error(f"Validation error: {e}")
+        logger.error("Validation error: %s", e)
         return ValidationResult(
             valid=False,
             game_id=game_id,
@@ -0,0 +1,91 @@
+"""Query embedding cache in front of the embedding model."""
+
+from collections import OrderedDict
+from threading import Lock
+from typing import List, Optional
+import hashlib
+import numpy as np
+from langchain_core.embeddings import Embeddings
+
+
+class QueryCachedEmbeddings(Embeddings):
+    """
+    Embeddings wrapper that memoizes embed_query results.
+
+    Vectors are kept as float16 (half the memory of float32, a fraction of a
+    Python float list) in an LRU keyed by a SHA-1 digest of the text.
+    Document embedding is passed straight through.
+    """
+
+    def __init__(self, underlying: Embeddings, max_size: int = 4096):
+        self.underlying = underlying
+        self.max_size = max_size
+        self._lock = Lock()
+        self._vectors: "OrderedDict[bytes, np.ndarray]" = OrderedDict()
+
+    @staticmethod
+    def _key(text: str) -> bytes:
+        return hashlib.sha1(text.encode()).digest()
+
+    def _get(self, key: bytes) -> Optional[List[float]]:
+        with self._lock:
+            vector = self._vectors.get(key)
+            if vector is None:
+                return None
+            self._vectors.move_to_end(key)
+        return vector.astype(np.float32).tolist()
+
+    def _put(self, key: bytes, vector: List[float]) -> List[float]:
+        """Store a vector; returns it at stored precision so hits and misses agree."""
+        stored = np.asarray(vector, dtype=np.float16)
+        with self._lock:
+            self._vectors[key] = stored
+            self._vectors.move_to_end(key)
+            while len(self._vectors) > self.max_size:
+                self._vectors.popitem(last=False)
+        return stored.astype(np.float32).tolist()
+
+    def embed_query(self, text: str) -> List[float]:
+        key = self._key(text)
+        vector = self._get(key)
+        if vector is None:
+            vector = self._put(key, self.underlying.embed_query(text))
+        return vector
+
+    async def aembed_query(self, text: str) -> List[float]:
+        key = self._key(text)
+        vector = self._get(key)
+        if vector is None:
+            vector = self._put(key, await self.underlying.aembed_query(text))
+        return vector
+
+    async def aembed_queries(self, texts: List[str]) -> List[List[float]]:
+        """
+        Embed several queries, encoding only the cache misses, in one call.
+
+        Misses go through the underlying aembed_documents, which for the
+        HuggingFace model embeds exactly as embed_query does.
+
+        Args:
+            texts: Query texts.
+
+        Returns:
+            One vector per text, in order.
+        """
+        keys = [self._key(text) for text in texts]
+        vectors = [self._get(key) for key in keys]
+        misses = [i for i, vector in enumerate(vectors) if vector is None]
+        if misses:
+            fresh = await self.underlying.aembed_documents([texts[i] for i in misses])
+            for i, vector in zip(misses, fresh):
+                vectors[i] = self._put(keys[i], vector)
+        return vectors
+
+    def embed_documents(self, texts: List[str]) -> List[List[float]]:
+        return self.underlying.embed_documents(texts)
+
+    async def aembed_documents(self, texts: List[str]) -> List[List[float]]:
+        return await self.underlying.aembed_documents(texts)
+
+    def __len__(self) -> int:
+        return len(self._vectors)
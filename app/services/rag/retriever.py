@@ -1,4 +1,6 @@
-from typing import List, Optional, Dict, Any
+from collections import OrderedDict
+from functools import lru_cache
+from typing import List, Optional, Dict, Any, Tuple
 from langchain_core.documents import Document
 from langchain_core.prompts import ChatPromptTemplate
 from langchain_core.runnables import RunnablePassthrough
@@ -7,6 +9,18 @@ from app.services.rag.vector_store import get_vector_store_manager
 from app.services.llm.provider import LLMFactory
 from app.models.schemas import LLMProvider
 
+# (metadata key, label) shown in each document header, in order
+METADATA_LABELS = (("source", "Source"), ("hero", "Hero"), ("category", "Category"))
+
+# Compiled RAG chains kept per retriever
+CHAIN_CACHE_MAX_ENTRIES = 32
+
+
+@lru_cache(maxsize=128)
+def _prompt_from_template(prompt_template: str) -> ChatPromptTemplate:
+    """Parse a prompt template once; ChatPromptTemplate is immutable so it can be shared."""
+    return ChatPromptTemplate.from_template(prompt_template)
+
 
 class MLBBRetriever:
     """RAG retriever for MLBB coaching knowledge."""
@@ -14,13 +28,16 @@ class MLBBRetriever:
     def __init__(self, llm_provider: Optional[LLMProvider] = None):
         self.vector_store_manager = get_vector_store_manager()
         self.llm_provider = llm_provider
+        # (prompt_template, temperature) -> chain, least recently used first
+        self._chain_cache: "OrderedDict[Tuple[str, float], Any]" = OrderedDict()
 
     def retrieve_context(
         self,
         query: str,
         k: int = 5,
         namespace: Optional[str] = None,
-        filter: Optional[Dict[str, Any]] = None
+        filter: Optional[Dict[str, Any]] = None,
+        query_vector: Optional[List[float]] = None
     ) -> List[Document]:
         """
         Retrieve relevant documents for a query.
@@ -30,6 +47,7 @@ class MLBBRetriever:
             k: Number of documents to retrieve.
             namespace: Optional namespace to search in.
             filter: Optional metadata filter.
+            query_vector: Precomputed embedding of the query.
 
         Returns:
             List of relevant documents.
@@ -38,7 +56,30 @@ class MLBBRetriever:
             query=query,
             k=k,
             namespace=namespace,
-            filter=filter
+            filter=filter,
+            query_vector=query_vector
+        )
+
+    async def aretrieve_context(
+        self,
+        query: str,
+        k: int = 5,
+        namespace: Optional[str] = None,
+        filter: Optional[Dict[str, Any]] = None,
+        query_vector: Optional[List[float]] = None
+    ) -> List[Document]:
+        """
+        Async variant of retrieve_context.
+
+        Goes through the manager's SearchBatcher, so identical concurrent
+        searches share one lookup and unembedded queries share one encoder call.
+        """
+        return await self.vector_store_manager.search_batcher.search(
+            query=query,
+            k=k,
+            namespace=namespace,
+            filter=filter,
+            query_vector=query_vector
         )
 
     def retrieve_with_scores(
@@ -58,27 +99,23 @@ class MLBBRetriever:
 
     def format_documents(self, documents: List[Document]) -> str:
         """Format documents into a context string."""
-        formatted_docs = []
-        for i, doc in enumerate(documents, 1):
-            content = doc.page_content
-            metadata = doc.metadata
-
-            # Add metadata context if available
-            source_info = []
-            if "source" in metadata:
-                source_info.append(f"Source: {metadata['source']}")
-            if "hero" in metadata:
-                source_info.append(f"Hero: {metadata['hero']}")
-            if "category" in metadata:
-                source_info.append(f"Category: {metadata['category']}")
-
-            header = f"\n--- Document {i} ---"
-            if source_info:
-                header += f"\n{', '.join(source_info)}"
-
-            formatted_docs.append(f"{header}\n{content}\n")
+        return "\n".join(
+            self._format_document(i, doc) for i, doc in enumerate(documents, 1)
+        )
 
-        return "\n".join(formatted_docs)
+    @staticmethod
+    def _format_document(index: int, doc: Document) -> str:
+        """Render one document with its source/hero/category header."""
+        metadata = doc.metadata
+        source_info = ", ".join(
+            f"{label}: {value}"
+            for key, label in METADATA_LABELS
+            if (value := metadata.get(key)) is not None
+        )
+        header = f"\n--- Document {index} ---"
+        if source_info:
+            header = f"{header}\n{source_info}"
+        return f"{header}\n{doc.page_content}\n"
 
     def create_rag_chain(
         self,
@@ -93,8 +130,14 @@ class MLBBRetriever:
             temperature: LLM temperature.
 
         Returns:
-            Runnable RAG chain.
+            Runnable RAG chain, reused for repeated (template, temperature) pairs.
         """
+        key = (prompt_template, temperature)
+        chain = self._chain_cache.get(key)
+        if chain is not None:
+            self._chain_cache.move_to_end(key)
+            return chain
+
         # Get LLM
         llm = LLMFactory.get_model(
             provider=self.llm_provider,
@@ -102,7 +145,7 @@ class MLBBRetriever:
         )
 
         # Create prompt
-        prompt = ChatPromptTemplate.from_template(prompt_template)
+        prompt = _prompt_from_template(prompt_template)
 
         # Define retrieval function
         def retrieve_and_format(question: str) -> str:
@@ -120,6 +163,9 @@ class MLBBRetriever:
             | StrOutputParser()
         )
 
+        self._chain_cache[key] = chain
+        while len(self._chain_cache) > CHAIN_CACHE_MAX_ENTRIES:
+            self._chain_cache.popitem(last=False)
         return chain
 
     def answer_question(
@@ -253,3 +299,24 @@ class StrategyRetriever(MLBBRetriever):
             namespace=self.namespace,
             filter=filter_dict if filter_dict else None
         )
+
+
+# Shared per provider so the retrieval and chain caches survive across requests
+@lru_cache(maxsize=8)
+def get_retriever(llm_provider: Optional[LLMProvider] = None) -> MLBBRetriever:
+    return MLBBRetriever(llm_provider)
+
+
+@lru_cache(maxsize=8)
+def get_hero_retriever(llm_provider: Optional[LLMProvider] = None) -> HeroRetriever:
+    return HeroRetriever(llm_provider)
+
+
+@lru_cache(maxsize=8)
+def get_build_retriever(llm_provider: Optional[LLMProvider] = None) -> BuildRetriever:
+    return BuildRetriever(llm_provider)
+
+
+@lru_cache(maxsize=8)
+def get_strategy_retriever(llm_provider: Optional[LLMProvider] = None) -> StrategyRetriever:
+    return StrategyRetriever(llm_provider)
@@ -0,0 +1,140 @@
+"""Coalescing of concurrent async vector searches."""
+
+from typing import Any, Dict, List, Optional, Set, Tuple
+import asyncio
+from langchain_core.documents import Document
+from app.services.rag.search_cache import SearchResultCache, get_search_cache
+
+# How long a search needing an embedding waits for others to share the encoder call
+SEARCH_BATCH_WINDOW_SECONDS = 0.02
+
+
+class SearchBatcher:
+    """
+    Front for VectorStoreManager.asimilarity_search used by concurrent callers.
+
+    Identical searches already in flight share one Pinecone query. Searches
+    that still need their query embedded are held for a short window so
+    everything arriving together is embedded in one encoder call; the
+    Pinecone lookups then run concurrently (Pinecone has no multi-vector
+    query). Searches that bring their own vector, or are already cached,
+    skip the window.
+    """
+
+    def __init__(self, manager: Any, window_seconds: float = SEARCH_BATCH_WINDOW_SECONDS):
+        self.manager = manager
+        self.window_seconds = window_seconds
+        self._cache = get_search_cache()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        # key -> future shared by every caller of an in-flight search
+        self._in_flight: Dict[bytes, asyncio.Future] = {}
+        # (key, query, k, namespace, filter) waiting for the next flush
+        self._pending: List[Tuple[bytes, str, int, Optional[str], Optional[Dict[str, Any]]]] = []
+        self._flush_handle: Optional[asyncio.TimerHandle] = None
+        # Strong references so running searches are not garbage collected
+        self._tasks: Set[asyncio.Task] = set()
+
+    async def search(
+        self,
+        query: str,
+        k: int,
+        namespace: Optional[str] = None,
+        filter: Optional[Dict[str, Any]] = None,
+        query_vector: Optional[List[float]] = None
+    ) -> List[Document]:
+        """
+        Search like asimilarity_search, sharing work with concurrent callers.
+
+        Args:
+            query: Search query.
+            k: Number of results to return.
+            namespace: Optional namespace to search in.
+            filter: Optional metadata filter.
+            query_vector: Precomputed embedding of the query.
+
+        Returns:
+            List of similar documents.
+        """
+        self._bind_loop()
+        key = SearchResultCache.make_key("search", query, k, namespace, filter)
+        future = self._in_flight.get(key)
+        if future is not None:
+            return await asyncio.shield(future)
+
+        docs = self._cache.get(key)
+        if docs is not None:
+            return docs
+
+        future = self._loop.create_future()
+        self._in_flight[key] = future
+        if query_vector is not None:
+            self._spawn(self._run(key, query, k, namespace, filter, query_vector))
+        else:
+            self._pending.append((key, query, k, namespace, filter))
+            if self._flush_handle is None:
+                self._flush_handle = self._loop.call_later(self.window_seconds, self._flush)
+        return await asyncio.shield(future)
+
+    def _bind_loop(self):
+        """Reset state when first used on a different event loop (e.g. per-test loops)."""
+        loop = asyncio.get_running_loop()
+        if loop is not self._loop:
+            self._loop = loop
+            self._in_flight = {}
+            self._pending = []
+            self._flush_handle = None
+            self._tasks = set()
+
+    def _spawn(self, coro):
+        task = self._loop.create_task(coro)
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    def _flush(self):
+        self._flush_handle = None
+        batch, self._pending = self._pending, []
+        self._spawn(self._run_batch(batch))
+
+    async def _run_batch(self, batch):
+        """Embed every distinct query in the window at once, then search concurrently."""
+        queries = list(dict.fromkeys(query for _, query, _, _, _ in batch))
+        vectors = None
+        try:
+            # Through the query cache, so repeated queries skip the encoder
+            vectors = dict(zip(queries, await self.manager.embeddings.aembed_queries(queries)))
+        except Exception as e:
+            for key, *_ in batch:
+                self._settle(key, exc=e)
+            return
+        finally:
+            if vectors is None:  # cancelled: release the keys
+                for key, *_ in batch:
+                    self._settle(key)
+        await asyncio.gather(*(
+            self._run(key, query, k, namespace, filter, vectors[query])
+            for key, query, k, namespace, filter in batch
+        ))
+
+    async def _run(self, key, query, k, namespace, filter, query_vector):
+        docs = exc = None
+        try:
+            docs = await self.manager.asimilarity_search(
+                query=query, k=k, namespace=namespace, filter=filter, query_vector=query_vector
+            )
+        except Exception as e:
+            exc = e
+        finally:
+            # Runs on cancellation too, so the key never stays in flight
+            self._settle(key, docs=docs, exc=exc)
+
+    def _settle(self, key: bytes, docs: Optional[List[Document]] = None, exc: Optional[BaseException] = None):
+        """Resolve a key's waiters; with neither docs nor exc the search was cancelled."""
+        future = self._in_flight.pop(key, None)
+        if future is None or future.done():
+            return
+        if exc is not None:
+            future.set_exception(exc)
+        elif docs is None:
+            future.cancel()
+        else:
+            future.set_result(docs)
@@ -0,0 +1,83 @@
+"""Exact-match cache for vector store search results."""
+
+from collections import OrderedDict
+from threading import Lock
+from typing import Any, Dict, Hashable, List, Optional
+import hashlib
+import time
+from app.core.config import get_settings
+
+
+class SearchResultCache:
+    """
+    TTL cache of search results with value-aware LRU eviction.
+
+    When full, the least recently used tenth of the entries are considered
+    and the one with the fewest hits is evicted, so a frequently asked query
+    survives a burst of one-off ones.
+    """
+
+    def __init__(self, ttl_seconds: float = 3600, max_size: int = 1024):
+        self.ttl_seconds = ttl_seconds
+        self.max_size = max_size
+        self._lock = Lock()
+        # key -> [value, expires_at, hits], least recently used first
+        self._entries: "OrderedDict[bytes, List[Any]]" = OrderedDict()
+
+    @staticmethod
+    def make_key(*parts: Hashable) -> bytes:
+        """Stable digest of the search arguments; repr() copes with nested filter dicts."""
+        return hashlib.blake2b(repr(parts).encode(), digest_size=16).digest()
+
+    def get(self, key: bytes) -> Optional[Any]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if entry[1] <= time.monotonic():
+                del self._entries[key]
+                return None
+            entry[2] += 1
+            self._entries.move_to_end(key)
+            return entry[0]
+
+    def set(self, key: bytes, value: Any):
+        with self._lock:
+            self._entries[key] = [value, time.monotonic() + self.ttl_seconds, 0]
+            self._entries.move_to_end(key)
+            if len(self._entries) > self.max_size:
+                self._evict()
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _evict(self):
+        """Drop the least-hit entry among the least recently used 10%."""
+        window = max(1, len(self._entries) // 10)
+        candidates = []
+        for key, entry in self._entries.items():
+            candidates.append((entry[2], key))
+            if len(candidates) == window:
+                break
+        # min() keeps the earliest (least recent) key among equal hit counts
+        _, victim = min(candidates, key=lambda c: c[0])
+        del self._entries[victim]
+
+
+_search_cache: Optional[SearchResultCache] = None
+
+
+def get_search_cache() -> SearchResultCache:
+    """Get the process-wide search result cache."""
+    global _search_cache
+    if _search_cache is None:
+        settings = get_settings()
+        _search_cache = SearchResultCache(
+            ttl_seconds=settings.SEARCH_CACHE_TTL_SECONDS,
+            max_size=settings.SEARCH_CACHE_SIZE,
+        )
+    return _search_cache
@@ -1,29 +1,68 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Optional, Dict, Any
 from langchain_community.embeddings import HuggingFaceEmbeddings
 from langchain_pinecone import PineconeVectorStore
 from langchain_core.documents import Document
+from langchain_core.embeddings import Embeddings
 from pinecone import Pinecone, ServerlessSpec
 from app.core.config import get_settings
+from app.services.rag.embedding_cache import QueryCachedEmbeddings
+from app.services.rag.search_batcher import SearchBatcher
+from app.services.rag.search_cache import get_search_cache
 import time
 
+# Concurrent Pinecone requests for batched upserts and searches
+PINECONE_WORKERS = 4
+# Index readiness polling: first delay, backoff factor, ceiling and give-up (seconds)
+INDEX_READY_POLL = (0.1, 1.5, 5.0, 120.0)
+
+
+def _detect_embedding_device() -> str:
+    """Pick the fastest available torch device for the embedding model."""
+    try:
+        import torch
+    except ImportError:
+        return "cpu"
+    if torch.cuda.is_available():
+        return "cuda"
+    if torch.backends.mps.is_available():
+        return "mps"
+    return "cpu"
+
 
 class VectorStoreManager:
     """Manages vector store operations for MLBB knowledge base."""
 
     def __init__(self):
         self.settings = get_settings()
+        # Read on every search; settings are fixed for the process lifetime
+        self._index_name = self.settings.PINECONE_INDEX_NAME
+        self._top_k = self.settings.RAG_TOP_K
+        self._score_threshold = self.settings.RAG_SCORE_THRESHOLD
         self._embeddings = None
         self._vector_store = None
         self._pinecone_client = None
+        self._search_cache = get_search_cache()
+        # Coalesces concurrent async searches; see SearchBatcher
+        self.search_batcher = SearchBatcher(self)
 
     @property
-    def embeddings(self) -> HuggingFaceEmbeddings:
-        """Get or create embeddings model."""
+    def embeddings(self) -> Embeddings:
+        """Get or create embeddings model, with repeated queries served from cache."""
         if self._embeddings is None:
-            self._embeddings = HuggingFaceEmbeddings(
+            device = self.settings.EMBEDDING_DEVICE or _detect_embedding_device()
+            model = HuggingFaceEmbeddings(
                 model_name=self.settings.EMBEDDING_MODEL,
-                model_kwargs={'device': 'cpu'},
-                encode_kwargs={'normalize_embeddings': True}
+                model_kwargs={'device': device},
+                encode_kwargs={
+                    'normalize_embeddings': True,
+                    'batch_size': self.settings.EMBEDDING_BATCH_SIZE,
+                    'show_progress_bar': False,
+                }
+            )
+            self._embeddings = QueryCachedEmbeddings(
+                model, max_size=self.settings.EMBEDDING_CACHE_SIZE
             )
         return self._embeddings
 
@@ -42,7 +81,7 @@ class VectorStoreManager:
             delete_if_exists: If True, delete existing index before creating.
         """
         pc = self.pinecone_client
-        index_name = self.settings.PINECONE_INDEX_NAME
+        index_name = self._index_name
 
         # Check if index exists
         existing_indexes = [index.name for index in pc.list_indexes()]
@@ -67,9 +106,14 @@ class VectorStoreManager:
             )
         )
 
-        # Wait for index to be ready
+        # Wait for index to be ready, polling quickly at first then backing off
+        delay, factor, max_delay, timeout = INDEX_READY_POLL
+        deadline = time.monotonic() + timeout
         while not pc.describe_index(index_name).status['ready']:
-            time.sleep(1)
+            if time.monotonic() >= deadline:
+                raise TimeoutError(f"Index {index_name} not ready after {timeout:.0f}s")
+            time.sleep(delay)
+            delay = min(delay * factor, max_delay)
 
         print(f"Index {index_name} is ready")
 
@@ -78,7 +122,7 @@ class VectorStoreManager:
         """Get or create vector store instance."""
         if self._vector_store is None:
             self._vector_store = PineconeVectorStore(
-                index_name=self.settings.PINECONE_INDEX_NAME,
+                index_name=self._index_name,
                 embedding=self.embeddings,
                 pinecone_api_key=self.settings.PINECONE_API_KEY
             )
@@ -87,29 +131,53 @@ class VectorStoreManager:
     def add_documents(
         self,
         documents: List[Document],
-        namespace: Optional[str] = None
+        namespace: Optional[str] = None,
+        batch_size: int = 100
     ) -> List[str]:
         """
         Add documents to vector store.
 
+        Documents are embedded and upserted batch_size at a time, so memory
+        stays bounded. Batches run on a small thread pool so one batch's
+        upsert round-trip overlaps the next batch's embedding.
+
         Args:
             documents: List of documents to add.
             namespace: Optional namespace for organizing documents.
+            batch_size: Documents per embed + upsert round.
 
         Returns:
             List of document IDs.
         """
-        return self.vector_store.add_documents(
-            documents=documents,
-            namespace=namespace
-        )
+        batches = [
+            documents[start:start + batch_size]
+            for start in range(0, len(documents), batch_size)
+        ]
+        if not batches:
+            return []
+
+        # Resolve here: a first access from several pool threads would load the model per thread
+        store = self.vector_store
+
+        def add_batch(batch: List[Document]) -> List[str]:
+            return store.add_documents(
+                documents=batch,
+                namespace=namespace,
+                batch_size=batch_size,
+                embedding_chunk_size=batch_size
+            )
+
+        # map keeps the returned IDs in document order
+        with ThreadPoolExecutor(max_workers=min(PINECONE_WORKERS, len(batches))) as pool:
+            return [doc_id for ids in pool.map(add_batch, batches) for doc_id in ids]
 
     def similarity_search(
         self,
         query: str,
         k: int = None,
         namespace: Optional[str] = None,
-        filter: Optional[Dict[str, Any]] = None
+        filter: Optional[Dict[str, Any]] = None,
+        query_vector: Optional[List[float]] = None
     ) -> List[Document]:
         """
         Search for similar documents.
@@ -119,18 +187,118 @@ class VectorStoreManager:
             k: Number of results to return.
             namespace: Optional namespace to search in.
             filter: Optional metadata filter.
+            query_vector: Precomputed embedding of the query; skips embedding it again.
 
         Returns:
-            List of similar documents.
+            List of similar documents. Repeated searches are served from the
+            search result cache for SEARCH_CACHE_TTL_SECONDS.
         """
-        k = k or self.settings.RAG_TOP_K
+        k = k or self._top_k
+        key = self._search_cache.make_key("search", query, k, namespace, filter)
+        docs = self._search_cache.get(key)
+        if docs is not None:
+            return docs
 
-        return self.vector_store.similarity_search(
-            query=query,
-            k=k,
-            namespace=namespace,
-            filter=filter
-        )
+        if query_vector is not None:
+            docs = self.vector_store.similarity_search_by_vector(
+                query_vector,
+                k=k,
+                namespace=namespace,
+                filter=filter
+            )
+        else:
+            docs = self.vector_store.similarity_search(
+                query=query,
+                k=k,
+                namespace=namespace,
+                filter=filter
+            )
+        self._search_cache.set(key, docs)
+        return docs
+
+    async def asimilarity_search(
+        self,
+        query: str,
+        k: int = None,
+        namespace: Optional[str] = None,
+        filter: Optional[Dict[str, Any]] = None,
+        query_vector: Optional[List[float]] = None
+    ) -> List[Document]:
+        """Async variant of similarity_search."""
+        k = k or self._top_k
+        key = self._search_cache.make_key("search", query, k, namespace, filter)
+        docs = self._search_cache.get(key)
+        if docs is not None:
+            return docs
+
+        if query_vector is not None:
+            docs = await self.vector_store.asimilarity_search_by_vector(
+                query_vector,
+                k=k,
+                namespace=namespace,
+                filter=filter
+            )
+        else:
+            docs = await self.vector_store.asimilarity_search(
+                query=query,
+                k=k,
+                namespace=namespace,
+                filter=filter
+            )
+        self._search_cache.set(key, docs)
+        return docs
+
+    def similarity_search_batch(
+        self,
+        queries: List[str],
+        k: int = None,
+        namespace: Optional[str] = None,
+        filter: Optional[Dict[str, Any]] = None
+    ) -> List[List[Document]]:
+        """
+        Search for several queries at once.
+
+        All queries are embedded in one batched encoder pass, then the
+        Pinecone lookups run concurrently (Pinecone has no multi-vector query).
+
+        Args:
+            queries: Search queries.
+            k: Number of results per query.
+            namespace: Optional namespace to search in.
+            filter: Optional metadata filter applied to every query.
+
+        Returns:
+            One list of similar documents per query, in query order.
+        """
+        if not queries:
+            return []
+        vectors = self.embeddings.embed_documents(queries)
+
+        def search(query: str, vector: List[float]) -> List[Document]:
+            return self.similarity_search(
+                query=query, k=k, namespace=namespace, filter=filter, query_vector=vector
+            )
+
+        with ThreadPoolExecutor(max_workers=min(PINECONE_WORKERS, len(vectors))) as pool:
+            return list(pool.map(search, queries, vectors))
+
+    async def asimilarity_search_batch(
+        self,
+        queries: List[str],
+        k: int = None,
+        namespace: Optional[str] = None,
+        filter: Optional[Dict[str, Any]] = None
+    ) -> List[List[Document]]:
+        """Async variant of similarity_search_batch."""
+        if not queries:
+            return []
+        vectors = await self.embeddings.aembed_queries(queries)
+        return list(await asyncio.gather(*(
+            self.asimilarity_search(
+                query=query, k=k, namespace=namespace, filter=filter, query_vector=vector
+            )
+            for query, vector in zip(queries, vectors)
+        )))
 
     def similarity_search_with_score(
         self,
@@ -151,22 +319,24 @@ class VectorStoreManager:
         Returns:
             List of (document, score) tuples.
         """
-        k = k or self.settings.RAG_TOP_K
-
-        results = self.vector_store.similarity_search_with_score(
-            query=query,
-            k=k,
-            namespace=namespace,
-            filter=filter
-        )
+        k = k or self._top_k
+        key = self._search_cache.make_key("scored", query, k, namespace, filter)
+        results = self._search_cache.get(key)
+        if results is None:
+            results = self.vector_store.similarity_search_with_score(
+                query=query,
+                k=k,
+                namespace=namespace,
+                filter=filter
+            )
+            self._search_cache.set(key, results)
 
         # Filter by score threshold
-        threshold = self.settings.RAG_SCORE_THRESHOLD
-        return [(doc, score) for doc, score in results if score >= threshold]
+        return [(doc, score) for doc, score in results if score >= self._score_threshold]
 
     def delete_namespace(self, namespace: str):
         """Delete all documents in a namespace."""
-        index = self.pinecone_client.Index(self.settings.PINECONE_INDEX_NAME)
+        index = self.pinecone_client.Index(self._index_name)
         index.delete(delete_all=True, namespace=namespace)
 
 
@@ -1,10 +1,26 @@
 from typing import Optional, List, Dict, Any
 from datetime import datetime, timedelta
 from langchain_core.messages import BaseMessage, HumanMessage, AIMessage
-import json
-import redis
+import orjson
+import re
+import redis.asyncio as aioredis
 from app.core.config import get_settings
 
+# Keyword -> (context field, value) for get_user_context
+CONTEXT_KEYWORDS = {
+    **{hero: ("mentioned_heroes", hero.capitalize())
+       for hero in ("layla", "miya", "moskov", "granger", "bruno")},
+    "marksman": ("mentioned_roles", "Marksman"),
+    "mm": ("mentioned_roles", "Marksman"),
+}
+# All keywords in one alternation so each message is scanned once
+CONTEXT_KEYWORD_RE = re.compile(
+    "|".join(re.escape(k) for k in sorted(CONTEXT_KEYWORDS, key=len, reverse=True))
+)
+
+# Stored message type name -> class restored by _deserialize_messages
+MESSAGE_CLASSES = {"HumanMessage": HumanMessage, "AIMessage": AIMessage}
+
 
 class SessionManager:
     """Manages user sessions and conversation history."""
@@ -13,35 +29,51 @@ class SessionManager:
         self.settings = get_settings()
         self._redis_client = None
         self._use_redis = bool(self.settings.REDIS_HOST)
+        self._max_history = self.settings.MAX_CONVERSATION_HISTORY
 
         # In-memory fallback
         self._memory_store: Dict[str, List[BaseMessage]] = {}
 
-    @property
-    def redis_client(self) -> Optional[redis.Redis]:
-        """Get or create Redis client."""
+    async def redis_client(self) -> Optional[aioredis.Redis]:
+        """Get or create the pooled async Redis client; None when Redis is unavailable."""
         if not self._use_redis:
             return None
 
         if self._redis_client is None:
+            client = aioredis.Redis(connection_pool=aioredis.ConnectionPool(
+                host=self.settings.REDIS_HOST,
+                port=self.settings.REDIS_PORT,
+                db=self.settings.REDIS_DB,
+                password=self.settings.REDIS_PASSWORD,
+                decode_responses=True,
+                max_connections=50,
+                socket_keepalive=True,
+                health_check_interval=30
+            ))
             try:
-                self._redis_client = redis.Redis(
-                    host=self.settings.REDIS_HOST,
-                    port=self.settings.REDIS_PORT,
-                    db=self.settings.REDIS_DB,
-                    password=self.settings.REDIS_PASSWORD,
-                    decode_responses=True
-                )
                 # Test connection
-                self._redis_client.ping()
+                await client.ping()
             except Exception as e:
                 print(f"Redis connection failed: {e}. Using in-memory storage.")
                 self._use_redis = False
+                await client.aclose()
                 return None
+            self._redis_client = client
 
         return self._redis_client
 
-    def get_session(self, session_id: str) -> List[BaseMessage]:
+    async def aclose(self):
+        """Close the Redis connection pool."""
+        if self._redis_client is not None:
+            await self._redis_client.aclose()
+            self._redis_client = None
+
+    @staticmethod
+    def _session_key(session_id: str) -> str:
+        # Redis list of JSON messages, oldest first
+        return f"session:{session_id}:messages"
+
+    async def get_session(self, session_id: str) -> List[BaseMessage]:
         """
         Get conversation history for a session.
 
@@ -51,19 +83,19 @@ class SessionManager:
         Returns:
             List of conversation messages.
         """
-        if self._use_redis and self.redis_client:
+        client = await self.redis_client()
+        if client:
             try:
-                data = self.redis_client.get(f"session:{session_id}")
+                data = await client.lrange(self._session_key(session_id), 0, -1)
                 if data:
-                    messages_data = json.loads(data)
-                    return self._deserialize_messages(messages_data)
+                    return self._deserialize_messages([orjson.loads(item) for item in data])
             except Exception as e:
                 print(f"Redis get failed: {e}")
 
         # Fallback to memory
         return self._memory_store.get(session_id, [])
 
-    def save_session(
+    async def save_session(
         self,
         session_id: str,
         messages: List[BaseMessage],
@@ -78,18 +110,22 @@ class SessionManager:
             ttl_hours: Time to live in hours.
         """
         # Limit history size
-        max_history = self.settings.MAX_CONVERSATION_HISTORY
+        max_history = self._max_history
         if len(messages) > max_history:
             messages = messages[-max_history:]
 
-        if self._use_redis and self.redis_client:
+        client = await self.redis_client()
+        if client:
             try:
-                messages_data = self._serialize_messages(messages)
-                self.redis_client.setex(
-                    f"session:{session_id}",
-                    timedelta(hours=ttl_hours),
-                    json.dumps(messages_data)
-                )
+                key = self._session_key(session_id)
+                pipe = client.pipeline(transaction=False)
+                pipe.delete(key)
+                if messages:
+                    pipe.rpush(key, *(
+                        orjson.dumps(msg) for msg in self._serialize_messages(messages)
+                    ))
+                    pipe.expire(key, timedelta(hours=ttl_hours))
+                await pipe.execute()
                 return
             except Exception as e:
                 print(f"Redis save failed: {e}")
@@ -97,28 +133,52 @@ class SessionManager:
         # Fallback to memory
         self._memory_store[session_id] = messages
 
-    def delete_session(self, session_id: str):
+    async def delete_session(self, session_id: str):
         """Delete a session."""
-        if self._use_redis and self.redis_client:
+        client = await self.redis_client()
+        if client:
             try:
-                self.redis_client.delete(f"session:{session_id}")
+                await client.delete(self._session_key(session_id))
             except Exception:
                 pass
 
         # Also delete from memory
         self._memory_store.pop(session_id, None)
 
-    def add_message(
+    async def add_message(
         self,
         session_id: str,
-        message: BaseMessage
+        message: BaseMessage,
+        ttl_hours: int = 24
     ):
-        """Add a message to session history."""
-        messages = self.get_session(session_id)
+        """
+        Add a message to session history.
+
+        With Redis only the new message is sent: the list is appended to,
+        trimmed to MAX_CONVERSATION_HISTORY and its TTL refreshed in one
+        pipelined round trip.
+        """
+        max_history = self._max_history
+
+        client = await self.redis_client()
+        if client:
+            try:
+                key = self._session_key(session_id)
+                pipe = client.pipeline(transaction=False)
+                pipe.rpush(key, orjson.dumps(self._serialize_messages([message])[0]))
+                pipe.ltrim(key, -max_history, -1)
+                pipe.expire(key, timedelta(hours=ttl_hours))
+                await pipe.execute()
+                return
+            except Exception as e:
+                print(f"Redis append failed: {e}")
+
+        # Fallback to memory
+        messages = self._memory_store.setdefault(session_id, [])
         messages.append(message)
-        self.save_session(session_id, messages)
+        del messages[:-max_history]
 
-    def get_user_context(self, session_id: str) -> Dict[str, Any]:
+    async def get_user_context(self, session_id: str) -> Dict[str, Any]:
         """
         Extract user context from conversation history.
 
@@ -128,7 +188,7 @@ class SessionManager:
         Returns:
             Dictionary with user preferences and context.
         """
-        messages = self.get_session(session_id)
+        messages = await self.get_session(session_id)
 
         context = {
             "message_count": len(messages),
@@ -137,50 +197,34 @@ class SessionManager:
         }
 
         # Extract mentioned heroes, roles, etc.
-        mentioned_heroes = set()
-        mentioned_roles = set()
+        mentioned = {"mentioned_heroes": set(), "mentioned_roles": set()}
 
         for msg in messages:
             if isinstance(msg, HumanMessage):
-                content = msg.content.lower()
                 # Simple keyword extraction (can be enhanced with NLP)
-                if any(hero in content for hero in ["layla", "miya", "moskov", "granger", "bruno"]):
-                    for hero in ["layla", "miya", "moskov", "granger", "bruno"]:
-                        if hero in content:
-                            mentioned_heroes.add(hero.capitalize())
+                for match in CONTEXT_KEYWORD_RE.finditer(msg.content.lower()):
+                    field, value = CONTEXT_KEYWORDS[match.group()]
+                    mentioned[field].add(value)
 
-                if "marksman" in content or "mm" in content:
-                    mentioned_roles.add("Marksman")
-
-        context["mentioned_heroes"] = list(mentioned_heroes)
-        context["mentioned_roles"] = list(mentioned_roles)
+        context["mentioned_heroes"] = list(mentioned["mentioned_heroes"])
+        context["mentioned_roles"] = list(mentioned["mentioned_roles"])
 
         return context
 
     def _serialize_messages(self, messages: List[BaseMessage]) -> List[Dict]:
         """Serialize messages for storage."""
-        serialized = []
-        for msg in messages:
-            msg_dict = {
-                "type": msg.__class__.__name__,
-                "content": msg.content
-            }
-            serialized.append(msg_dict)
-        return serialized
+        return [
+            {"type": msg.__class__.__name__, "content": msg.content}
+            for msg in messages
+        ]
 
     def _deserialize_messages(self, messages_data: List[Dict]) -> List[BaseMessage]:
-        """Deserialize messages from storage."""
-        messages = []
-        for msg_data in messages_data:
-            msg_type = msg_data["type"]
-            content = msg_data["content"]
-
-            if msg_type == "HumanMessage":
-                messages.append(HumanMessage(content=content))
-            elif msg_type == "AIMessage":
-                messages.append(AIMessage(content=content))
-
-        return messages
+        """Deserialize messages from storage; unknown types are skipped."""
+        return [
+            MESSAGE_CLASSES[msg_data["type"]](content=msg_data["content"])
+            for msg_data in messages_data
+            if msg_data["type"] in MESSAGE_CLASSES
+        ]
 
 
 # Global instance
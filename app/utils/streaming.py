@@ -0,0 +1,64 @@
+"""Helpers for streaming responses."""
+
+from typing import AsyncIterator
+import asyncio
+
+# Sentinel marking the end of the source stream
+_DONE = object()
+
+
+async def coalesce(chunks: AsyncIterator[str], interval: float = 0.05) -> AsyncIterator[str]:
+    """
+    Merge chunks that arrive within a short window into one.
+
+    The first chunk of each window is held for at most `interval` seconds
+    while later chunks are appended, so per-token streams go out as a few
+    larger writes instead of one frame per token.
+
+    Args:
+        chunks: Source stream of text chunks.
+        interval: Flush window in seconds.
+
+    Yields:
+        Concatenated chunks.
+    """
+    queue: asyncio.Queue = asyncio.Queue()
+
+    async def pump():
+        try:
+            async for chunk in chunks:
+                await queue.put(chunk)
+        except Exception as e:
+            await queue.put(e)
+        finally:
+            await queue.put(_DONE)
+
+    loop = asyncio.get_running_loop()
+    task = asyncio.create_task(pump())
+    try:
+        finished = False
+        while not finished:
+            item = await queue.get()
+            deadline = loop.time() + interval
+            buffer = []
+            while True:
+                if item is _DONE:
+                    finished = True
+                    break
+                if isinstance(item, Exception):
+                    # Deliver what already arrived before surfacing the error
+                    if buffer:
+                        yield "".join(buffer)
+                    raise item
+                buffer.append(item)
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    item = await asyncio.wait_for(queue.get(), timeout)
+                except asyncio.TimeoutError:
+                    break
+            if buffer:
+                yield "".join(buffer)
+    finally:
+        task.cancel()
@@ -3,6 +3,12 @@ import { useTranslation } from 'react-i18next';
 import { Link } from 'react-router-dom';
 import api from '../lib/api';
 
+// The API only keeps history for requests that carry a session id
+const newSessionId = () =>
+  typeof crypto.randomUUID === 'function'
+    ? crypto.randomUUID()
+    : `${Date.now().toString(36)}-${Math.random().toString(36).slice(2)}`;
+
 interface Message {
   role: 'user' | 'assistant';
   content: string;
@@ -15,7 +21,7 @@ export default function Chat() {
   const [input, setInput] = useState('');
   const [loading, setLoading] = useState(false);
   const [provider, setProvider] = useState('gemini');
-  const [sessionId, setSessionId] = useState<string | null>(null);
+  const [sessionId, setSessionId] = useState<string>(newSessionId);
   const chatRef = useRef<HTMLDivElement>(null);
 
   useEffect(() => {
@@ -3,9 +3,11 @@ import os
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
 import json
+from itertools import islice
 from pathlib import Path
+from typing import Iterable, Iterator
 from langchain_core.documents import Document
-from app.services.rag.vector_store import get_vector_store_manager
+from app.services.rag.vector_store import PINECONE_WORKERS, get_vector_store_manager
 from app.core.config import get_settings
 
 
@@ -15,9 +17,13 @@ def load_json_file(file_path: Path) -> list:
         return json.load(f)
 
 
-def create_hero_documents(heroes_data: list) -> list[Document]:
-    """Create documents from hero data."""
-    documents = []
+def _bullets(lines) -> str:
+    """Render items as a "- " bulleted list, one per line."""
+    return "\n".join(["- " + str(line) for line in lines])
+
+
+def create_hero_documents(heroes_data: list) -> Iterator[Document]:
+    """Yield documents from hero data."""
 
     for hero in heroes_data:
         # Main hero document
@@ -32,10 +38,10 @@ Description:
 {hero['description']}
 
 Strengths:
-{chr(10).join(f'- {s}' for s in hero['strengths'])}
+{_bullets(hero['strengths'])}
 
 Weaknesses:
-{chr(10).join(f'- {w}' for w in hero['weaknesses'])}
+{_bullets(hero['weaknesses'])}
 
 Counters (Good Against):
 {', '.join(hero['counters']) if hero['counters'] else 'General effectiveness'}
@@ -44,7 +50,7 @@ Countered By (Weak Against):
 {', '.join(hero['countered_by']) if hero['countered_by'] else 'Standard threats'}
 
 Gameplay Tips:
-{chr(10).join(f'- {tip}' for tip in hero.get('gameplay_tips', []))}
+{_bullets(hero.get('gameplay_tips', []))}
 
 Recommended Build:
 Core Items: {', '.join(hero.get('build_core', []))}
@@ -62,10 +68,12 @@ Battle Spell: {hero.get('battle_spell', 'N/A')}
                 "type": "hero_guide"
             }
         )
-        documents.append(doc)
+        yield doc
 
         # Create specific documents for matchups
         if hero['countered_by']:
+            # Same for every counter, so render it once per hero
+            top_weaknesses = _bullets(hero['weaknesses'][:3])
             for counter in hero['countered_by']:
                 matchup_content = f"""
 Matchup: {hero['name']} vs {counter}
@@ -74,7 +82,7 @@ Difficulty: Unfavorable for {hero['name']}
 {hero['name']} is countered by {counter}.
 
 {hero['name']} weaknesses that {counter} exploits:
-{chr(10).join(f'- {w}' for w in hero['weaknesses'][:3])}
+{top_weaknesses}
 
 Key tips when playing {hero['name']} against {counter}:
 - Play extremely safe and stay near your tower
@@ -94,14 +102,11 @@ Key tips when playing {hero['name']} against {counter}:
                         "difficulty": "hard"
                     }
                 )
-                documents.append(matchup_doc)
-
-    return documents
+                yield matchup_doc
 
 
-def create_item_documents(items_data: list) -> list[Document]:
-    """Create documents from item data."""
-    documents = []
+def create_item_documents(items_data: list) -> Iterator[Document]:
+    """Yield documents from item data."""
 
     for item in items_data:
         content = f"""
@@ -110,13 +115,13 @@ Category: {item['category']}
 Cost: {item['cost']} gold
 
 Stats:
-{chr(10).join(f'- {k}: {v}' for k, v in item['stats'].items())}
+{_bullets(f'{k}: {v}' for k, v in item['stats'].items())}
 
 {f"Passive: {item['passive']}" if item.get('passive') else ""}
 {f"Active: {item['active']}" if item.get('active') else ""}
 
 Good For:
-{chr(10).join(f'- {hero}' for hero in item.get('good_for', []))}
+{_bullets(item.get('good_for', []))}
 
 Description: {item.get('description', '')}
 """
@@ -131,14 +136,11 @@ Description: {item.get('description', '')}
                 "type": "item_guide"
             }
         )
-        documents.append(doc)
+        yield doc
 
-    return documents
 
-
-def create_strategy_documents(strategies_data: list) -> list[Document]:
-    """Create documents from strategy data."""
-    documents = []
+def create_strategy_documents(strategies_data: list) -> Iterator[Document]:
+    """Yield documents from strategy data."""
 
     for strategy in strategies_data:
         content = f"""
@@ -159,9 +161,20 @@ Role: {strategy['role']}
                 "type": "strategy_guide"
             }
         )
-        documents.append(doc)
+        yield doc
+
 
-    return documents
+def ingest_documents(
+    vsm, documents: Iterable[Document], namespace: str, batch_size: int = 100
+) -> int:
+    """Upsert documents batch by batch as they are generated; returns the count."""
+    documents = iter(documents)
+    total = 0
+    # Enough batches per call to keep every upsert worker busy
+    while batch := list(islice(documents, PINECONE_WORKERS * batch_size)):
+        vsm.add_documents(batch, namespace=namespace, batch_size=batch_size)
+        total += len(batch)
+    return total
 
 
 def ingest_all_data():
@@ -178,38 +191,28 @@ def ingest_all_data():
     # Define data paths
     data_dir = Path(__file__).parent.parent / "app" / "data"
 
-    # Load and ingest heroes
-    print("\nIngesting hero data...")
-    heroes_file = data_dir / "heroes" / "marksman_heroes.json"
-    if heroes_file.exists():
-        heroes_data = load_json_file(heroes_file)
-        hero_docs = create_hero_documents(heroes_data)
-        vsm.add_documents(hero_docs, namespace="heroes")
-        print(f"✓ Ingested {len(hero_docs)} hero documents")
-
-    # Load and ingest items
-    print("\nIngesting item data...")
-    items_file = data_dir / "items" / "marksman_items.json"
-    if items_file.exists():
-        items_data = load_json_file(items_file)
-        item_docs = create_item_documents(items_data)
-        vsm.add_documents(item_docs, namespace="builds")
-        print(f"✓ Ingested {len(item_docs)} item documents")
-
-    # Load and ingest strategies
-    print("\nIngesting strategy data...")
-    strategies_file = data_dir / "strategies" / "marksman_strategies.json"
-    if strategies_file.exists():
-        strategies_data = load_json_file(strategies_file)
-        strategy_docs = create_strategy_documents(strategies_data)
-        vsm.add_documents(strategy_docs, namespace="strategies")
-        print(f"✓ Ingested {len(strategy_docs)} strategy documents")
+    # (label, file, document factory, namespace)
+    sources = [
+        ("hero", data_dir / "heroes" / "marksman_heroes.json", create_hero_documents, "heroes"),
+        ("item", data_dir / "items" / "marksman_items.json", create_item_documents, "builds"),
+        ("strategy", data_dir / "strategies" / "marksman_strategies.json",
+         create_strategy_documents, "strategies"),
+    ]
+
+    totals = {}
+    for label, data_file, create_documents, namespace in sources:
+        print(f"\nIngesting {label} data...")
+        totals[namespace] = 0
+        if data_file.exists():
+            documents = create_documents(load_json_file(data_file))
+            totals[namespace] = ingest_documents(vsm, documents, namespace)
+            print(f"✓ Ingested {totals[namespace]} {label} documents")
 
     print("\n✅ Data ingestion complete!")
     print(f"\nTotal documents ingested:")
-    print(f"- Heroes namespace: {len(hero_docs) if 'hero_docs' in locals() else 0}")
-    print(f"- Builds namespace: {len(item_docs) if 'item_docs' in locals() else 0}")
-    print(f"- Strategies namespace: {len(strategy_docs) if 'strategy_docs' in locals() else 0}")
+    print(f"- Heroes namespace: {totals['heroes']}")
+    print(f"- Builds namespace: {totals['builds']}")
+    print(f"- Strategies namespace: {totals['strategies']}")
 
 
 if __name__ == "__main__":
@@ -7,18 +7,24 @@ import sys
 import os
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
+from concurrent.futures import ThreadPoolExecutor
 import requests
+from requests.adapters import HTTPAdapter
 import json
 
 
 API_BASE = "http://localhost:8000"
 
+# One keep-alive connection pool for every request in the script
+SESSION = requests.Session()
+SESSION.mount("http://", HTTPAdapter(pool_connections=10, pool_maxsize=10))
+
 
 def test_health():
     """Test health endpoint."""
     print("Testing health endpoint...")
     try:
-        response = requests.get(f"{API_BASE}/health")
+        response = SESSION.get(f"{API_BASE}/health")
         if response.status_code == 200:
             print("✓ Health check passed")
             print(json.dumps(response.json(), indent=2))
@@ -38,10 +44,11 @@ def test_chat():
         "How do I play Moskov vs Natalia?"
     ]
 
-    for message in test_messages:
-        print(f"\nUser: {message}")
+    def post_one(message: str) -> str:
+        # Output is collected and printed in order once all replies are in
+        lines = [f"\nUser: {message}"]
         try:
-            response = requests.post(
+            response = SESSION.post(
                 f"{API_BASE}/api/chat",
                 json={
                     "message": message,
@@ -51,15 +58,20 @@ def test_chat():
 
             if response.status_code == 200:
                 data = response.json()
-                print(f"Assistant: {data['response'][:200]}...")
+                lines.append(f"Assistant: {data['response'][:200]}...")
                 if data.get('suggestions'):
-                    print(f"Suggestions: {data['suggestions']}")
+                    lines.append(f"Suggestions: {data['suggestions']}")
             else:
-                print(f"✗ Error: {response.status_code}")
-                print(response.text)
+                lines.append(f"✗ Error: {response.status_code}")
+                lines.append(response.text)
 
         except Exception as e:
-            print(f"✗ Error: {e}")
+            lines.append(f"✗ Error: {e}")
+        return "\n".join(lines)
+
+    with ThreadPoolExecutor(max_workers=len(test_messages)) as pool:
+        for output in pool.map(post_one, test_messages):
+            print(output)
 
     print()
 
@@ -68,7 +80,7 @@ def test_providers():
     """Test available providers endpoint."""
     print("Testing providers endpoint...")
     try:
-        response = requests.get(f"{API_BASE}/api/providers")
+        response = SESSION.get(f"{API_BASE}/api/providers")
         if response.status_code == 200:
             providers = response.json()
             print(f"✓ Available providers: {providers}")
@@ -83,7 +95,7 @@ def test_heroes():
     """Test heroes list endpoint."""
     print("Testing heroes endpoint...")
     try:
-        response = requests.get(f"{API_BASE}/api/heroes")
+        response = SESSION.get(f"{API_BASE}/api/heroes")
         if response.status_code == 200:
             heroes = response.json()
             print(f"✓ Available heroes: {heroes}")
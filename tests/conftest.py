@@ -1,3 +1,53 @@
 import pytest
+import pytest_asyncio
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession
+from sqlalchemy.pool import NullPool
+from app.core.database import Base
+import app.models.db  # noqa: F401 — registers all models with Base
 
 pytest_plugins = []
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def engine(tmp_path_factory):
+    """Engine over a schema created once per test run.
+
+    A file database with NullPool rather than :memory:, so each test opens
+    its own connection on its own event loop and still sees the schema.
+    """
+    db_path = tmp_path_factory.mktemp("db") / "test.db"
+    engine = create_async_engine(f"sqlite+aiosqlite:///{db_path}", poolclass=NullPool)
+
+    # pysqlite defers BEGIN, which breaks SAVEPOINT; take over transaction control
+    @event.listens_for(engine.sync_engine, "connect")
+    def _disable_implicit_begin(dbapi_connection, connection_record):
+        dbapi_connection.isolation_level = None
+
+    @event.listens_for(engine.sync_engine, "begin")
+    def _emit_begin(conn):
+        conn.exec_driver_sql("BEGIN")
+
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    yield engine
+    await engine.dispose()
+
+
+@pytest_asyncio.fixture
+async def db_session(engine):
+    """Session inside a transaction that is rolled back after the test.
+
+    Commits made by the code under test only release a savepoint, so every
+    test starts from the same empty tables.
+    """
+    async with engine.connect() as conn:
+        trans = await conn.begin()
+        session = AsyncSession(
+            bind=conn, expire_on_commit=False, join_transaction_mode="create_savepoint"
+        )
+        try:
+            yield session
+        finally:
+            await session.close()
+            await trans.rollback()
@@ -1,26 +1,18 @@
 import pytest
 import pytest_asyncio
 from httpx import AsyncClient, ASGITransport
-from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession, async_sessionmaker
-from app.core.database import Base, get_db
+from app.core.database import get_db
 from app.main import app
 
 
 @pytest_asyncio.fixture
-async def test_db():
-    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
-    async with engine.begin() as conn:
-        await conn.run_sync(Base.metadata.create_all)
-    session_factory = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
-
+async def test_db(db_session):
     async def override_get_db():
-        async with session_factory() as session:
-            yield session
+        yield db_session
 
     app.dependency_overrides[get_db] = override_get_db
     yield
     app.dependency_overrides.clear()
-    await engine.dispose()
 
 
 @pytest_asyncio.fixture
@@ -0,0 +1,40 @@
+from langgraph.checkpoint.base import empty_checkpoint
+from app.services.langgraph import checkpointer as cp
+from app.services.langgraph.checkpointer import BoundedMemorySaver
+
+
+def _put(saver, thread_id):
+    config = {"configurable": {"thread_id": thread_id, "checkpoint_ns": ""}}
+    saver.put(config, empty_checkpoint(), {}, {})
+
+
+def _get(saver, thread_id):
+    return saver.get_tuple({"configurable": {"thread_id": thread_id, "checkpoint_ns": ""}})
+
+
+def test_least_recently_used_threads_are_dropped():
+    saver = BoundedMemorySaver(max_threads=10)
+    for i in range(10):
+        _put(saver, f"t{i}")
+    _put(saver, "t0")  # refresh t0
+    _put(saver, "t10")
+
+    # Over capacity drops the oldest tenth plus the overflow in one pass
+    assert saver.thread_count == 9
+    assert _get(saver, "t1") is None and _get(saver, "t2") is None
+    assert _get(saver, "t0") is not None
+    assert _get(saver, "t10") is not None
+
+
+def test_idle_threads_expire(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(cp.time, "monotonic", lambda: now[0])
+    saver = BoundedMemorySaver(ttl_seconds=60)
+    _put(saver, "old")
+    now[0] += 30
+    _put(saver, "new")
+    now[0] += 40
+
+    assert _get(saver, "old") is None
+    assert _get(saver, "new") is not None
+    assert saver.thread_count == 1
@@ -0,0 +1,112 @@
+import asyncio
+import pytest
+from langchain_core.documents import Document
+from langchain_core.language_models.fake_chat_models import FakeListChatModel
+from langchain_core.messages import AIMessage, HumanMessage
+from langchain_core.runnables import RunnableLambda
+from app.core.config import get_settings
+from app.services.langgraph import coaching_graph as cg
+from app.services.llm.provider import ClaudeProvider, LLMFactory
+from app.services.rag.retriever import MLBBRetriever
+
+
+@pytest.fixture
+def graph(monkeypatch):
+    """Coaching graph with fake models and retrievers; the fast model only summarizes."""
+    monkeypatch.setattr(get_settings(), "SEMANTIC_CACHE_ENABLED", False)
+    monkeypatch.setattr(LLMFactory, "get_provider", classmethod(lambda cls, provider=None: ClaudeProvider()))
+    monkeypatch.setattr(
+        LLMFactory, "get_model",
+        classmethod(lambda cls, *args, **kwargs: FakeListChatModel(responses=["real answer"])),
+    )
+    monkeypatch.setattr(
+        LLMFactory, "get_fast_model",
+        classmethod(lambda cls, *args, **kwargs: FakeListChatModel(responses=["the summary"])),
+    )
+
+    async def retrieve(self, query, k=5, namespace=None, filter=None, query_vector=None):
+        return [Document(page_content="doc")]
+
+    monkeypatch.setattr(MLBBRetriever, "aretrieve_context", retrieve)
+    g = cg.MLBBCoachingGraph()
+
+    async def embed(user_message):
+        return [1.0]
+
+    monkeypatch.setattr(g, "_embed_query", embed)
+    return g
+
+
+async def _seed(graph, thread_id, count):
+    config = {"configurable": {"thread_id": thread_id}}
+    await graph.graph.aupdate_state(
+        config,
+        {"messages": [
+            HumanMessage(content=f"question {i}") if i % 2 == 0 else AIMessage(content=f"answer {i}")
+            for i in range(count)
+        ]},
+        as_node="generate_response",
+    )
+    return config
+
+
+async def test_summary_is_not_streamed(graph):
+    config = await _seed(graph, "summarize-stream", cg.HISTORY_SUMMARY_THRESHOLD)
+
+    chunks = [c async for c in graph.stream_message("best build for jungle", session_id="summarize-stream")]
+
+    assert "".join(chunks) == "real answer"
+    state = (await graph.graph.aget_state(config)).values
+    assert state["summary"] == "the summary"
+    assert len(state["messages"]) == cg.HISTORY_KEEP_RECENT + 1
+
+
+async def test_classifier_falls_back_per_query(monkeypatch):
+    def parse(prompt):
+        query = prompt.to_messages()[-1].content
+        if query == "no tool call":
+            return None
+        if query == "bad args":
+            raise ValueError("not a label")
+        return cg.classify_intent(intent="general_chat")
+
+    class Model:
+        def with_structured_output(self, schema):
+            return RunnableLambda(parse)
+
+    monkeypatch.setattr(LLMFactory, "get_fast_model", classmethod(lambda cls, *args, **kwargs: Model()))
+    classifier = cg.BatchingClassifier(window=0.01)
+
+    intents = await asyncio.wait_for(asyncio.gather(
+        classifier.classify("no tool call"),
+        classifier.classify("bad args"),
+        classifier.classify("hello there"),
+    ), 1)
+    assert intents == ["general_strategy", "general_strategy", "general_chat"]
+
+
+class RecordingModel(FakeListChatModel):
+    """Fake model that records the messages of every call."""
+
+    calls: list = []
+
+    def _call(self, messages, stop=None, run_manager=None, **kwargs):
+        self.calls.append(messages)
+        return super()._call(messages, stop, run_manager, **kwargs)
+
+
+async def test_chat_reply_sees_summary_and_recent_history(graph, monkeypatch):
+    fast = RecordingModel(responses=["the summary", "chat reply"], calls=[])
+    monkeypatch.setattr(LLMFactory, "get_fast_model", classmethod(lambda cls, *args, **kwargs: fast))
+    config = await _seed(graph, "chat-history", cg.HISTORY_SUMMARY_THRESHOLD)
+
+    result = await graph.process_message("thanks!", session_id="chat-history")
+
+    assert result["intent"] == "general_chat"
+    assert result["response"] == "chat reply"
+    system, *history, query = fast.calls[-1]
+    assert "the summary" in system.content
+    assert [m.content for m in history] == [f"answer {i}" if i % 2 else f"question {i}" for i in range(17, 20)]
+    assert query.content == "thanks!"
+    state = (await graph.graph.aget_state(config)).values
+    assert state["summary"] == "the summary"
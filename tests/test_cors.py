@@ -0,0 +1,43 @@
+import pytest
+from httpx import AsyncClient, ASGITransport
+from app.main import app
+
+
+@pytest.fixture
+async def client():
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as ac:
+        yield ac
+
+
+@pytest.mark.asyncio
+async def test_preflight_allowed_origin(client):
+    response = await client.options("/api/v1/auth/login", headers={
+        "Origin": "http://localhost:3000",
+        "Access-Control-Request-Method": "POST",
+        "Access-Control-Request-Headers": "authorization, content-type",
+    })
+    assert response.status_code == 204
+    assert response.headers["access-control-allow-origin"] == "http://localhost:3000"
+    assert response.headers["access-control-allow-credentials"] == "true"
+    assert response.headers["access-control-allow-headers"] == "authorization, content-type"
+
+
+@pytest.mark.asyncio
+async def test_preflight_disallowed_origin(client):
+    response = await client.options("/api/v1/auth/login", headers={
+        "Origin": "http://evil.example",
+        "Access-Control-Request-Method": "POST",
+    })
+    assert response.status_code == 400
+    assert "access-control-allow-origin" not in response.headers
+
+
+@pytest.mark.asyncio
+async def test_simple_request_gets_allow_origin(client):
+    response = await client.get("/", headers={"Origin": "http://localhost:3000"})
+    assert response.status_code == 200
+    assert response.headers["access-control-allow-origin"] == "http://localhost:3000"
+
+    response = await client.get("/", headers={"Origin": "http://evil.example"})
+    assert "access-control-allow-origin" not in response.headers
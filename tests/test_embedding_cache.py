@@ -0,0 +1,35 @@
+from app.services.rag.embedding_cache import QueryCachedEmbeddings
+
+
+def test_query_embeddings_are_memoized():
+    calls = []
+
+    class Model:
+        def embed_query(self, text):
+            calls.append(text)
+            return [0.6, 0.8]
+
+    embeddings = QueryCachedEmbeddings(Model(), max_size=1)
+    first = embeddings.embed_query("layla build")
+    assert embeddings.embed_query("layla build") == first
+    assert calls == ["layla build"]
+    embeddings.embed_query("moskov")
+    assert len(embeddings) == 1
+
+
+async def test_batched_queries_only_encode_misses():
+    calls = []
+
+    class Model:
+        def embed_query(self, text):
+            return [0.6, 0.8]
+
+        async def aembed_documents(self, texts):
+            calls.append(list(texts))
+            return [[0.6, 0.8] for _ in texts]
+
+    embeddings = QueryCachedEmbeddings(Model())
+    cached = embeddings.embed_query("layla build")
+    vectors = await embeddings.aembed_queries(["layla build", "moskov"])
+    assert vectors == [cached, cached]
+    assert calls == [["moskov"]]
@@ -0,0 +1,40 @@
+from app.services.llm import provider as prov
+from app.services.llm.provider import GeminiProvider
+
+
+def _provider(monkeypatch, created, now):
+    monkeypatch.setattr(prov.time, "monotonic", lambda: now[0])
+    gemini = GeminiProvider()
+    monkeypatch.setattr(gemini, "get_model", lambda: None)
+    monkeypatch.setattr(gemini.settings, "GEMINI_CACHE_TTL_SECONDS", 3600)
+
+    def create(model, messages, ttl):
+        if not created:
+            raise RuntimeError("too small")
+        return created.pop(0)
+
+    monkeypatch.setattr(prov, "create_context_cache", create)
+    return gemini
+
+
+async def test_cache_is_recreated_before_it_expires(monkeypatch):
+    now = [1000.0]
+    gemini = _provider(monkeypatch, ["caches/a", "caches/b"], now)
+
+    assert await gemini.create_cached_system_prompt("prompt") == "caches/a"
+    now[0] += 3600 - prov.GEMINI_CACHE_RENEW_MARGIN_SECONDS - 1
+    assert await gemini.create_cached_system_prompt("prompt") == "caches/a"
+    now[0] += 1
+    assert await gemini.create_cached_system_prompt("prompt") == "caches/b"
+
+
+async def test_failed_creation_is_retried(monkeypatch):
+    now = [1000.0]
+    created = []
+    gemini = _provider(monkeypatch, created, now)
+
+    assert await gemini.create_cached_system_prompt("prompt") is None
+    created.append("caches/a")
+    assert await gemini.create_cached_system_prompt("prompt") is None
+    now[0] += prov.GEMINI_CACHE_RETRY_SECONDS
+    assert await gemini.create_cached_system_prompt("prompt") == "caches/a"
@@ -1,19 +1,168 @@
 import pytest
-from app.services.mlbb_academy.client import MLBBAcademyClient
 
 
-@pytest.mark.asyncio
-async def test_request_verification():
-    client = MLBBAcademyClient()
-    result = await client.request_verification("123456789", "5001")
-    assert result["status"] == "verification_sent"
-    assert result["game_id"] == "123456789"
-    await client.close()
+def test_facade_exports():
+    from app.services.mlbb_academy import client
 
+    assert callable(client.validate_mlbb_account)
+    assert client.get_meta_client() is client.get_meta_client()
 
-@pytest.mark.asyncio
-async def test_verify_and_login():
-    client = MLBBAcademyClient()
-    result = await client.verify_and_login("123456789", "5001", "000000")
-    assert result["status"] == "verified"
-    await client.close()
+
+def test_removed_stub_client_import_fails():
+    with pytest.raises(ImportError, match="meta_client"):
+        from app.services.mlbb_academy.client import MLBBAcademyClient  # noqa: F401
+
+
+async def test_cancelled_leader_does_not_cancel_followers():
+    import asyncio
+    from app.services.mlbb_academy.meta_client import MLBBMetaClient
+
+    meta = MLBBMetaClient()
+    release = asyncio.Event()
+    calls = []
+
+    async def fetch():
+        calls.append(1)
+        await release.wait()
+        return ["data"]
+
+    leader = asyncio.create_task(meta._coalesce("k", fetch))
+    await asyncio.sleep(0)
+    follower = asyncio.create_task(meta._coalesce("k", fetch))
+    await asyncio.sleep(0)
+    leader.cancel()
+    await asyncio.sleep(0)
+    release.set()
+
+    assert await follower == ["data"]
+    assert leader.cancelled()
+    assert len(calls) == 1
+
+
+async def test_bundle_turns_failed_parts_into_none(monkeypatch):
+    import asyncio
+    from app.services.mlbb_academy.meta_client import MLBBMetaClient
+
+    meta = MLBBMetaClient()
+
+    async def cancelled(*args, **kwargs):
+        raise asyncio.CancelledError()
+
+    async def rows(*args, **kwargs):
+        return []
+
+    monkeypatch.setattr(meta, "get_hero_rankings", rows)
+    monkeypatch.setattr(meta, "get_hero_counters", cancelled)
+    monkeypatch.setattr(meta, "get_hero_synergies", rows)
+
+    bundle = await meta.get_hero_meta_bundle(1)
+    assert bundle["counters"] is None
+    meta.format_meta_context("Layla", bundle["rankings"], bundle["counters"], bundle["synergies"])
+
+
+def test_memory_backend_evicts_lru_and_sweeps_expired(monkeypatch):
+    from app.services.mlbb_academy import cache
+
+    now = [1000.0]
+    monkeypatch.setattr(cache.time, "time", lambda: now[0])
+    backend = cache.InMemoryBackend(max_entries=2)
+    backend.set_nowait("a", 1, 10)
+    backend.set_nowait("b", 2, 100)
+    backend.get_nowait("a")  # a is now most recently used
+    backend.set_nowait("c", 3, 100)
+    assert backend.get_nowait("b") is None
+    assert backend.get_nowait("a") == 1
+
+    now[0] += 20
+    backend.set_nowait("d", 4, 100)  # sweeps the expired a
+    assert len(backend) == 2
+    assert backend.get_nowait("a") is None
+
+
+async def test_failed_lookup_is_remembered():
+    from app.services.mlbb_academy.meta_client import MLBBMetaClient
+
+    meta = MLBBMetaClient()
+    calls = []
+
+    async def fetch():
+        calls.append(1)
+        return None
+
+    assert await meta._coalesce("k", fetch) is None
+    assert await meta._coalesce("k", fetch) is None
+    assert len(calls) == 1
+
+
+class _SharedBackend:
+    """Shared cache stand-in reporting a fixed TTL for every key."""
+
+    def __init__(self, ttl):
+        self._ttl = ttl
+
+    async def get(self, key):
+        return None
+
+    async def set(self, key, value, ttl_seconds):
+        pass
+
+    async def ttl(self, key):
+        return self._ttl
+
+
+async def _warm(shared, local_ttl=None):
+    from app.services.mlbb_academy.meta_client import MLBBMetaClient
+
+    meta = MLBBMetaClient()
+    meta._shared = shared
+    calls = []
+
+    async def fetch():
+        calls.append(1)
+        return ["data"]
+
+    meta._access_counts["k"] = 1
+    meta._refreshers["k"] = fetch
+    if local_ttl is not None:
+        meta._cache.set_nowait("k", ["data"], local_ttl)
+    await meta._warm_popular()
+    return len(calls)
+
+
+async def test_warmer_refreshes_entries_about_to_expire():
+    from app.services.mlbb_academy.meta_client import WARM_INTERVAL_SECONDS
+
+    assert await _warm(None, local_ttl=60) == 1
+    assert await _warm(None, local_ttl=WARM_INTERVAL_SECONDS * 2) == 0
+
+
+async def test_warmer_judges_shared_copies_by_shared_ttl():
+    from app.services.mlbb_academy.meta_client import LOCAL_TTL_FROM_SHARED, WARM_INTERVAL_SECONDS
+
+    # A short-lived local copy of a fresh shared entry is not refetched
+    assert await _warm(_SharedBackend(WARM_INTERVAL_SECONDS * 2), LOCAL_TTL_FROM_SHARED) == 0
+    assert await _warm(_SharedBackend(30), LOCAL_TTL_FROM_SHARED) == 1
+    assert await _warm(_SharedBackend(None)) == 1
+
+
+def test_find_hero_names_matches_normalized_words():
+    from app.services.mlbb_academy.meta_client import find_hero_names
+
+    assert find_hero_names("Change vs layla, Layla's items") == ["Chang'e", "Layla"]
+    assert find_hero_names("x borg or yi sun-shin") == ["X.Borg", "Yi Sun-shin"]
+    assert find_hero_names("keep rolling, no malice") == []
+
+
+async def test_warmer_leaves_failed_lookups_alone():
+    from app.services.mlbb_academy.meta_client import MLBBMetaClient
+
+    meta = MLBBMetaClient()
+    calls = []
+
+    async def failing():
+        calls.append(1)
+        return None
+
+    assert await meta._coalesce("k", failing) is None
+    await meta._warm_popular()
+    assert len(calls) == 1
@@ -0,0 +1,74 @@
+import asyncio
+import pytest
+from langchain_core.documents import Document
+from app.services.rag.search_batcher import SearchBatcher
+from app.services.rag.search_cache import get_search_cache
+
+
+class FakeEmbeddings:
+    def __init__(self):
+        self.calls = []
+
+    async def aembed_queries(self, texts):
+        self.calls.append(list(texts))
+        return [[float(len(t))] for t in texts]
+
+
+class FakeManager:
+    def __init__(self):
+        self.embeddings = FakeEmbeddings()
+        self.searches = []
+
+    async def asimilarity_search(self, query, k, namespace=None, filter=None, query_vector=None):
+        self.searches.append((query, query_vector))
+        await asyncio.sleep(0)
+        return [Document(page_content=query)]
+
+
+async def test_concurrent_searches_share_embedding_and_lookup():
+    get_search_cache().clear()
+    manager = FakeManager()
+    batcher = SearchBatcher(manager, window_seconds=0.01)
+
+    results = await asyncio.gather(
+        batcher.search("layla build", k=5),
+        batcher.search("layla build", k=5),
+        batcher.search("miya counters", k=5),
+    )
+
+    assert [r[0].page_content for r in results] == ["layla build", "layla build", "miya counters"]
+    assert manager.embeddings.calls == [["layla build", "miya counters"]]
+    assert sorted(q for q, _ in manager.searches) == ["layla build", "miya counters"]
+
+
+async def test_search_with_vector_skips_embedding():
+    get_search_cache().clear()
+    manager = FakeManager()
+    batcher = SearchBatcher(manager)
+
+    docs = await batcher.search("granger", k=3, query_vector=[1.0])
+
+    assert docs[0].page_content == "granger"
+    assert manager.embeddings.calls == []
+    assert manager.searches == [("granger", [1.0])]
+
+
+async def test_cancelled_search_releases_its_key():
+    get_search_cache().clear()
+    manager = FakeManager()
+    started = asyncio.Event()
+
+    async def hang(**kwargs):
+        started.set()
+        await asyncio.Event().wait()
+
+    manager.asimilarity_search = hang
+    batcher = SearchBatcher(manager)
+    search = asyncio.create_task(batcher.search("granger", k=3, query_vector=[1.0]))
+    await started.wait()
+    for task in list(batcher._tasks):
+        task.cancel()
+
+    with pytest.raises(asyncio.CancelledError):
+        await asyncio.wait_for(search, 1)
+    assert batcher._in_flight == {}
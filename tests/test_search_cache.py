@@ -0,0 +1,27 @@
+from app.services.rag.search_cache import SearchResultCache
+
+
+def test_key_includes_all_arguments():
+    key = SearchResultCache.make_key("search", "layla", 5, "heroes", {"hero": "Layla"})
+    assert key == SearchResultCache.make_key("search", "layla", 5, "heroes", {"hero": "Layla"})
+    assert key != SearchResultCache.make_key("search", "layla", 3, "heroes", {"hero": "Layla"})
+
+
+def test_expired_entries_miss():
+    cache = SearchResultCache(ttl_seconds=0)
+    cache.set(b"k", ["doc"])
+    assert cache.get(b"k") is None
+
+
+def test_eviction_keeps_frequently_hit_entries():
+    cache = SearchResultCache(max_size=20)
+    for i in range(20):
+        cache.set(bytes([i]), [i])
+    cache.get(bytes([0]))
+    cache.get(bytes([0]))
+    # push 0 back to the least-recent window without losing its hit count
+    for i in range(1, 20):
+        cache.get(bytes([i]))
+    cache.set(b"new", ["new"])
+    assert cache.get(bytes([0])) == [0]
+    assert len(cache) == 20
@@ -0,0 +1,25 @@
+from app.services.langgraph.semantic_cache import SemanticCache
+
+
+def test_similar_query_hits():
+    cache = SemanticCache(threshold=0.9)
+    cache.store(("en", None), [1.0, 0.0], {"response": "cached"})
+    assert cache.lookup(("en", None), [0.99, 0.141])["response"] == "cached"
+    assert cache.lookup(("en", None), [0.0, 1.0]) is None
+
+
+def test_partition_key_is_exact():
+    cache = SemanticCache(threshold=0.9)
+    cache.store(("en", None), [1.0, 0.0], {"response": "cached"})
+    assert cache.lookup(("my", None), [1.0, 0.0]) is None
+
+
+def test_lru_eviction():
+    cache = SemanticCache(threshold=0.9, max_size=2)
+    cache.store("k", [1.0, 0.0, 0.0], {"response": "a"})
+    cache.store("k", [0.0, 1.0, 0.0], {"response": "b"})
+    cache.lookup("k", [1.0, 0.0, 0.0])  # refresh "a"
+    cache.store("k", [0.0, 0.0, 1.0], {"response": "c"})
+    assert len(cache) == 2
+    assert cache.lookup("k", [0.0, 1.0, 0.0]) is None
+    assert cache.lookup("k", [1.0, 0.0, 0.0])["response"] == "a"
@@ -0,0 +1,47 @@
+import asyncio
+import pytest
+from app.utils.streaming import coalesce
+
+
+async def _source(chunks, delay=0.0):
+    for chunk in chunks:
+        if delay:
+            await asyncio.sleep(delay)
+        yield chunk
+
+
+@pytest.mark.asyncio
+async def test_coalesce_merges_fast_chunks():
+    out = [c async for c in coalesce(_source(["a", "b", "c"]), interval=0.05)]
+    assert out == ["abc"]
+
+
+@pytest.mark.asyncio
+async def test_coalesce_flushes_slow_chunks_separately():
+    out = [c async for c in coalesce(_source(["a", "b"], delay=0.05), interval=0.01)]
+    assert out == ["a", "b"]
+
+
+@pytest.mark.asyncio
+async def test_coalesce_propagates_errors():
+    async def failing():
+        yield "a"
+        raise RuntimeError("boom")
+
+    with pytest.raises(RuntimeError):
+        async for _ in coalesce(failing(), interval=0.01):
+            pass
+
+
+@pytest.mark.asyncio
+async def test_coalesce_flushes_buffer_before_error():
+    async def failing():
+        yield "a"
+        yield "b"
+        raise RuntimeError("boom")
+
+    out = []
+    with pytest.raises(RuntimeError):
+        async for chunk in coalesce(failing(), interval=0.05):
+            out.append(chunk)
+    assert out == ["ab"]